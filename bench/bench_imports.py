@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""
+prototype::
+    date = 2026-10-19
+
+
+This script measures the time needed to import each module of ¨mistool in a
+new ¨python process, and it indicates the heavy modules loaded at start. The
+results can be stored in a ¨json file.
+
+
+terminal::
+    python bench/bench_imports.py --repeat 20 --output imports.json
+"""
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+
+# --------------- #
+# -- CONSTANTS -- #
+# --------------- #
+
+MODULES = [
+    "mistool.datetime_use",
+    "mistool.latex_use",
+    "mistool.os_use",
+    "mistool.string_use",
+    "mistool.term_use",
+    "mistool.url_use",
+]
+
+HEAVY_MODULES = [
+    "dateutil",
+    "requests",
+    "mistool.config.date_name",
+    "mistool.latex_use",
+    "subprocess",
+    "tempfile",
+]
+
+# The code launched in each new process.
+CODE = """
+import json, sys, time
+start = time.perf_counter()
+try:
+    import {0}
+    error = None
+except ImportError as e:
+    error = str(e)
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "error"  : error,
+    "loaded" : [x for x in {1!r} if x in sys.modules],
+}}))
+"""
+
+
+# ------------ #
+# -- TIMING -- #
+# ------------ #
+
+def timeimport(module, repeat):
+    """
+prototype::
+    arg = str: module ;
+          the name of the module to import
+    arg = int: repeat ;
+          the number of new processes launched
+
+    return = dict ;
+             the median and the minimum of the times in seconds, the heavy
+             modules loaded, and the message of an eventual ``ImportError``
+    """
+    runs = []
+
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", CODE.format(module, HEAVY_MODULES)],
+            env = dict(os.environ, PYTHONDONTWRITEBYTECODE = "")
+        )
+
+        infos = json.loads(output.decode('utf-8'))
+
+        runs.append(infos["seconds"])
+
+    return {
+        "median": statistics.median(runs),
+        "min"   : min(runs),
+        "loaded": infos["loaded"],
+        "error" : infos["error"],
+    }
+
+
+# ------------------ #
+# -- COMMAND LINE -- #
+# ------------------ #
+
+def main(argv = None):
+    parser = argparse.ArgumentParser(description = __doc__.split("\n\n")[1])
+
+    parser.add_argument("--repeat", type = int, default = 10)
+    parser.add_argument("--output", help = "the JSON file to write.")
+    parser.add_argument("modules", nargs = "*", default = MODULES)
+
+    params  = parser.parse_args(argv)
+    results = {}
+
+    for module in params.modules:
+        results[module] = timeimport(module, params.repeat)
+
+        print(
+            "{0:<24} {1:8.2f} ms   {2}{3}".format(
+                module,
+                1000 * results[module]["median"],
+                ", ".join(results[module]["loaded"]),
+                "" if results[module]["error"] is None else
+                "   (ImportError: {0})".format(results[module]["error"])
+            )
+        )
+
+    if params.output is not None:
+        with open(params.output, "w") as f:
+            f.write(json.dumps(results, indent = 4, sort_keys = True))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+
+"""
+prototype::
+    date = 2026-10-19
+
+
+This script times the main methods of ``os_use.PPath`` on synthetic trees, and
+also ``term_use.DirView``. The results are stored in a ¨json file so as to
+compare two versions of ¨mistool.
+
+
+Here is how to look for regressions between two versions.
+
+terminal::
+    python bench/bench_os_use.py run --output old.json
+    ... changes ...
+    python bench/bench_os_use.py run --output new.json
+    python bench/bench_os_use.py compare old.json new.json
+
+
+info::
+    The trees are built in ``/dev/shm`` if it exists, so as to measure the
+    code and not the disk.
+"""
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+from mistool import __version__
+from mistool.os_use import PPath
+from mistool.term_use import DirView
+
+# Old versions of ¨mistool, used as references, have no ``OSStats``.
+try:
+    from mistool.os_use import OSStats
+
+except ImportError:
+    OSStats = None
+
+
+# --------------- #
+# -- CONSTANTS -- #
+# --------------- #
+
+TMPFS_DIR = "/dev/shm"
+
+EXTENSIONS = [".py", ".txt", ".tex", ".md"]
+
+WALK_REGPATHS = [
+    "**",
+    "all::**",
+    "file::**.py",
+    "dir::**",
+    "file::*.py",
+    "xtra file::**.txt",
+]
+
+CLEAN_REGPATH = "file::**.txt"
+
+NB_COMMON_PAIRS = 2000
+
+
+# --------------------- #
+# -- SYNTHETIC TREES -- #
+# --------------------- #
+
+def buildtree(root, breadth, depth, files, hidden, seed):
+    """
+prototype::
+    arg = str: root ;
+          the path of the directory where to build the tree
+    arg = int: breadth ;
+          the number of sub directories in each directory
+    arg = int: depth ;
+          the number of levels of sub directories
+    arg = int: files ;
+          the number of files in each directory
+    arg = float: hidden ;
+          the probability for a file or a directory to be hidden
+    arg = int: seed ;
+          the seed of the random generator used for the names
+
+    return = int ;
+             the number of files and directories built
+    """
+    rand    = random.Random(seed)
+    nbpaths = 0
+    pending = [(root, 0)]
+
+    while pending:
+        folder, level = pending.pop()
+
+        os.makedirs(folder, exist_ok = True)
+
+        for i in range(files):
+            name = "{0}file_{1}{2}".format(
+                "." if rand.random() < hidden else "",
+                i,
+                rand.choice(EXTENSIONS)
+            )
+
+            with open(os.path.join(folder, name), "w") as f:
+                f.write(name * rand.randint(1, 20))
+
+            nbpaths += 1
+
+        if level < depth:
+            for i in range(breadth):
+                name = "{0}dir_{1}".format(
+                    "." if rand.random() < hidden else "",
+                    i
+                )
+
+                pending.append((os.path.join(folder, name), level + 1))
+
+                nbpaths += 1
+
+    return nbpaths
+
+
+# ------------ #
+# -- TIMING -- #
+# ------------ #
+
+def timeit(action, repeat, setup = None):
+    """
+prototype::
+    arg = func: action ;
+          the function to time
+    arg = int: repeat ;
+          the number of measures
+    arg = func: setup = None ;
+          ``None`` or a function called before each measure, its time is
+          not counted
+
+    return = dict ;
+             the median, the minimum and all the times in seconds
+    """
+    runs = []
+
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+
+        start = time.perf_counter()
+        action()
+        runs.append(time.perf_counter() - start)
+
+    return {
+        "median": statistics.median(runs),
+        "min"   : min(runs),
+        "runs"  : runs,
+    }
+
+
+def runbench(params):
+    """
+prototype::
+    arg = argparse.Namespace: params ;
+          the options of the command ``run``
+
+    return = dict ;
+             the metadatas and the results of the benchmarks
+    """
+    basedir = params.root
+
+    if basedir is None and os.path.isdir(TMPFS_DIR):
+        basedir = TMPFS_DIR
+
+    workdir = tempfile.mkdtemp(prefix = "mistool-bench-", dir = basedir)
+
+    try:
+        treedir = os.path.join(workdir, "tree")
+
+        nbpaths = buildtree(
+            root    = treedir,
+            breadth = params.breadth,
+            depth   = params.depth,
+            files   = params.files,
+            hidden  = params.hidden,
+            seed    = params.seed
+        )
+
+        tree    = PPath(treedir)
+        copydir = PPath(workdir) / "copy"
+        movedir = PPath(workdir) / "moved"
+        results = {}
+
+# Walks
+        for regpath in WALK_REGPATHS:
+            results["walk[{0}]".format(regpath)] = timeit(
+                action = lambda: sum(1 for _ in tree.walk(regpath)),
+                repeat = params.repeat
+            )
+
+# Old versions of ¨mistool have no ``PPath.sortedwalk``.
+        if hasattr(PPath, "sortedwalk"):
+            results["sortedwalk[**]"] = timeit(
+                action = lambda: sum(1 for _ in tree.sortedwalk()),
+                repeat = params.repeat
+            )
+
+# Common folders
+        allpaths = list(tree.walk("all::**"))
+        rand     = random.Random(params.seed)
+        pairs    = [
+            (rand.choice(allpaths), rand.choice(allpaths))
+            for _ in range(NB_COMMON_PAIRS)
+        ]
+
+        results["common_with"] = timeit(
+            action = lambda: [p.common_with(q) for p, q in pairs],
+            repeat = params.repeat
+        )
+
+# Views
+        results["dirview"] = timeit(
+            action = lambda: DirView(tree, regpath = "all::**").buildviews(),
+            repeat = params.repeat
+        )
+
+# Copy, clean and move
+        def removeall():
+            for path in [copydir, movedir]:
+                if path.is_dir():
+                    shutil.rmtree(str(path))
+
+        def copytree():
+            removeall()
+            tree.copy_to(copydir)
+
+        results["copy_to"] = timeit(
+            action = lambda: tree.copy_to(copydir),
+            setup  = removeall,
+            repeat = params.repeat
+        )
+
+        results["clean[{0}]".format(CLEAN_REGPATH)] = timeit(
+            action = lambda: copydir.clean(CLEAN_REGPATH),
+            setup  = copytree,
+            repeat = params.repeat
+        )
+
+        results["move_to"] = timeit(
+            action = lambda: copydir.move_to(movedir),
+            setup  = copytree,
+            repeat = params.repeat
+        )
+
+# Some counters for a full walk.
+        if OSStats is None:
+            walkstats = None
+
+        else:
+            with OSStats() as stats:
+                sum(1 for _ in tree.walk("all::**"))
+
+            walkstats = stats.asdict()
+
+    finally:
+        shutil.rmtree(workdir)
+
+    return {
+        "meta": {
+            "mistool" : __version__,
+            "python"  : platform.python_version(),
+            "platform": platform.platform(),
+            "tmpfs"   : basedir == TMPFS_DIR,
+            "nbpaths" : nbpaths,
+            "params"  : {
+                "breadth": params.breadth,
+                "depth"  : params.depth,
+                "files"  : params.files,
+                "hidden" : params.hidden,
+                "seed"   : params.seed,
+                "repeat" : params.repeat,
+            },
+            "walkstats": walkstats,
+        },
+        "results": results,
+    }
+
+
+# ---------------- #
+# -- COMPARISON -- #
+# ---------------- #
+
+def compare(oldpath, newpath, threshold):
+    """
+prototype::
+    arg = str: oldpath ;
+          the path of the ¨json file of reference
+    arg = str: newpath ;
+          the path of the new ¨json file
+    arg = float: threshold ;
+          the relative slowdown above which there is a regression
+
+    return = int ;
+             the number of regressions found
+    """
+    with open(oldpath) as f:
+        old = json.load(f)
+
+    with open(newpath) as f:
+        new = json.load(f)
+
+    if old["meta"]["params"] != new["meta"]["params"]:
+        print("Warning: the trees used are not the same.")
+
+    nbregressions = 0
+    names         = [x for x in new["results"] if x in old["results"]]
+    width         = max(len(x) for x in names) if names else 0
+
+    for name in names:
+        oldtime = old["results"][name]["median"]
+        newtime = new["results"][name]["median"]
+        ratio   = newtime / oldtime if oldtime else float("inf")
+
+        if ratio > 1 + threshold:
+            flag           = "  <-- REGRESSION"
+            nbregressions += 1
+
+        else:
+            flag = ""
+
+        print(
+            "{0:<{1}}  {2:10.6f}s  {3:10.6f}s  x{4:.2f}{5}".format(
+                name, width, oldtime, newtime, ratio, flag
+            )
+        )
+
+    return nbregressions
+
+
+# ------------------ #
+# -- COMMAND LINE -- #
+# ------------------ #
+
+def main(argv = None):
+    parser     = argparse.ArgumentParser(description = __doc__.split("\n\n")[1])
+    subparsers = parser.add_subparsers(dest = "command")
+    subparsers.required = True
+
+    runparser = subparsers.add_parser("run", help = "time the methods.")
+
+    runparser.add_argument("--breadth", type = int, default = 4)
+    runparser.add_argument("--depth", type = int, default = 4)
+    runparser.add_argument("--files", type = int, default = 10)
+    runparser.add_argument("--hidden", type = float, default = 0.1)
+    runparser.add_argument("--seed", type = int, default = 0)
+    runparser.add_argument("--repeat", type = int, default = 5)
+    runparser.add_argument(
+        "--root",
+        help = "where to build the trees (default: /dev/shm or the temporary "
+               "folder)."
+    )
+    runparser.add_argument("--output", help = "the JSON file to write.")
+
+    compparser = subparsers.add_parser(
+        "compare",
+        help = "compare two JSON files of results."
+    )
+
+    compparser.add_argument("old")
+    compparser.add_argument("new")
+    compparser.add_argument("--threshold", type = float, default = 0.10)
+
+    params = parser.parse_args(argv)
+
+    if params.command == "run":
+        infos = runbench(params)
+        text  = json.dumps(infos, indent = 4, sort_keys = True)
+
+        if params.output is None:
+            print(text)
+
+        else:
+            with open(params.output, "w") as f:
+                f.write(text)
+
+        return 0
+
+    nbregressions = compare(params.old, params.new, params.threshold)
+
+    return 1 if nbregressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -213,31 +213,155 @@ for onedict in [HMS, JUMP]:
                 onedict[otherlang] = onedict[lang]
 
 
+# ------------------------------- #
+# -- COMPACT NAMES BY LANGUAGE -- #
+# ------------------------------- #
+
+print('    * Building the compact names by language')
+
+FORMATS  = ["%A", "%a", "%B", "%b"]
+SIZES    = [7, 7, 12, 12]
+NAME_SEP = "|"
+
+NAMES_BY_LANG = {}
+
+for lang in LANGS_SUPPORTED:
+    names = []
+
+    for format_ in FORMATS:
+        if lang not in LANG2WORD[format_]:
+            raise ValueError(f"missing names for ``{format_}`` in ``{lang}``")
+
+        words = POINTERS[LANG2WORD[format_][lang]]
+
+        if any(NAME_SEP in x for x in words):
+            raise ValueError(f"illegal character ``{NAME_SEP}`` in ``{lang}``")
+
+        names += words
+
+    NAMES_BY_LANG[lang] = NAME_SEP.join(names)
+
+NAMES_BY_LANG = "\n".join(
+    f"    {lang!r}: {names!r},"
+    for lang, names in NAMES_BY_LANG.items()
+)
+
+
 # ---------------------------- #
 # -- UPDATE THE PYTHON FILE -- #
 # ---------------------------- #
 
 print('    * Updating the Python file')
 
+# The lists of names are only built when a language is used.
+PY_CODE = '''
+
+# --------------------------- #
+# -- LAZY LOADING OF NAMES -- #
+# --------------------------- #
+
+_NAMES = {}
+
+def names(lang, fmt):
+    """
+prototype::
+    arg = str: lang ;
+          the language in ISO format
+    arg = str: fmt in FORMATS ;
+          the format for names of days or months
+
+    return = tuple(str) ;
+             the names of the days or of the months for this language
+
+
+info::
+    The names of one language are only built at the first call using this
+    language, and they are kept in a flat dictionary using the keys
+    ``(lang, fmt)``.
+    """
+    key = lang, fmt
+
+    if key not in _NAMES:
+        if lang not in NAMES_BY_LANG:
+            raise KeyError(f"unsupported language ``{lang}``")
+
+        allnames = [
+            sys.intern(x)
+            for x in NAMES_BY_LANG[lang].split(NAME_SEP)
+        ]
+
+        start = 0
+
+        for onefmt, size in zip(FORMATS, SIZES):
+            _NAMES[lang, onefmt] = tuple(allnames[start: start + size])
+
+            start += size
+
+    return _NAMES[key]
+
+
+# ----------------------- #
+# -- OLD BIG VARIABLES -- #
+# ----------------------- #
+
+def __getattr__(name):
+    """
+This hidden function builds the old variables ``POINTERS`` and
+``FORMATS_TRANSLATIONS`` only if they are asked.
+    """
+    if name not in ["POINTERS", "FORMATS_TRANSLATIONS"]:
+        raise AttributeError(
+            f"module ``{__name__}`` has no attribute ``{name}``"
+        )
+
+    pointers     = []
+    translations = {}
+
+    for fmt in FORMATS:
+        translations[fmt] = {}
+
+        for lang in LANGS:
+            words = list(names(lang, fmt))
+
+            if words not in pointers:
+                pointers.append(words)
+
+            translations[fmt][lang] = pointers.index(words)
+
+    globals()["POINTERS"]             = pointers
+    globals()["FORMATS_TRANSLATIONS"] = translations
+
+    return globals()[name]
+'''
+
 PY_TEXT = f"""#!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
 # Note: the following ugly variables were automatically built.
 
+import sys
+
 WEEKDAYS = {WEEKDAYS_TO_INDEXES}
 
 LANGS = {LANGS_SUPPORTED}
 
-POINTERS = {POINTERS}
+FORMATS = {FORMATS}
+
+SIZES = {SIZES}
+
+NAME_SEP = {NAME_SEP!r}
 
-FORMATS_TRANSLATIONS = {LANG2WORD}
+# For each language, all the names for the formats in ``FORMATS``.
+NAMES_BY_LANG = {{
+{NAMES_BY_LANG}
+}}
 
 EXTRAS_POINTERS = {EXTRAS_POINTERS}
 
 HMS_TRANSLATIONS = {HMS}
 
 JUMP_TRANSLATIONS = {JUMP}
-"""
+""" + PY_CODE
 
 with PY_FILE.open(
     mode     = 'w',
@@ -11,12 +11,45 @@ This script tries to ease the use of dates.
 from copy import deepcopy
 from datetime import *
 
-from dateutil.parser import (
-    parse as _parsedate,
-    parserinfo as _ParserInfo
-)
 
-from mistool.config.date_name import *
+# --------------------------- #
+# -- LAZY LOADING OF NAMES -- #
+# --------------------------- #
+
+# The big tables of ``mistool.config.date_name``, and the package ``dateutil``,
+# are only imported when they are needed.
+
+_DATE_NAMES = [
+    "WEEKDAYS",
+    "LANGS",
+    "POINTERS",
+    "FORMATS_TRANSLATIONS",
+    "EXTRAS_POINTERS",
+    "HMS_TRANSLATIONS",
+    "JUMP_TRANSLATIONS",
+]
+
+def _datenames():
+    """
+This hidden function gives the module ``mistool.config.date_name`` which is
+imported at the first call.
+    """
+    from mistool.config import date_name
+
+    return date_name
+
+
+def __getattr__(name):
+    """
+This hidden function gives the names of ``mistool.config.date_name`` that were
+imported at start by the old versions of this module.
+    """
+    if name in _DATE_NAMES:
+        return getattr(_datenames(), name)
+
+    raise AttributeError(
+        "module ``{0}`` has no attribute ``{1}``".format(__name__, name)
+    )
 
 
 # --------------------------------------------------- #
@@ -31,10 +64,12 @@ This hidden function is used to build the attributs ``WEEKDAYS`` and ``MONTHS``
 of the subclasses of ``dateutil.parser.parserinfo`` used to localize the
 parsing.
     """
+    datenames = _datenames()
+
     return list(
         zip(
-            POINTERS[FORMATS_TRANSLATIONS[lowformat][lang]],
-            POINTERS[FORMATS_TRANSLATIONS[lowformat.upper()][lang]]
+            datenames.names(lang, lowformat),
+            datenames.names(lang, lowformat.upper())
         )
     )
 
@@ -43,7 +78,11 @@ def _buildnewparserinfo(lang):
 This hidden function builds a subclass of ``dateutil.parser.parserinfo`` for a
 special supported language such as to parse string as a date.
     """
-    if lang not in JUMP_TRANSLATIONS:
+    from dateutil.parser import parserinfo as _ParserInfo
+
+    datenames = _datenames()
+
+    if lang not in datenames.JUMP_TRANSLATIONS:
         raise ValueError(f"unsupported language ''{lang}''")
 
     class _NewParserInfo(_ParserInfo):
@@ -57,10 +96,10 @@ special supported language such as to parse string as a date.
             lowformat = '%b'
         )
 
-        JUMP = EXTRAS_POINTERS[JUMP_TRANSLATIONS[lang]] \
+        JUMP = datenames.EXTRAS_POINTERS[datenames.JUMP_TRANSLATIONS[lang]] \
              + [' ', '.', ',', ';', '-', '/', "'", '"']
 
-        HMS = EXTRAS_POINTERS[HMS_TRANSLATIONS[lang]]
+        HMS = datenames.EXTRAS_POINTERS[datenames.HMS_TRANSLATIONS[lang]]
 
     _PARSER_INFOS_USED[lang] = deepcopy(_NewParserInfo())
 
@@ -91,7 +130,9 @@ pyterm::
     [...]
     ValueError: unsupported language ''de_DE''
     """
-    if lang not in LANGS:
+    from dateutil.parser import parse as _parsedate
+
+    if lang not in _datenames().NAMES_BY_LANG:
         raise ValueError(
             'illegal value << {0} >> for the argument ``lang``.'.format(lang)
         )
@@ -278,10 +319,12 @@ info::
     """
         name = name.lower()
 
-        if name not in WEEKDAYS:
+        weekdays = _datenames().WEEKDAYS
+
+        if name not in weekdays:
             raise ValueError("illegal day name ``{0}``.".format(name))
 
-        daysahead = WEEKDAYS[name] - self.weekday()
+        daysahead = weekdays[name] - self.weekday()
 
         if daysahead <= 0:
             daysahead += 7
@@ -306,7 +349,9 @@ prototype::
              the date formatting by ``strftime`` but with the name translating
              regarding to the value of ``lang``
 """
-        if lang not in LANGS:
+        datenames = _datenames()
+
+        if lang not in datenames.NAMES_BY_LANG:
             raise ValueError(
                 'illegal value << {0} >> for the argument ``lang``.'.format(lang)
             )
@@ -320,9 +365,7 @@ prototype::
         ]:
             for oneformat in formats:
                 if oneformat in strformat:
-                    name = POINTERS[
-                        FORMATS_TRANSLATIONS[oneformat][lang]
-                    ][nbid]
+                    name = datenames.names(lang, oneformat)[nbid]
 
                     strformat = strformat.replace(oneformat, name)
 
@@ -13,16 +13,58 @@ There are also other small useful functions like ``runthis`` that really
 simplify the use of a command line from ¨python codes.
 """
 
+import functools
 import os
 import pathlib
-import platform
 import re
-import shlex
 import shutil
-from subprocess import (
-    check_call,
-    check_output
-)
+import sys
+import time
+
+
+# ------------------ #
+# -- LAZY IMPORTS -- #
+# ------------------ #
+
+class _LazyModule:
+    """
+prototype::
+    arg-attr = str: name ;
+               the full name of a module
+
+    action = the module is only imported the first time one of its attributes
+             is used
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        module = sys.modules.get(self.name)
+
+        if module is None:
+            __import__(self.name)
+            module = sys.modules[self.name]
+
+        return getattr(module, attr)
+
+
+# The modules only used by few functions are imported at their first use, so
+# as to import quickly this module.
+ctypes     = _LazyModule("ctypes")
+futures    = _LazyModule("concurrent.futures")
+gzip       = _LazyModule("gzip")
+hashlib    = _LazyModule("hashlib")
+heapq      = _LazyModule("heapq")
+inspect    = _LazyModule("inspect")
+json       = _LazyModule("json")
+mmap       = _LazyModule("mmap")
+platform   = _LazyModule("platform")
+shlex      = _LazyModule("shlex")
+subprocess = _LazyModule("subprocess")
+tarfile    = _LazyModule("tarfile")
+tempfile   = _LazyModule("tempfile")
+zipfile    = _LazyModule("zipfile")
 
 
 # -------------------- #
@@ -81,6 +123,35 @@ REGPATH_TO_REGEX['\\'] = "[^\\]+"
 REGPATH_TO_REGEX['/']  = "[^/]+"
 
 
+# Size of the pieces read in big files.
+CHUNK_SIZE = 1 << 20
+
+
+ALL_ARCHIVE_FORMATS = TAR_FORMAT, TAR_GZ_FORMAT, TAR_BZ2_FORMAT, \
+                      TAR_XZ_FORMAT, TAR_ZST_FORMAT, ZIP_FORMAT, \
+                      TAR_ZST_IF_AVAILABLE_FORMAT \
+                    = "tar", "tar.gz", "tar.bz2", \
+                      "tar.xz", "tar.zst", "zip", \
+                      "tar.zst-if-available"
+
+_TAR_STREAM_MODES = {
+    TAR_FORMAT    : "w|",
+    TAR_GZ_FORMAT : "w|gz",
+    TAR_BZ2_FORMAT: "w|bz2",
+    TAR_XZ_FORMAT : "w|xz",
+# The compression is done by the package ``zstandard``.
+    TAR_ZST_FORMAT: "w|",
+}
+
+# Size of the blocks compressed in parallel for the multi-member gzip files.
+GZIP_BLOCK_SIZE = 1 << 22
+
+
+_CHECKPOINT_DIR, _CHECKPOINT_REGPATH, _CHECKPOINT_PENDING, \
+_CHECKPOINT_CURRENT \
+    = "dir", "regpath", "pending", "current"
+
+
 # ------------------- #
 # -- GENERAL INFOS -- #
 # ------------------- #
@@ -116,6 +187,261 @@ prototype::
         return osname.lower()
 
 
+# --------------- #
+# -- PROFILING -- #
+# --------------- #
+
+# ``None`` means that nothing is measured.
+_STATS = None
+
+
+class OSStats:
+    """
+prototype::
+    see = PPath.walk , PPath.sortedwalk , PPath.clean , PPath.copy_to ,
+          PPath.move_to , PPath.archive , PPath.create_many
+
+    arg = func: callback = None ;
+          ``None`` or a function called with the current instance at the end
+          of the measures
+
+
+This class is a context manager that counts what is done by the main methods
+of ``PPath``. Outside of such a context, nothing is measured.
+
+pyterm::
+    >>> from mistool.os_use import OSStats, PPath
+    >>> with OSStats() as stats:
+    ...     for path in PPath("/Users/projetmbc/basic_dir").walk("file::**.py"):
+    ...         pass
+    ...
+    >>> stats.asdict()
+    {'dirs_scanned': 3, 'entries_examined': 9, 'regex_evals': 9, 'matches': 2,
+     'stat_calls': 0, 'bytes_copied': 0, 'phase_seconds': {'walk': 0.000105}}
+
+
+info::
+    The time of a phase is measured only for the outermost method, so the
+    walk done inside ``clean`` is counted as the time of ``clean``.
+
+
+warning::
+    The measures are global to the module, and not specific to one thread.
+    """
+
+    COUNTERS = [
+        ("dirs_scanned"    , "Directories scanned."),
+        ("entries_examined", "Files and directories examined."),
+        ("regex_evals"     , "Regex evaluations done on relative paths."),
+        ("matches"         , "Relative paths matching the regex."),
+        ("stat_calls"      , "Calls to os.stat."),
+        ("bytes_copied"    , "Bytes copied."),
+    ]
+
+    PROMETHEUS_PREFIX = "mistool_os_"
+
+    def __init__(self, callback = None):
+        self.callback = callback
+
+        self.reset()
+
+        self._phase    = None
+        self._previous = None
+
+    def reset(self):
+        """
+prototype::
+    action = all the counters are set to zero
+        """
+        for name, _ in self.COUNTERS:
+            setattr(self, name, 0)
+
+        self.phase_seconds = {}
+
+    def __enter__(self):
+        global _STATS
+
+        self._previous = _STATS
+        _STATS         = self
+
+        return self
+
+    def __exit__(self, etype, value, traceback):
+        global _STATS
+
+        _STATS = self._previous
+
+        if self.callback is not None:
+            self.callback(self)
+
+# -- EXPORTS -- #
+
+    def asdict(self):
+        """
+prototype::
+    return = dict ;
+             the counters and the dictionary ``phase_seconds`` giving the
+             time in seconds spent in each phase
+        """
+        infos = {
+            name: getattr(self, name)
+            for name, _ in self.COUNTERS
+        }
+
+        infos["phase_seconds"] = dict(self.phase_seconds)
+
+        return infos
+
+    def prometheus(self):
+        """
+prototype::
+    return = str ;
+             the measures in the text format of ¨prometheus
+        """
+        lines = []
+
+        for name, doc in self.COUNTERS:
+            metric = "{0}{1}_total".format(self.PROMETHEUS_PREFIX, name)
+
+            lines += [
+                "# HELP {0} {1}".format(metric, doc),
+                "# TYPE {0} counter".format(metric),
+                "{0} {1}".format(metric, getattr(self, name))
+            ]
+
+        metric = "{0}phase_seconds_total".format(self.PROMETHEUS_PREFIX)
+
+        lines += [
+            "# HELP {0} Time spent in each phase.".format(metric),
+            "# TYPE {0} counter".format(metric)
+        ]
+
+        for phase, seconds in sorted(self.phase_seconds.items()):
+            lines.append(
+                '{0}{{phase="{1}"}} {2!r}'.format(metric, phase, seconds)
+            )
+
+        return "\n".join(lines) + "\n"
+
+# -- PHASES -- #
+
+    def _addtime(self, phase, start):
+        """
+prototype::
+    arg = str: phase ;
+          the name of the phase
+    arg = float: start ;
+          the value of ``time.perf_counter()`` at the beginning of the phase
+
+    action = the time elapsed since ``start`` is added to the phase
+        """
+        self.phase_seconds[phase] = self.phase_seconds.get(phase, 0) \
+                                  + time.perf_counter() - start
+
+
+def _timed(phase):
+    """
+prototype::
+    see = OSStats
+
+    arg = str: phase ;
+          the name of the phase
+
+    return = func ;
+             a decorator measuring the time spent inside a method, or inside
+             a generator, when some measures are asked
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            stats = _STATS
+
+# A generator can be given back directly: its code is not executed yet.
+            if stats is None:
+                return method(*args, **kwargs)
+
+# ``inspect`` is only needed, and imported, when some measures are asked.
+            if _isgeneratorfunction(method):
+                return _timedgenerator(
+                    stats     = stats,
+                    phase     = phase,
+                    generator = method(*args, **kwargs)
+                )
+
+            if stats._phase is not None:
+                return method(*args, **kwargs)
+
+            stats._phase = phase
+            start        = time.perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+
+            finally:
+                stats._addtime(phase, start)
+                stats._phase = None
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize = None)
+def _isgeneratorfunction(func):
+    """
+prototype::
+    see = _timed
+
+    arg = func: func ;
+          a function
+
+    return = bool ;
+             ``True`` if ``func`` is a generator function, or ``False`` if not
+    """
+    return inspect.isgeneratorfunction(func)
+
+
+def _timedgenerator(stats, phase, generator):
+    """
+prototype::
+    see = _timed
+
+    arg = OSStats: stats ;
+          the current measures
+    arg = str: phase ;
+          the name of the phase
+    arg = generator: generator ;
+          the generator measured
+
+    yield = ? ;
+            the values of ``generator``, the time spent to compute each of
+            them being added to ``phase`` if no other phase is measured
+    """
+    try:
+        while True:
+            if stats._phase is not None:
+                value = next(generator)
+
+            else:
+                stats._phase = phase
+                start        = time.perf_counter()
+
+                try:
+                    value = next(generator)
+
+                finally:
+                    stats._addtime(phase, start)
+                    stats._phase = None
+
+            yield value
+
+    except StopIteration:
+        return
+
+    finally:
+        generator.close()
+
+
 # -------------------------------- #
 # -- CHANGING CURRENT DIRECTORY -- #
 # -------------------------------- #
@@ -812,18 +1138,18 @@ prototype::
             if self.is_file():
                 os.startfile(strpath)
             else:
-                check_call(args = ['explorer', strpath])
+                subprocess.check_call(args = ['explorer', strpath])
 
 # Mac
         elif osname == OS_MAC:
-            check_call(args = ['open', strpath])
+            subprocess.check_call(args = ['open', strpath])
 
 # Linux
 #
 # Source :
 #     * http://forum.ubuntu-fr.org/viewtopic.php?pid=3952590#p3952590
         elif osname == OS_LINUX:
-            check_call(args = ['xdg-open', strpath])
+            subprocess.check_call(args = ['xdg-open', strpath])
 
 # Unknown method...
         else:
@@ -835,13 +1161,27 @@ prototype::
                 )
             )
 
-    def walk(self, regpath = "**"):
+    @_timed("walk")
+    def walk(
+        self,
+        regpath     = "**",
+        followlinks = False,
+        samefs      = False
+    ):
         """
 prototype::
     see = regpath2meta
 
     arg = str: regpath = "**" ;
           this is a string that follows some rules named regpath rules
+    arg = bool: followlinks = False ;
+          ``followlinks = True`` asks to also walk inside the directories
+          pointed by symbolic links (each real directory is visited only one
+          time so the cycles made by links are not a problem)
+    arg = bool: samefs = False ;
+          ``samefs = True`` asks to not go inside directories that are on
+          another file system than the one of the current path (this is like
+          the option term::``-xdev`` of term::``find``)
 
     yield = PPath;
             the ``PPath`` are absolute paths of files and directories matching
@@ -962,6 +1302,18 @@ info::
         * ``FILE_OTHERS_TAG``
         * ``DIR_TAG``
         * ``DIR_OTHERS_TAG``
+
+
+info::
+    With ``followlinks = True``, a directory already visited, directly or
+    through another symbolic link, is yielded but not walked again. The real
+    directories are identified by their couples ``(st_dev, st_ino)``.
+
+
+info::
+    The arguments ``followlinks`` and ``samefs`` are the only ones that need
+    to call ``os.stat`` on each sub directory found. Their default values do
+    not add any call to ``os.stat``.
         """
 # Do we have an existing directory ?
         if not self.is_dir():
@@ -971,358 +1323,2029 @@ info::
             )
 
 # Metadatas and the normal regex
-        queries, pattern = regpath2meta(
-            regpath = regpath,
-            sep     = self._flavour.sep
-        )
-
+        metas   = self._walkmetas(regpath)
         maindir = str(self)
 
-        notkeepdir  = DIR_TAG not in queries
-        notkeepfile = FILE_TAG not in queries
-        notkeepall  = ALL_DISPLAY not in queries
-        addextra    = XTRA_DISPLAY in queries
-
-        regex_obj = re.compile(pattern)
+# Symbolic links and file systems need to know where we are.
+        checkdirs = followlinks or samefs
 
-# Matching or non-matching, that is the question !
-        if NOT_QUERY in queries:
-            match = lambda x: not regex_obj.match(x)
+        if checkdirs:
+            mainstat = os.stat(maindir)
+            maindev  = mainstat.st_dev
+            visited  = set([(mainstat.st_dev, mainstat.st_ino)])
 
-        else:
-            match = lambda x: regex_obj.match(x)
+            if _STATS is not None:
+                _STATS.stat_calls += 1
 
 # Let's walk
-        for root, dirs, files in os.walk(maindir):
-# The matching paths
-            for tag, strpaths in [
-                (FILE_TAG, files),
-                (DIR_TAG,  dirs)
-            ]:
-                if tag == FILE_TAG and notkeepfile:
-                    continue
+        for root, dirs, files in os.walk(
+            maindir,
+            followlinks = followlinks
+        ):
+# We keep all the directories found but ``os.walk`` will only go inside the
+# good ones.
+            alldirs = dirs
+
+            if checkdirs:
+                alldirs = dirs[:]
+                dirs[:] = []
+
+                if _STATS is not None:
+                    _STATS.stat_calls += len(alldirs)
+
+                for strpath in alldirs:
+                    try:
+                        dirstat = os.stat(os.path.join(root, strpath))
+
+                    except OSError:
+                        continue
 
-                if tag == DIR_TAG and notkeepdir:
-                    continue
+                    if samefs and dirstat.st_dev != maindev:
+                        continue
 
-                nomatchingfiles_found = False
+                    if followlinks:
+                        dirid = (dirstat.st_dev, dirstat.st_ino)
 
-                for strpath in strpaths:
-                    if strpath.startswith('.') and notkeepall:
-                        continue
+                        if dirid in visited:
+                            continue
 
-                    absppath = os.path.join(root, strpath)
-                    absppath = PPath(absppath)
+                        visited.add(dirid)
 
-                    absppath._tag = tag
+                    dirs.append(strpath)
 
-                    strrelpath = str(absppath.relative_to(self))
+# The matching paths
+            yield from self._walkinroot(root, files, alldirs, metas)
+
+    @_timed("walk")
+    def sortedwalk(
+        self,
+        regpath    = "**",
+        checkpoint = None,
+        every      = 1000
+    ):
+        """
+prototype::
+    see = self.walk , regpath2meta
 
-                    if match(strrelpath):
-                        yield absppath
+    arg = str: regpath = "**" ;
+          this is a string that follows some rules named regpath rules
+    arg = None , PPath: checkpoint = None ;
+          ``checkpoint = None`` asks to not use any checkpoint, otherwise this
+          is the path of a file used to store where the walk is, and if this
+          file exists, the walk restarts from the state stored in it
+    arg = int: every = 1000 ;
+          the minimal number of paths found between two updates of the file
+          ``checkpoint``
 
-                    elif tag == FILE_TAG:
-                        nomatchingfiles_found = True
+    yield = PPath;
+            the same ``PPath`` as the ones yield by ``self.walk`` but each
+            folder has its files and its sub folders sorted alphabetically
 
-                    else:
-                        absppath._tag = DIR_OTHERS_TAG
 
-                        yield absppath
+This method is useful for very long walks that can be interrupted. With the
+argument ``checkpoint``, the walk regularly stores the stack of the folders
+that have not been yet analyzed, and the number of paths already given for the
+current folder. A new call to ``sortedwalk`` using the same file goes on from
+the last state stored, even inside a very big folder.
 
-# No matching files founds
-                if addextra and nomatchingfiles_found:
-                    absppath = os.path.join(root, FILE_DIR_OTHERS_NAME)
-                    absppath = PPath(absppath)
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> folder     = PPath("/Users/projetmbc/archive")
+    >>> checkpoint = PPath("/Users/projetmbc/archive.walk.json")
+    >>> for p in folder.sortedwalk("file::**.pdf", checkpoint):
+    ...     print("+", p)
 
-                    absppath._tag = FILE_OTHERS_TAG
 
-                    yield absppath
+info::
+    Because the content of each folder is sorted, a resumed walk and an
+    uninterrupted one give the same paths if the folders have not changed.
+    The paths found after the last update of the file ``checkpoint``, that
+    is at most ``every`` paths, are yield again after a restart.
 
-# -- CREATE -- #
 
-    def create(self, kind):
+info::
+    The file ``checkpoint`` is updated just before giving a path, and it is
+    removed when the walk is finished. An error is raised if this file was
+    made with another folder or another regpath.
+
+
+warning::
+    Like ``self.walk`` with its default settings, this method does not go
+    inside the directories pointed by symbolic links.
         """
-prototype::
-    arg = str: kind in [FILE_TAG, DIR_TAG]
+# Do we have an existing directory ?
+        if not self.is_dir():
+            raise NotADirectoryError(
+                "the following path doesn't point to a directory :"
+                "\n    + {0}".format(self)
+            )
 
-    action = this method creates the file or the directory having the current
-             path except if this path points to an existing directory or file
-             respectively.
+# Metadatas and the normal regex
+        metas   = self._walkmetas(regpath)
+        maindir = str(self)
 
+# Stack of the relative paths of the folders to analyze : the last one is the
+# next one.
+        if checkpoint is not None and checkpoint.is_file():
+            with checkpoint.open(
+                mode     = 'r',
+                encoding = 'utf-8'
+            ) as f:
+                state = json.load(f)
+
+            if state.get(_CHECKPOINT_DIR) != maindir \
+            or state.get(_CHECKPOINT_REGPATH) != regpath:
+                raise ValueError(
+                    "the checkpoint has been made with another folder or "
+                    "another regpath :\n    + {0}".format(checkpoint)
+                )
 
-Here is an example of creations relatively to a current directory having path
-path::``/Users/projetmbc``, and containing no subfolder (you can see that some
-exceptions can be raised).
+            pending = state[_CHECKPOINT_PENDING]
+            current = state.get(_CHECKPOINT_CURRENT)
 
-pyterm::
-    >>> from mistool.os_use import PPath
-    >>> path_1 = PPath("test/README")
-    >>> path.is_file()
-    False
-    >>> path_1.create("file")
-    >>> path.is_file()
-    True
-    >>> path_2 = PPath("test/README")
-    >>> path_2.create("dir")
-    Traceback (most recent call last):
-    [...]
-    ValueError: path points to an existing file.
+        else:
+            pending = [""]
+            current = None
 
+# The folder where the walk has been stopped is analyzed first, the paths
+# already given being skipped.
+        if current is None:
+            skip = 0
 
-info::
-    All the parent directories that don't yet exist are automatically created.
-        """
-# Good kind.
-        kind = LONG_REGPATH_QUERIES.get(kind, kind)
+        else:
+            reldir, skip = current
+            pending.append(reldir)
 
-        if kind not in FILE_DIR_QUERY:
-            raise ValueError("illegal kind.")
+        nbfound  = 0
+        lastsave = 0
 
-# A new directory.
-        if kind == DIR_TAG:
-            if self.is_file():
-                raise FileExistsError("path points to an existing file.")
+# Let's walk
+        while pending:
+            reldir = pending.pop()
+            root   = os.path.join(maindir, reldir) if reldir else maindir
 
-            elif not self.is_dir():
-                self.mkdir(parents = True)
+            nbskip, skip = skip, 0
 
-# A new file.
-        elif self.is_dir():
-            raise IsADirectoryError("path points to an existing directory.")
+            files   = []
+            dirs    = []
+            subdirs = []
 
-        elif not self.is_file():
-            parent = self.parent
+# Like ``os.walk``, we forget the folders we can't read.
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        try:
+                            isdir = entry.is_dir()
 
-            if not parent.is_dir():
-                parent.mkdir(parents = True)
+                        except OSError:
+                            isdir = False
 
-            with self.open(mode = "w") as f:
-                ...
+                        if isdir:
+                            dirs.append(entry.name)
 
-# -- REMOVE -- #
+                            if not entry.is_symlink():
+                                subdirs.append(entry.name)
 
-    def can_be_removed(self, safemode = True):
-        """
-prototype::
-    arg = bool: safemode = True ;
-          using ``safemode = True`` protects any existing file or directory
-          whereas ``safemode = True`` makes any file or directory removable
+                        else:
+                            files.append(entry.name)
 
-    action = if the file or the directory can't be removed regarding to the
-    value of ``safemode``, an OS error is raised.
-        """
-        if safemode:
-            if self.is_file():
-                raise FileExistsError(
-                    "existing file can't be removed with ``safemode = True`` "
-                    "(use ``safemode = False`` to force the erasing)"
-                )
+            except OSError:
+                continue
 
-            elif self.is_dir():
-                raise IsADirectoryError(
-                    "existing folder can't be removed with ``safemode = True`` "
-                    "(use ``safemode = False`` to force the erasing)"
-                )
+            files.sort()
+            dirs.sort()
+            subdirs.sort(reverse = True)
 
-    def remove(self):
-        """
-prototype::
-    see = self.can_be_removed
+            for nb, ppath in enumerate(
+                self._walkinroot(root, files, dirs, metas)
+            ):
+                if nb < nbskip:
+                    continue
 
-    action = this method removes the directory or the file corresponding to
-             the current path
+                if checkpoint is not None and nbfound - lastsave >= every:
+                    self._savecheckpoint(
+                        checkpoint = checkpoint,
+                        regpath    = regpath,
+                        pending    = pending,
+                        current    = [reldir, nb]
+                    )
+                    lastsave = nbfound
 
+                nbfound += 1
 
-warning::
-    Removing a directory will destroy anything within it using a recursive
-    destruction of all subfolders and subfiles.
-        """
-        if self.is_dir():
-            shutil.rmtree(str(self))
+                yield ppath
 
-        elif self.is_file():
-            self.unlink()
+            pending += [os.path.join(reldir, x) for x in subdirs]
 
-        else:
-            raise FileNotFoundError(
-                "the following path points nowhere :"
-                "\n    + {0}".format(self)
-            )
+# The job is done.
+        if checkpoint is not None and checkpoint.is_file():
+            checkpoint.unlink()
 
-    def clean(self, regpath):
+    def _savecheckpoint(
+        self,
+        checkpoint,
+        regpath,
+        pending,
+        current
+    ):
         """
 prototype::
-    see = regpath2meta
+    see = self.sortedwalk
+
+    arg = PPath: checkpoint ;
+          the path of the file storing the state of the walk
+    arg = str: regpath ;
+          the regpath used for the walk
+    arg = list(str): pending ;
+          the stack of the relative paths of the folders not yet analyzed
+    arg = [str, int]: current ;
+          the relative path of the folder analyzed, and the number of paths
+          already given for this folder
+
+    action = this method updates atomically the file ``checkpoint``
+        """
+        checkpoint.write_atomic(
+            json.dumps({
+                _CHECKPOINT_DIR    : str(self),
+                _CHECKPOINT_REGPATH: regpath,
+                _CHECKPOINT_PENDING: pending,
+                _CHECKPOINT_CURRENT: current
+            })
+        )
+
+    def _walkmetas(self, regpath):
+        """
+prototype::
+    see = self.walk , regpath2meta
 
     arg = str: regpath ;
           this is a string that follows some rules named regpath rules
 
-    action = every files and directories matching ``regpath`` are removed
+    return = (bool, bool, bool, bool, func) ;
+             the flags ``(notkeepfile, notkeepdir, notkeepall, addextra)``
+             and the function ``match`` used to test the relative paths
         """
-# We have to play with the queries and the pattern in ``regpath``.
         queries, pattern = regpath2meta(
             regpath = regpath,
-            sep     = self._flavour.sep,
-            regexit = False)
+            sep     = self._flavour.sep
+        )
 
-        if ALL_DISPLAY in queries:
-            prefix = ALL_DISPLAY
+        notkeepdir  = DIR_TAG not in queries
+        notkeepfile = FILE_TAG not in queries
+        notkeepall  = ALL_DISPLAY not in queries
+        addextra    = XTRA_DISPLAY in queries
+
+        regex_obj = re.compile(pattern)
+
+# Matching or non-matching, that is the question !
+        if NOT_QUERY in queries:
+            match = lambda x: not regex_obj.match(x)
 
         else:
-            prefix = ""
+            match = lambda x: regex_obj.match(x)
 
-# We must first remove the files. This is in case of folders to destroy.
-        if FILE_TAG in queries:
-            filepattern = "{0} file::{1}".format(prefix, pattern)
+# Some measures are asked.
+        stats = _STATS
 
-            for path in self.walk(filepattern):
-                path.remove()
+        if stats is not None:
+            rawmatch = match
 
-# Now, we can destroy folders but we can use an iterator (because of sub
-# directories).
-        if DIR_TAG in queries:
-            dirpattern = "{0} dir::{1}".format(prefix, pattern)
+            def match(x):
+                stats.regex_evals += 1
 
-# << Warning ! >> We have to be carefull with directories and sub folders.
-            sortedpaths = sorted(list(p for p in self.walk(dirpattern)))
+                if rawmatch(x):
+                    stats.matches += 1
+                    return True
 
-# << Warning ! >> We have to be carefull with empty directories.
-            for path in sortedpaths:
-                path.remove()
+                return False
 
-# -- MOVE & COPY -- #
+        return notkeepfile, notkeepdir, notkeepall, addextra, match
 
-    def copy_to(self, dest, safemode = True):
+    def _walkinroot(self, root, files, dirs, metas):
         """
 prototype::
-    arg = PPath: dest
-    arg = bool: safemode = True;
-          this argument is a security to avoid the erasing of an existing file
-          or directory. This allows the savy developer to erase file or
-          directory during a copy by using ``safemode = False``
+    see = self.walk , self._walkmetas
 
-    action = if the current ``PPath`` is an existing file or directory, the
-             method will copy it to the destination given by the argument
-             ``path``
+    arg = str: root ;
+          the path of the folder analyzed
+    arg = list(str): files ;
+          the names of the files directly inside ``root``
+    arg = list(str): dirs ;
+          the names of the folders directly inside ``root``
+    arg = (bool, bool, bool, bool, func): metas ;
+          the infos given by ``self._walkmetas``
+
+    yield = PPath;
+            the paths found in ``root`` with their hidden attribut ``_tag``
+        """
+        notkeepfile, notkeepdir, notkeepall, addextra, match = metas
 
+        if _STATS is not None:
+            _STATS.dirs_scanned     += 1
+            _STATS.entries_examined += len(files) + len(dirs)
 
-warning::
-     The use of ``safemode = False`` will erase **everything** at the
-     destination path.
-     """
-# Is the copy allowed ?
-        dest.can_be_removed(safemode)
+        for tag, strpaths in [
+            (FILE_TAG, files),
+            (DIR_TAG,  dirs)
+        ]:
+            if tag == FILE_TAG and notkeepfile:
+                continue
 
-# We have to use a clean way !
-        try:
-# Copy of a file.
-            if self.is_file():
-                dest.parent.create(DIR_TAG)
+            if tag == DIR_TAG and notkeepdir:
+                continue
 
-                shutil.copy(str(self), str(dest))
+            nomatchingfiles_found = False
 
-# Copy of a directory.
-#
-# WARNING !!! We can't call the method ``create`` during the recursive walk !
-            elif self.is_dir():
-                if self == self & dest:
-                    oserror = True
+            for strpath in strpaths:
+                if strpath.startswith('.') and notkeepall:
+                    continue
 
-                    raise OSError(
-                        "copy of a directory inside one of its sub directory "
-                        "is not supported (be aware of recursive copying)"
-                    )
+                absppath = os.path.join(root, strpath)
+                absppath = PPath(absppath)
 
-                dest.parent.create(DIR_TAG)
+                absppath._tag = tag
 
-                for onepath in self.walk():
-                    relpath  = onepath - self
-                    destpath = dest / relpath
+                strrelpath = str(absppath.relative_to(self))
 
-                    if onepath.is_file():
-                        onepath.copy_to(
-                            dest     = destpath,
-                            safemode = safemode
-                        )
+                if match(strrelpath):
+                    yield absppath
 
-                    elif onepath.is_empty():
-                        destpath.create(DIR_TAG)
+                elif tag == FILE_TAG:
+                    nomatchingfiles_found = True
 
-# Path points nowhere !
-            else:
-                oserror = False
+                else:
+                    absppath._tag = DIR_OTHERS_TAG
 
-                raise FileNotFoundError(
-                    "the following path points nowhere:"
-                    "\n    + {0}".format(self)
-                )
+                    yield absppath
 
-# Erase anything in case of any OS problem...
-        except (OSError, FileNotFoundError) as e:
-            if dest.is_file() or dest.is_dir():
-                dest.remove()
+# No matching files founds
+            if addextra and nomatchingfiles_found:
+                absppath = os.path.join(root, FILE_DIR_OTHERS_NAME)
+                absppath = PPath(absppath)
 
-            if oserror:
-                raise OSError(e)
+                absppath._tag = FILE_OTHERS_TAG
 
-            else:
-                raise FileNotFoundError(e)
+                yield absppath
 
-    def move_to(self, dest, safemode = True):
+# -- READ -- #
+
+    def iter_chunks(self, size = CHUNK_SIZE):
         """
 prototype::
-    arg = PPath: dest
-    arg = bool: safemode = True;
-          this argument is a security to avoid the erasing of an existing file
-          or directory. This allows the savvy developer to erase file or
-          directory during a move by using ``safemode = False``
+    see = self.iter_lines , self.mmap
 
-    action = this method moves the current file to the destination given by
-             the argument ``path``
+    arg = int: size = CHUNK_SIZE ;
+          the maximal number of bytes of each piece of the file
+
+    yield = bytes ;
+            the successive pieces of the file
+
+
+Here is how to count the number of bytes of a big file without loading it in
+memory.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> bigfile = PPath("/Users/projetmbc/huge.log")
+    >>> print(sum(len(chunk) for chunk in bigfile.iter_chunks()))
+    8589934592
+        """
+        with self.open(mode = 'rb') as f:
+            while True:
+                chunk = f.read(size)
+
+                if not chunk:
+                    break
+
+                yield chunk
+
+    def iter_lines(
+        self,
+        encoding = "utf-8",
+        buffer   = -1
+    ):
+        """
+prototype::
+    see = self.iter_chunks , self.mmap
+
+    arg = str: encoding = "utf-8" ;
+          the encoding of the file
+    arg = int: buffer = -1 ;
+          the size in bytes of the buffer used to read the file, ``-1``
+          asking to use the default size of ¨python
+
+    yield = str ;
+            the successive lines of the file with their ending new line
+            character
 
 
 info::
-    If the source and the destination have the same parent directory, then the
-    final result will be at the end a renaming of the file or the directory.
+    Only one line, and the buffer, are in memory at the same time.
+        """
+        with self.open(
+            mode      = 'r',
+            encoding  = encoding,
+            buffering = buffer
+        ) as f:
+            yield from f
+
+    def mmap(self):
+        """
+prototype::
+    see = self.iter_chunks , self.iter_lines
 
+    return = memoryview ;
+             a read-only view of the content of the file that is not loaded
+             in memory (the OS reads the parts of the file that are used)
 
-warning::
-    The use of ``safemode = False`` will erase **everything** at the destination
-    path.
+
+The view can be sliced without any copy, and the bytes-like objects can be
+searched directly. Here is an example.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> view = PPath("/Users/projetmbc/huge.log").mmap()
+    >>> print(view.obj.find(b"ERROR"))
+    1073741951
+    >>> print(bytes(view[1073741951:1073741961]))
+    b'ERROR: bad'
+
+
+info::
+    The file can be closed just after the mapping, but the mapping itself is
+    kept alive by the view. Use ``view.release()`` and then ``view.obj.close()``
+    to free it as soon as possible.
+
+
+info::
+    An empty file gives an empty view because ``mmap`` can't map empty files.
         """
-# Moving a file...
-        if self.is_file():
-            self.copy_to(
-                dest     = dest,
-                safemode = safemode
-            )
+        with self.open(mode = 'rb') as f:
+            if not os.fstat(f.fileno()).st_size:
+                return memoryview(b"")
 
-# Let's be cautious...
-            if dest.is_file():
-                self.remove()
+            mapped = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
 
-            else:
-                raise OSError("moving the file has failed.")
+        return memoryview(mapped)
 
-# Moving a directory...
-        elif self.is_dir():
-            self.copy_to(
-                dest     = dest,
-                safemode = safemode
-            )
+# -- WRITE -- #
 
-# Let's be cautious...
-            if dest.is_dir():
-                self.remove()
+    def write_atomic(
+        self,
+        data,
+        encoding = "utf-8",
+        fsync    = True
+    ):
+        """
+prototype::
+    see = self.atomic_batch
 
-            else:
-                raise OSError("moving the diretory has failed.")
+    arg = str , bytes: data ;
+          the content of the file
+    arg = str: encoding = "utf-8" ;
+          the encoding used if ``data`` is a string
+    arg = bool: fsync = True ;
+          ``fsync = True`` asks to wait that the content and the renaming are
+          really written on the disk
 
-        else:
-            raise FileNotFoundError(
-                "the following path points nowhere."
-                "\n    + {0}".format(self)
-            )
+    action = the content is written in a temporary file of the same directory
+             which is then renamed, so the file has always either its old
+             content or the new one, even after a crash
+
+
+info::
+    The parent directory must exist like for the method ``write_text`` of
+    ``pathlib.Path``.
+
+
+info::
+    The permissions of an existing file are kept, and a new file has the
+    permissions given by ``open``. If the path is a symbolic link, the file
+    pointed is replaced and the link is kept.
+        """
+        tmppath, strpath = _writetmp(
+            strpath  = str(self),
+            data     = data,
+            encoding = encoding,
+            fsync    = fsync
+        )
+
+        try:
+            os.replace(tmppath, strpath)
+
+        except BaseException:
+            os.remove(tmppath)
+            raise
+
+        if fsync:
+            _fsyncdir(os.path.dirname(strpath))
+
+    @staticmethod
+    def atomic_batch():
+        """
+prototype::
+    see = AtomicBatch , self.write_atomic
+
+    return = AtomicBatch ;
+             a context manager to write atomically a lot of files but with
+             only one synchronization with the disk for all of them
+
+
+Here is a typical use. The files are really updated only when the context is
+closed without error. If an error occurs, none of the files is changed.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> folder = PPath("/Users/projetmbc/outputs")
+    >>> with PPath.atomic_batch() as batch:
+    ...     for i in range(1000):
+    ...         batch.write(folder / "out_{0}.txt".format(i), str(i))
+        """
+        return AtomicBatch()
+
+# -- CREATE -- #
+
+    def create(self, kind):
+        """
+prototype::
+    arg = str: kind in [FILE_TAG, DIR_TAG]
+
+    action = this method creates the file or the directory having the current
+             path except if this path points to an existing directory or file
+             respectively.
+
+
+Here is an example of creations relatively to a current directory having path
+path::``/Users/projetmbc``, and containing no subfolder (you can see that some
+exceptions can be raised).
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> path_1 = PPath("test/README")
+    >>> path.is_file()
+    False
+    >>> path_1.create("file")
+    >>> path.is_file()
+    True
+    >>> path_2 = PPath("test/README")
+    >>> path_2.create("dir")
+    Traceback (most recent call last):
+    [...]
+    ValueError: path points to an existing file.
+
+
+info::
+    All the parent directories that don't yet exist are automatically created.
+        """
+# Good kind.
+        kind = LONG_REGPATH_QUERIES.get(kind, kind)
+
+        if kind not in FILE_DIR_QUERY:
+            raise ValueError("illegal kind.")
+
+# A new directory.
+        if kind == DIR_TAG:
+            if self.is_file():
+                raise FileExistsError("path points to an existing file.")
+
+            elif not self.is_dir():
+                self.mkdir(parents = True)
+
+# A new file.
+        elif self.is_dir():
+            raise IsADirectoryError("path points to an existing directory.")
+
+        elif not self.is_file():
+            parent = self.parent
+
+            if not parent.is_dir():
+                parent.mkdir(parents = True)
+
+            with self.open(mode = "w") as f:
+                ...
+
+    @classmethod
+    @_timed("create")
+    def create_many(cls, paths, kind, workers = 1):
+        """
+prototype::
+    see = self.create
+
+    arg = list(PPath): paths ;
+          the paths of the files or the directories to create
+    arg = str: kind in [FILE_TAG, DIR_TAG]
+    arg = int: workers = 1 ;
+          the number of threads used to create the files (this has no effect
+          for directories)
+
+    action = this method creates all the files or all the directories given
+             in ``paths`` like the method ``create`` does it for one single
+             path, but the parent directories are created only one time
+
+
+Here is how to build a small tree of empty files. You can see that there is no
+need to create first the folders.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> main  = PPath("/Users/projetmbc/fixture")
+    >>> paths = [
+    ...     main / "dir_{0}".format(i) / "file_{0}.txt".format(j)
+    ...     for i in range(100)
+    ...     for j in range(1000)
+    ... ]
+    >>> PPath.create_many(paths, "file")
+
+
+info::
+    The paths are sorted, and the directories already known to exist, or just
+    created, are stored so as to not test or create them several times.
+
+
+info::
+    An existing file is never emptied, and an error is raised if one path
+    points to an existing directory for ``kind = "file"``, or to an existing
+    file for ``kind = "dir"``.
+        """
+# Good kind.
+        kind = LONG_REGPATH_QUERIES.get(kind, kind)
+
+        if kind not in FILE_DIR_QUERY:
+            raise ValueError("illegal kind.")
+
+        strpaths = sorted(set(str(p) for p in paths))
+        dirsdone = set()
+
+        for strpath in strpaths:
+            if kind == DIR_TAG:
+                strdir = strpath
+
+            else:
+                strdir = os.path.dirname(strpath)
+
+            if not strdir or strdir in dirsdone:
+                continue
+
+# ``os.makedirs`` complains if one path points to an existing file.
+            try:
+                os.makedirs(strdir, exist_ok = True)
+
+            except FileExistsError:
+                raise FileExistsError(
+                    "the following path points to an existing file :"
+                    "\n    + {0}".format(strdir)
+                )
+
+            while strdir and strdir not in dirsdone:
+                dirsdone.add(strdir)
+                strdir = os.path.dirname(strdir)
+
+# New files.
+        if kind == FILE_TAG:
+            if workers > 1:
+                with futures.ThreadPoolExecutor(
+                    max_workers = workers
+                ) as executor:
+                    list(executor.map(_touch, strpaths))
+
+            else:
+                for strpath in strpaths:
+                    _touch(strpath)
+
+# -- REMOVE -- #
+
+    def can_be_removed(self, safemode = True):
+        """
+prototype::
+    arg = bool: safemode = True ;
+          using ``safemode = True`` protects any existing file or directory
+          whereas ``safemode = True`` makes any file or directory removable
+
+    action = if the file or the directory can't be removed regarding to the
+    value of ``safemode``, an OS error is raised.
+        """
+        if safemode:
+            if self.is_file():
+                raise FileExistsError(
+                    "existing file can't be removed with ``safemode = True`` "
+                    "(use ``safemode = False`` to force the erasing)"
+                )
+
+            elif self.is_dir():
+                raise IsADirectoryError(
+                    "existing folder can't be removed with ``safemode = True`` "
+                    "(use ``safemode = False`` to force the erasing)"
+                )
+
+    def remove(self):
+        """
+prototype::
+    see = self.can_be_removed
+
+    action = this method removes the directory or the file corresponding to
+             the current path
+
+
+warning::
+    Removing a directory will destroy anything within it using a recursive
+    destruction of all subfolders and subfiles.
+        """
+        if self.is_dir():
+            shutil.rmtree(str(self))
+
+        elif self.is_file():
+            self.unlink()
+
+        else:
+            raise FileNotFoundError(
+                "the following path points nowhere :"
+                "\n    + {0}".format(self)
+            )
+
+    @_timed("clean")
+    def clean(self, regpath):
+        """
+prototype::
+    see = regpath2meta
+
+    arg = str: regpath ;
+          this is a string that follows some rules named regpath rules
+
+    action = every files and directories matching ``regpath`` are removed
+        """
+# We have to play with the queries and the pattern in ``regpath``.
+        queries, pattern = regpath2meta(
+            regpath = regpath,
+            sep     = self._flavour.sep,
+            regexit = False)
+
+        if ALL_DISPLAY in queries:
+            prefix = ALL_DISPLAY
+
+        else:
+            prefix = ""
+
+# We must first remove the files. This is in case of folders to destroy.
+        if FILE_TAG in queries:
+            filepattern = "{0} file::{1}".format(prefix, pattern)
+
+            for path in self.walk(filepattern):
+                path.remove()
+
+# Now, we can destroy folders but we can use an iterator (because of sub
+# directories).
+        if DIR_TAG in queries:
+            dirpattern = "{0} dir::{1}".format(prefix, pattern)
+
+# << Warning ! >> We have to be carefull with directories and sub folders.
+            sortedpaths = sorted(list(p for p in self.walk(dirpattern)))
+
+# << Warning ! >> We have to be carefull with empty directories.
+            for path in sortedpaths:
+                path.remove()
+
+# -- MOVE & COPY -- #
+
+    @_timed("copy")
+    def copy_to(self, dest, safemode = True):
+        """
+prototype::
+    arg = PPath: dest
+    arg = bool: safemode = True;
+          this argument is a security to avoid the erasing of an existing file
+          or directory. This allows the savy developer to erase file or
+          directory during a copy by using ``safemode = False``
+
+    action = if the current ``PPath`` is an existing file or directory, the
+             method will copy it to the destination given by the argument
+             ``path``
+
+
+warning::
+     The use of ``safemode = False`` will erase **everything** at the
+     destination path.
+     """
+# Is the copy allowed ?
+        dest.can_be_removed(safemode)
+
+# We have to use a clean way !
+        try:
+# Copy of a file.
+            if self.is_file():
+                dest.parent.create(DIR_TAG)
+
+                shutil.copy(str(self), str(dest))
+
+                if _STATS is not None:
+                    _STATS.bytes_copied += os.path.getsize(str(dest))
+
+# Copy of a directory.
+#
+# WARNING !!! We can't call the method ``create`` during the recursive walk !
+            elif self.is_dir():
+                if self == self & dest:
+                    oserror = True
+
+                    raise OSError(
+                        "copy of a directory inside one of its sub directory "
+                        "is not supported (be aware of recursive copying)"
+                    )
+
+                dest.parent.create(DIR_TAG)
+
+                for onepath in self.walk():
+                    relpath  = onepath - self
+                    destpath = dest / relpath
+
+                    if onepath.is_file():
+                        onepath.copy_to(
+                            dest     = destpath,
+                            safemode = safemode
+                        )
+
+                    elif onepath.is_empty():
+                        destpath.create(DIR_TAG)
+
+# Path points nowhere !
+            else:
+                oserror = False
+
+                raise FileNotFoundError(
+                    "the following path points nowhere:"
+                    "\n    + {0}".format(self)
+                )
+
+# Erase anything in case of any OS problem...
+        except (OSError, FileNotFoundError) as e:
+            if dest.is_file() or dest.is_dir():
+                dest.remove()
+
+            if oserror:
+                raise OSError(e)
+
+            else:
+                raise FileNotFoundError(e)
+
+    @_timed("move")
+    def move_to(self, dest, safemode = True):
+        """
+prototype::
+    arg = PPath: dest
+    arg = bool: safemode = True;
+          this argument is a security to avoid the erasing of an existing file
+          or directory. This allows the savvy developer to erase file or
+          directory during a move by using ``safemode = False``
+
+    action = this method moves the current file to the destination given by
+             the argument ``path``
+
+
+info::
+    If the source and the destination have the same parent directory, then the
+    final result will be at the end a renaming of the file or the directory.
+
+
+warning::
+    The use of ``safemode = False`` will erase **everything** at the destination
+    path.
+        """
+# Moving a file...
+        if self.is_file():
+            self.copy_to(
+                dest     = dest,
+                safemode = safemode
+            )
+
+# Let's be cautious...
+            if dest.is_file():
+                self.remove()
+
+            else:
+                raise OSError("moving the file has failed.")
+
+# Moving a directory...
+        elif self.is_dir():
+            self.copy_to(
+                dest     = dest,
+                safemode = safemode
+            )
+
+# Let's be cautious...
+            if dest.is_dir():
+                self.remove()
+
+            else:
+                raise OSError("moving the diretory has failed.")
+
+        else:
+            raise FileNotFoundError(
+                "the following path points nowhere."
+                "\n    + {0}".format(self)
+            )
+
+
+# -- ARCHIVE -- #
+
+    @_timed("archive")
+    def archive(
+        self,
+        dest,
+        regpath  = "**",
+        fmt      = TAR_GZ_FORMAT,
+        workers  = 1,
+        safemode = True
+    ):
+        """
+prototype::
+    see = regpath2meta , self.walk
+
+    arg = PPath: dest ;
+          the path of the archive to build
+    arg = str: regpath = "**" ;
+          this is a string that follows some rules named regpath rules
+    arg = str: fmt = TAR_GZ_FORMAT in ALL_ARCHIVE_FORMATS ;
+          the format of the archive
+    arg = int: workers = 1 ;
+          the number of threads used to compress, this is only useful for
+          the formats ``"tar.gz"`` and ``"tar.zst"``
+    arg = bool: safemode = True;
+          this argument is a security to avoid the erasing of an existing
+          file
+
+    return = str ;
+             the format really used, that is ``fmt`` except for the format
+             ``"tar.zst-if-available"``
+
+    action = the files and the directories matching ``regpath`` are directly
+             put inside the archive without any temporary copy
+
+
+Here is how to archive all the ¨python files of a directory.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> folder = PPath("/Users/projetmbc/basic_dir")
+    >>> folder.archive(
+    ...     dest    = PPath("/Users/projetmbc/python.tar.gz"),
+    ...     regpath = "file::**.py"
+    ... )
+
+
+info::
+    The paths inside the archive are relative to the current directory.
+
+
+info::
+    With ``fmt = "tar.gz"`` and ``workers > 1``, the archive is a
+    multi-member gzip file made of blocks compressed in parallel. Such a file
+    is a legal gzip file that the standard tools can read.
+
+
+info::
+    The format ``"tar.zst"`` needs the package ``zstandard``. The format
+    ``"tar.zst-if-available"`` gives a ``"tar.zst"`` archive if this package
+    is installed, and a ``"tar.gz"`` one otherwise: the format returned
+    indicates which one has been used, the name of ``dest`` being never
+    changed.
+
+
+warning::
+    The archive is written in a temporary file renamed at the end, so there
+    is never a partial archive.
+        """
+        if fmt not in ALL_ARCHIVE_FORMATS:
+            raise ValueError("unknown archive format ``{0}``.".format(fmt))
+
+        if fmt in [TAR_ZST_FORMAT, TAR_ZST_IF_AVAILABLE_FORMAT]:
+            try:
+                import zstandard
+
+            except ImportError:
+                if fmt == TAR_ZST_FORMAT:
+                    raise ImportError(
+                        "the format ``tar.zst`` needs the package "
+                        "``zstandard``."
+                    )
+
+                fmt = TAR_GZ_FORMAT
+
+            else:
+                fmt = TAR_ZST_FORMAT
+
+        dest.can_be_removed(safemode)
+
+        dest.parent.create(DIR_TAG)
+
+        fd, tmppath = tempfile.mkstemp(
+            dir    = str(dest.parent),
+            prefix = ".{0}.".format(dest.name),
+            suffix = ".tmp"
+        )
+
+# The paths to archive : the archive and its temporary file can be inside the
+# directory walked.
+        notarchived = {
+            str(dest.normpath),
+            str(PPath(tmppath).normpath)
+        }
+
+        ppaths = (
+            p for p in self.walk(regpath)
+            if p._tag in FILE_DIR_QUERY
+            and str(p.normpath) not in notarchived
+        )
+
+        try:
+            with os.fdopen(fd, mode = 'wb') as f:
+                if fmt == ZIP_FORMAT:
+                    self._archivezip(f, ppaths)
+
+                elif fmt == TAR_ZST_FORMAT:
+                    compressor = zstandard.ZstdCompressor(
+                        threads = workers if workers > 1 else 0
+                    )
+
+                    with compressor.stream_writer(
+                        f, closefd = False
+                    ) as zstfile:
+                        self._archivetar(zstfile, ppaths, fmt)
+
+                elif fmt == TAR_GZ_FORMAT and workers > 1:
+                    with _ParallelGzipWriter(f, workers) as gzfile:
+                        self._archivetar(gzfile, ppaths, TAR_FORMAT)
+
+                else:
+                    self._archivetar(f, ppaths, fmt)
+
+            os.chmod(tmppath, _filemode(str(dest)))
+            os.replace(tmppath, str(dest))
+
+        except BaseException:
+            if os.path.isfile(tmppath):
+                os.remove(tmppath)
+
+            raise
+
+        return fmt
+
+    def _archivetar(self, fileobj, ppaths, fmt):
+        """
+prototype::
+    see = self.archive
+
+    arg = file: fileobj ;
+          the file-like object where to write the tar archive
+    arg = iter(PPath): ppaths ;
+          the paths to archive
+    arg = str: fmt ;
+          one tar format
+
+    action = the paths are added one by one in the tar archive written in
+             stream mode
+        """
+        with tarfile.open(
+            fileobj     = fileobj,
+            mode        = _TAR_STREAM_MODES[fmt],
+            bufsize     = CHUNK_SIZE,
+            copybufsize = CHUNK_SIZE
+        ) as tar:
+            for ppath in ppaths:
+                tar.add(
+                    name      = str(ppath),
+                    arcname   = str(ppath - self),
+                    recursive = False
+                )
+
+    def _archivezip(self, fileobj, ppaths):
+        """
+prototype::
+    see = self.archive
+
+    arg = file: fileobj ;
+          the file-like object where to write the zip archive
+    arg = iter(PPath): ppaths ;
+          the paths to archive
+
+    action = the paths are added one by one in the zip archive, the files
+             being read by big pieces
+        """
+        with zipfile.ZipFile(
+            fileobj,
+            mode        = 'w',
+            compression = zipfile.ZIP_DEFLATED
+        ) as archive:
+            for ppath in ppaths:
+                arcname = str(ppath - self)
+
+                if ppath.is_dir():
+                    archive.write(str(ppath), arcname)
+                    continue
+
+                zipinfo = zipfile.ZipInfo.from_file(str(ppath), arcname)
+                zipinfo.compress_type = zipfile.ZIP_DEFLATED
+
+                with ppath.open(mode = 'rb') as src, \
+                     archive.open(zipinfo, mode = 'w') as zipdest:
+                    shutil.copyfileobj(src, zipdest, CHUNK_SIZE)
+
+
+# --------------------- #
+# -- ATOMIC WRITINGS -- #
+# --------------------- #
+
+def _readumask():
+    """
+prototype::
+    return = int ;
+             the ``umask`` of the process
+
+
+info::
+    On ¨linux, the ``umask`` is read in path::``/proc/self/status`` without
+    changing it. Elsewhere, ``os.umask`` must change it to read it, so this
+    function is only called one time, when the module is imported.
+    """
+    try:
+        with open("/proc/self/status", mode = 'r') as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+
+    except OSError:
+        ...
+
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    return umask
+
+
+# The ``umask`` is read only one time so as to never change it while other
+# threads are creating files.
+_UMASK = _readumask()
+
+
+def _filemode(strpath):
+    """
+prototype::
+    arg = str: strpath ;
+          the path of a file that is going to be replaced, or created
+
+    return = int ;
+             the permissions of the existing file, or else the ones that
+             ``open`` gives to a new file, that is to say ``0o666`` without
+             the bits of the ``umask``
+
+
+info::
+    ``tempfile.mkstemp`` always creates files with the permissions ``0o600``
+    so the temporary files must be updated before being renamed.
+
+
+warning::
+    The ``umask`` used is the one of the process when this module has been
+    imported.
+    """
+    try:
+        return os.stat(strpath).st_mode & 0o7777
+
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _writetmp(
+    strpath,
+    data,
+    encoding,
+    fsync
+):
+    """
+prototype::
+    see = PPath.write_atomic , AtomicBatch
+
+    arg = str: strpath ;
+          the path of the file that will be replaced
+    arg = str , bytes: data ;
+          the content to write
+    arg = str: encoding ;
+          the encoding used if ``data`` is a string
+    arg = bool: fsync ;
+          ``fsync = True`` asks to call ``os.fsync`` on the temporary file
+
+    return = (str, str) ;
+             the path of a new temporary file that contains ``data``, and
+             the path of the file it must replace, that is ``strpath`` with
+             its symbolic links resolved, both files being in the same
+             directory and having the same permissions
+    """
+    if isinstance(data, str):
+        data = data.encode(encoding)
+
+# Renaming a symbolic link would replace the link, and not the file pointed.
+    strpath       = os.path.realpath(strpath)
+    dirpath, name = os.path.split(strpath)
+
+    fd, tmppath = tempfile.mkstemp(
+        dir    = dirpath or ".",
+        prefix = ".{0}.".format(name),
+        suffix = ".tmp"
+    )
+
+    try:
+        with os.fdopen(fd, mode = 'wb') as f:
+            f.write(data)
+
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+        os.chmod(tmppath, _filemode(strpath))
+
+    except BaseException:
+        os.remove(tmppath)
+        raise
+
+    return tmppath, strpath
+
+
+def _fsyncdir(strpath):
+    """
+prototype::
+    arg = str: strpath ;
+          the path of a directory
+
+    action = the directory is synchronized with the disk so as to make the
+             renamings durable (nothing is done on OS that can't open a
+             directory like ¨win)
+    """
+    try:
+        fd = os.open(strpath or ".", os.O_RDONLY)
+
+    except OSError:
+        return None
+
+    try:
+        os.fsync(fd)
+
+    except OSError:
+        ...
+
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize = None)
+def _syncfsfunc():
+    """
+prototype::
+    return = func , None ;
+             the function ``syncfs`` of the C library of ¨linux, or ``None``
+             if it can't be used
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        return ctypes.CDLL(None, use_errno = True).syncfs
+
+    except (OSError, AttributeError):
+        return None
+
+
+def _syncfs(strpath):
+    """
+prototype::
+    see = AtomicBatch
+
+    arg = str: strpath ;
+          the path of a directory
+
+    return = bool ;
+             ``True`` if all the datas of the file system containing
+             ``strpath`` have been written on the disk with ``syncfs``, or
+             ``False`` if ``syncfs`` can't be used
+    """
+    syncfs = _syncfsfunc()
+
+    if syncfs is None:
+        return False
+
+    try:
+        fd = os.open(strpath or ".", os.O_RDONLY)
+
+    except OSError:
+        return False
+
+    try:
+        return syncfs(fd) == 0
+
+    finally:
+        os.close(fd)
+
+
+class AtomicBatch:
+    """
+prototype::
+    see = PPath.atomic_batch , PPath.write_atomic
+
+    type = cls ;
+           this class is a context manager used to write atomically a lot of
+           files with only one synchronization of each directory
+
+
+All the contents are first written into temporary files. When the context is
+closed, the following steps are done.
+
+    1) The temporary files are written on the disk with one call to the
+    ¨linux function ``syncfs`` for each file system used. Elsewhere, or if
+    ``syncfs`` fails, each temporary file is synchronized with
+    ``os.fdatasync``, or ``os.fsync`` on the OS without ``os.fdatasync``.
+
+    2) The temporary files are renamed.
+
+    3) Each directory containing new files is synchronized one time with the
+    disk.
+
+
+If an error occurs inside the context, all the temporary files are removed and
+no file is changed. Like with ``PPath.write_atomic``, the permissions of the
+existing files are kept, and the symbolic links are not replaced.
+
+
+info::
+    ``syncfs`` costs one call for all the files of a batch, instead of one
+    ``fsync`` per file, but it also writes the pending datas of the other
+    files of the same file system, so it can wait for other programs writing
+    a lot on this file system. For the other OS, the temporary files are
+    opened again to be synchronized: keeping one descriptor open for each
+    file of a big batch could go beyond the limit of open files.
+    """
+
+    def __init__(self):
+        self._staged = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, traceback):
+        if etype is None:
+            self.commit()
+
+        else:
+            self.abort()
+
+    def write(
+        self,
+        ppath,
+        data,
+        encoding = "utf-8"
+    ):
+        """
+prototype::
+    arg = PPath: ppath ;
+          the path of the file to write
+    arg = str , bytes: data ;
+          the content of the file
+    arg = str: encoding = "utf-8" ;
+          the encoding used if ``data`` is a string
+
+    action = the content is written in a temporary file that will be renamed
+             when the batch is committed
+        """
+        self._staged.append(
+            _writetmp(
+                strpath  = str(ppath),
+                data     = data,
+                encoding = encoding,
+                fsync    = False
+            )
+        )
+
+    def commit(self):
+        """
+prototype::
+    action = all the files written are synchronized with the disk and then
+             renamed
+        """
+        if not self._staged:
+            return None
+
+# Contents
+        try:
+            self._synccontents()
+
+        except BaseException:
+            self.abort()
+            raise
+
+# Renamings : if one fails, the temporary files not yet renamed are removed.
+        staged, self._staged = self._staged, []
+        dirpaths = set()
+
+        for nb, (tmppath, strpath) in enumerate(staged):
+            try:
+                os.replace(tmppath, strpath)
+
+            except BaseException:
+                self._staged = staged[nb:]
+                self.abort()
+                raise
+
+            dirpaths.add(os.path.dirname(strpath))
+
+        for dirpath in dirpaths:
+            _fsyncdir(dirpath)
+
+    def _synccontents(self):
+        """
+prototype::
+    action = the temporary files are synchronized with the disk using one
+             ``syncfs`` per file system, or else one ``fdatasync`` per file
+        """
+        tmpbydir = {}
+
+        for tmppath, _ in self._staged:
+            tmpbydir.setdefault(os.path.dirname(tmppath), []).append(tmppath)
+
+# ``fdatasync`` skips the metadata not needed to read the file.
+        datasync = getattr(os, "fdatasync", os.fsync)
+        synced   = {}
+
+        for dirpath, tmppaths in tmpbydir.items():
+            device = os.stat(dirpath or ".").st_dev
+
+            if device not in synced:
+                synced[device] = _syncfs(dirpath)
+
+            if synced[device]:
+                continue
+
+            for tmppath in tmppaths:
+                with open(tmppath, mode = 'rb+') as f:
+                    datasync(f.fileno())
+
+    def abort(self):
+        """
+prototype::
+    action = all the temporary files are removed so nothing is changed
+        """
+        for tmppath, _ in self._staged:
+            if os.path.isfile(tmppath):
+                os.remove(tmppath)
+
+        self._staged = []
+
+
+# ------------------------------- #
+# -- PARALLEL GZIP COMPRESSION -- #
+# ------------------------------- #
+
+class _ParallelGzipWriter:
+    """
+prototype::
+    see = PPath.archive
+
+    arg = file: fileobj ;
+          the binary file-like object where to write the compressed datas
+    arg = int: workers ;
+          the number of threads used to compress the blocks
+    arg = int: blocksize = GZIP_BLOCK_SIZE ;
+          the size of the blocks compressed independently
+
+
+This class gives a write-only file-like object producing a multi-member gzip
+file: the datas are cut in blocks that are compressed in parallel, and then
+written in order. ``zlib`` releases the GIL so threads are enough.
+
+
+info::
+    At most ``2*workers`` compressed blocks are kept in memory.
+
+
+info::
+    This class is also a context manager that calls ``close`` at the end, or
+    ``abort`` if an error occurs.
+    """
+
+    def __init__(self, fileobj, workers, blocksize = GZIP_BLOCK_SIZE):
+        self.fileobj   = fileobj
+        self.workers   = workers
+        self.blocksize = blocksize
+
+        self._buffer   = bytearray()
+        self._pending  = []
+        self._executor = futures.ThreadPoolExecutor(max_workers = workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, traceback):
+        if etype is None:
+            self.close()
+
+        else:
+            self.abort()
+
+    def write(self, data):
+        """
+prototype::
+    arg = bytes: data ;
+          some datas to compress
+
+    return = int ;
+             the number of bytes received
+        """
+        self._buffer += data
+
+        while len(self._buffer) >= self.blocksize:
+            self._submit(bytes(self._buffer[:self.blocksize]))
+            del self._buffer[:self.blocksize]
+
+        return len(data)
+
+    def _submit(self, block):
+        """
+prototype::
+    arg = bytes: block ;
+          one block to compress
+
+    action = the block is given to the pool of threads, and the oldest
+             compressed blocks are written if there are too many of them
+        """
+        self._pending.append(
+            self._executor.submit(gzip.compress, block, 6, mtime = 0)
+        )
+
+        while len(self._pending) > 2*self.workers:
+            self.fileobj.write(self._pending.pop(0).result())
+
+    def close(self):
+        """
+prototype::
+    action = the last datas are compressed, all the compressed blocks are
+             written and the threads are stopped
+        """
+        if self._executor is None:
+            return
+
+        if self._buffer or not self._pending:
+            self._submit(bytes(self._buffer))
+            self._buffer.clear()
+
+        try:
+            for future in self._pending:
+                self.fileobj.write(future.result())
+
+        finally:
+            self.abort()
+
+    def abort(self):
+        """
+prototype::
+    action = the blocks not yet compressed are forgotten and the threads are
+             stopped
+        """
+        if self._executor is None:
+            return
+
+        for future in self._pending:
+            future.cancel()
+
+        self._buffer.clear()
+        self._pending = []
+        self._executor.shutdown()
+        self._executor = None
+
+
+# ----------------------------- #
+# -- CACHE OF BUILT CONTENTS -- #
+# ----------------------------- #
+
+class ContentCache:
+    """
+prototype::
+    see = PPath
+
+    arg-attr = PPath: root ;
+               the directory where the files built are stored
+    arg-attr = None , int: maxsize = None ;
+               the maximal size in bytes of all the files stored, ``None``
+               being for no limit
+    arg-attr = None , int: maxentries = None ;
+               the maximal number of files stored, ``None`` being for no
+               limit
+
+    action = after defining an instance of this class, you can use it so as to
+             build files only when the contents used to build them change
+
+
+=========
+Basic use
+=========
+
+Let's suppose that we have a function ``topdf(source, dest)`` making a ¨pdf
+file from a ¨latex one. We want to avoid the compilation of a ¨latex file that
+has already been compiled without changing since. Here is how to do that.
+
+pyterm::
+    >>> from mistool.os_use import ContentCache, PPath
+    >>> cache  = ContentCache(PPath("/Users/projetmbc/.cache/pdf"))
+    >>> source = PPath("/Users/projetmbc/doc.tex")
+    >>> pdf = cache.get_or_build(
+    ...     key_inputs = [source, "pdflatex"],
+    ...     builder    = lambda dest: topdf(source, dest),
+    ...     ext        = "pdf"
+    ... )
+    >>> print(pdf)
+    /Users/projetmbc/.cache/pdf/3f/a2c0...8e.pdf
+
+
+The function ``builder`` is only called if the content of path::``doc.tex``
+has changed, or if the file built before has been removed from the cache.
+
+
+==============
+How that works
+==============
+
+    1) The key of a file stored is the ¨sha256 hash of the inputs given. The
+    paths are hashed using their content, and the strings, or the bytes, are
+    hashed directly.
+
+    2) The files are stored in sub directories named with the two first
+    characters of their key so as to not have too big directories.
+
+    3) The builder writes a temporary file that is renamed only at the end so
+    there are never partial files in the cache.
+
+    4) A small index path::``index.json`` stores the size and the last use of
+    each file. When there are too much files, or if the total size is too big,
+    the files not used for the longest time are removed.
+
+
+info::
+    The index is only written every ``SAVE_EVERY`` changes, or when the method
+    ``flush`` is called, for example at the end of a ``with`` block. A file
+    stored but missing in the index is simply added to it when it is used.
+
+
+warning::
+    The index is not protected against concurrent uses of the same cache by
+    several processes.
+    """
+
+    INDEX_NAME = "index.json"
+
+# Number of changes of the index before it is written automatically.
+    SAVE_EVERY = 100
+
+# Under this size, files are hashed using buffered reads, and above we use
+# ``mmap``.
+    MMAP_MIN_SIZE = 1 << 26
+
+    def __init__(
+        self,
+        root,
+        maxsize    = None,
+        maxentries = None
+    ):
+# User's arguments
+        self.root       = PPath(root)
+        self.maxsize    = maxsize
+        self.maxentries = maxentries
+
+# The index : {relative path: [size, last use]}
+        self.root.create(DIR_TAG)
+
+        self._indexpath = self.root / self.INDEX_NAME
+
+        if self._indexpath.is_file():
+            with self._indexpath.open(
+                mode     = 'r',
+                encoding = 'utf-8'
+            ) as f:
+                self.index = json.load(f)
+
+        else:
+            self.index = {}
+
+        self._totalsize = sum(size for size, _ in self.index.values())
+        self._changes   = 0
+
+# Heap of ``(last use, relative path)`` only built for the first eviction.
+# Old uses are kept inside it and ignored when they are popped.
+        self._lastuses = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.flush()
+
+# ---------- #
+# -- KEYS -- #
+# ---------- #
+
+    def key(self, key_inputs):
+        """
+prototype::
+    arg = PPath , str , bytes , list(PPath , str , bytes): key_inputs ;
+          the paths, the strings and the bytes used to identify what is built
+
+    return = str ;
+             the ¨sha256 hexadecimal hash of ``key_inputs``, the paths being
+             hashed using their content
+        """
+        if isinstance(key_inputs, (str, bytes, pathlib.PurePath)):
+            key_inputs = [key_inputs]
+
+        hasher = hashlib.sha256()
+
+# Each input is prefixed by its kind and its size so as to avoid collisions
+# like ``["ab", "c"]`` and ``["a", "bc"]``.
+        for oneinput in key_inputs:
+            if isinstance(oneinput, pathlib.PurePath):
+                hasher.update(
+                    "path:{0}:".format(
+                        os.path.getsize(str(oneinput))
+                    ).encode('utf-8')
+                )
+
+                self._hashfile(oneinput, hasher)
+
+            else:
+                if isinstance(oneinput, str):
+                    oneinput = oneinput.encode('utf-8')
+
+                hasher.update(
+                    "bytes:{0}:".format(len(oneinput)).encode('utf-8')
+                )
+                hasher.update(oneinput)
+
+        return hasher.hexdigest()
+
+    def _hashfile(self, path, hasher):
+        """
+prototype::
+    arg = PPath: path ;
+          the path of a file
+    arg = hashlib._Hash: hasher ;
+          the hash object to update
+
+    action = the content of the file is given to ``hasher`` without loading
+             the whole file in memory
+        """
+        with open(str(path), mode = 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+
+            if size >= self.MMAP_MIN_SIZE:
+                with mmap.mmap(
+                    f.fileno(), 0, access = mmap.ACCESS_READ
+                ) as mapped:
+                    hasher.update(mapped)
+
+            else:
+                buffer = bytearray(CHUNK_SIZE)
+                view   = memoryview(buffer)
+
+                while True:
+                    nbread = f.readinto(buffer)
+
+                    if not nbread:
+                        break
+
+                    hasher.update(view[:nbread])
+
+# ----------- #
+# -- BUILD -- #
+# ----------- #
+
+    def get_or_build(
+        self,
+        key_inputs,
+        builder,
+        ext = ""
+    ):
+        """
+prototype::
+    see = self.key
+
+    arg = PPath , str , bytes , list(PPath , str , bytes): key_inputs ;
+          the paths, the strings and the bytes used to identify what is built
+    arg = func: builder ;
+          a function with one single argument, the ``PPath`` of the file it
+          must write
+    arg = str: ext = "" ;
+          the extension of the file built
+
+    return = PPath ;
+             the path of the file stored in the cache which is built only if
+             it does not exist yet
+        """
+        key     = self.key(key_inputs)
+        relpath = os.path.join(key[:2], key[2:])
+
+        if ext:
+            relpath += "." + ext
+
+        path = self.root / relpath
+
+# Nothing to build.
+        if path.is_file():
+            if relpath not in self.index:
+                self._addentry(relpath, path)
+
+            self._use(relpath)
+
+        else:
+            path.parent.create(DIR_TAG)
+
+            fd, tmppath = tempfile.mkstemp(
+                dir    = str(path.parent),
+                prefix = ".{0}.".format(path.name),
+                suffix = ".tmp"
+            )
+            os.close(fd)
+
+            try:
+                builder(PPath(tmppath))
+                os.chmod(tmppath, _filemode(str(path)))
+                os.replace(tmppath, str(path))
+
+            except BaseException:
+                if os.path.isfile(tmppath):
+                    os.remove(tmppath)
+
+                raise
+
+            self._addentry(relpath, path)
+            self._use(relpath)
+            self._evict(keep = relpath)
+
+        self._changes += 1
+
+        if self._changes >= self.SAVE_EVERY:
+            self.flush()
+
+        return path
+
+    def _addentry(self, relpath, path):
+        """
+prototype::
+    arg = str: relpath ;
+          the relative path of a file stored
+    arg = PPath: path ;
+          the full path of the same file
+
+    action = the size of the file is stored in the index
+        """
+        if relpath in self.index:
+            self._totalsize -= self.index[relpath][0]
+
+        size = path.stat().st_size
+
+        self.index[relpath] = [size, 0]
+        self._totalsize    += size
+
+    def _use(self, relpath):
+        """
+prototype::
+    arg = str: relpath ;
+          the relative path of a file in the index
+
+    action = the time of the last use of the file is updated
+        """
+        now = time.time()
+
+        self.index[relpath][1] = now
+
+        if self._lastuses is not None:
+            heapq.heappush(self._lastuses, (now, relpath))
+
+# -------------- #
+# -- EVICTION -- #
+# -------------- #
+
+    def _evict(self, keep):
+        """
+prototype::
+    arg = str: keep ;
+          the relative path of a file that must not be removed
+
+    action = the files not used for the longest time are removed until the
+             limits ``self.maxsize`` and ``self.maxentries`` are respected
+        """
+        if self._withinlimits():
+            return None
+
+        if self._lastuses is None \
+        or len(self._lastuses) > 2*len(self.index) + self.SAVE_EVERY:
+            self._lastuses = [
+                (lastuse, relpath)
+                for relpath, (_, lastuse) in self.index.items()
+            ]
+            heapq.heapify(self._lastuses)
+
+        kept = []
+
+        while self._lastuses and not self._withinlimits():
+            lastuse, relpath = heapq.heappop(self._lastuses)
+
+            if relpath == keep:
+                kept.append((lastuse, relpath))
+                continue
+
+# A file removed, or used again since.
+            if relpath not in self.index \
+            or self.index[relpath][1] != lastuse:
+                continue
+
+            size, _ = self.index.pop(relpath)
+
+            self._totalsize -= size
+
+            path = self.root / relpath
+
+            if path.is_file():
+                path.unlink()
+
+        for item in kept:
+            heapq.heappush(self._lastuses, item)
+
+    def _withinlimits(self):
+        """
+prototype::
+    return = bool ;
+             ``True`` if the limits ``self.maxsize`` and ``self.maxentries``
+             are respected, or ``False`` if not
+        """
+        return (self.maxsize is None or self._totalsize <= self.maxsize) \
+           and (self.maxentries is None or len(self.index) <= self.maxentries)
+
+    def clear(self):
+        """
+prototype::
+    action = all the files stored are removed
+        """
+        for relpath in self.index:
+            path = self.root / relpath
+
+            if path.is_file():
+                path.unlink()
+
+        self.index      = {}
+        self._totalsize = 0
+        self._lastuses  = None
+        self._changes   = 0
+
+        self._saveindex()
+
+    def flush(self):
+        """
+prototype::
+    action = the index is stored if it has changed since the last time
+        """
+        if self._changes:
+            self._saveindex()
+            self._changes = 0
+
+    def _saveindex(self):
+        """
+prototype::
+    action = the index is stored atomically in the file path::``index.json``
+        """
+# The index can be rebuilt so we don't pay for ``os.fsync``.
+        self._indexpath.write_atomic(
+            data  = json.dumps(self.index),
+            fsync = False
+        )
+
+
+# -------------------------- #
+# -- CREATING EMPTY FILES -- #
+# -------------------------- #
+
+def _touch(strpath):
+    """
+prototype::
+    see = PPath.create_many
+
+    arg = str: strpath ;
+          the path of a file to create
+
+    action = this function creates an empty file if it does not exist, an
+             existing file being kept as it is
+    """
+    try:
+        fd = os.open(strpath, os.O_WRONLY | os.O_CREAT, 0o666)
+
+    except IsADirectoryError:
+        raise IsADirectoryError(
+            "the following path points to an existing directory :"
+            "\n    + {0}".format(strpath)
+        )
+
+    os.close(fd)
 
 
 # --------------- #
@@ -1333,10 +3356,10 @@ warning::
 #    * http://docs.python.org/py3k/library/subprocess.html
 _SUBPROCESS_METHOD = {
 # ``check_call`` prints informations given during the compilation.
-    True : check_call,
+    True : "check_call",
 # ``check_output`` does not print informations given during the
 # compilation. Indeed it returns all this stuff in one string.
-    False: check_output
+    False: "check_output"
 }
 
 def runthis(
@@ -1391,7 +3414,10 @@ info::
     )
 
 # We keep the current working directory and use the terminal actions.
-    fromprocess = _SUBPROCESS_METHOD[showoutput](args = cmd_args)
+    fromprocess = getattr(
+        subprocess,
+        _SUBPROCESS_METHOD[showoutput]
+    )(args = cmd_args)
 
 # ``check_output`` being a byte string, we have to use ``decode('utf8')`` so as
 # to obtain an "utf-8" string.
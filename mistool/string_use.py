@@ -8,7 +8,10 @@ prototype::
 This module contains some tools to manipulate strings.
 """
 
-from unicodedata import name as ucname
+import os
+from array import array
+from functools import lru_cache
+from unicodedata import combining, name as ucname, normalize
 
 from mistool.config.ascii import ASCII_CHARS
 
@@ -188,6 +191,363 @@ prototype::
 # -- REPLACE -- #
 # ------------- #
 
+_REPLACE_ENGINES = SEQUENTIAL, AUTOMATON, REGEX, AUTO \
+                 = 'sequential', 'automaton', 'regex', 'auto'
+
+# Colours used to look for cyclic replacements.
+_WHITE, _GREY, _BLACK = range(3)
+
+# Value used for the old texts that don't exist yet.
+_NO_TEXT = object()
+
+_MAP_EXECUTORS = PROCESS_EXECUTOR, THREAD_EXECUTOR \
+               = 'process', 'thread'
+
+
+def _sortingkey(text):
+    """
+prototype::
+    arg = str: text ;
+          an old text
+
+    return = (int, str) ;
+             the key sorting the old texts from the longest to the shortest
+             ones, and then alphabetically
+    """
+    return -len(text), text
+
+
+def _sortedindex(sortedtexts, text):
+    """
+prototype::
+    see = _sortingkey
+
+    arg = list(str): sortedtexts ;
+          old texts sorted using ``_sortingkey``
+    arg = str: text ;
+          an old text
+
+    return = int ;
+             the index where ``text`` is, or must be inserted, in
+             ``sortedtexts`` (a binary search is used)
+    """
+    key  = _sortingkey(text)
+    low  = 0
+    high = len(sortedtexts)
+
+    while low < high:
+        middle = (low + high) // 2
+
+        if _sortingkey(sortedtexts[middle]) < key:
+            low = middle + 1
+
+        else:
+            high = middle
+
+    return low
+
+
+class _AhoCorasick:
+    """
+prototype::
+    see = MultiReplace
+
+    arg = list(str): keys = () ;
+          the non-empty strings to look for
+
+    action = this class implements an Aho-Corasick automaton giving the
+             leftmost-longest matches of several strings in linear time
+
+
+info::
+    The trie is built with the **reversed** strings, and the text is read from
+    right to left, so as to know the longest string starting at each position.
+    The leftmost-longest matches are then chosen from left to right without
+    reading again the text.
+
+
+info::
+    The automaton is stored in flat lists indexed by the states: ``goto``
+    gives the transitions of the trie, ``depth`` the length of the prefix of a
+    state, ``key`` the string whose reversal ends exactly at a state, and
+    ``fail`` with ``out`` the failure links and the longest string whose
+    reversal is a suffix of a state.
+    """
+
+# Number of positions analyzed at each step of the search.
+    BLOCK_SIZE = 1 << 16
+
+    def __init__(self, keys = ()):
+        self.goto  = [{}]
+        self.depth = [0]
+        self.key   = [None]
+
+        self.fail = None
+        self.out  = None
+
+        for key in keys:
+            self.add(key)
+
+# ---------------- #
+# -- THE STATES -- #
+# ---------------- #
+
+    def add(self, key):
+        """
+prototype::
+    arg = str: key ;
+          a non-empty string to look for
+
+    action = the states needed by ``key`` are added to the trie, and the
+             failure links will be rebuilt at the next search
+        """
+        if not key:
+            raise ValueError("empty strings can't be looked for.")
+
+        state = 0
+
+        for char in reversed(key):
+            nextstate = self.goto[state].get(char)
+
+            if nextstate is None:
+                nextstate = len(self.goto)
+
+                self.goto[state][char] = nextstate
+                self.goto.append({})
+                self.depth.append(self.depth[state] + 1)
+                self.key.append(None)
+
+            state = nextstate
+
+        self.key[state] = key
+        self.fail       = None
+
+    def remove(self, key):
+        """
+prototype::
+    arg = str: key ;
+          a string looked for
+
+    action = the transitions only used by ``key`` are removed from the trie,
+             and the failure links will be rebuilt at the next search
+        """
+        path  = []
+        state = 0
+
+        for char in reversed(key):
+            nextstate = self.goto[state].get(char)
+
+            if nextstate is None:
+                return None
+
+            path.append((state, char))
+            state = nextstate
+
+        if self.key[state] is None:
+            return None
+
+        self.key[state] = None
+        self.fail       = None
+
+# The states unreachable are just forgotten.
+        for state, char in reversed(path):
+            nextstate = self.goto[state][char]
+
+            if self.goto[nextstate] or self.key[nextstate] is not None:
+                break
+
+            del self.goto[state][char]
+
+    def _buildlinks(self):
+        """
+prototype::
+    action = the failure links and the longest suffixes are built using a
+             breadth-first walk of the trie
+        """
+        nbstates = len(self.goto)
+        fail     = [0]*nbstates
+        out      = [None]*nbstates
+        queue    = list(self.goto[0].values())
+
+        for state in queue:
+            out[state] = self.key[state]
+
+        for state in queue:
+            for char, nextstate in self.goto[state].items():
+                queue.append(nextstate)
+
+                failstate = fail[state]
+
+                while failstate and char not in self.goto[failstate]:
+                    failstate = fail[failstate]
+
+                failstate = self.goto[failstate].get(char, 0)
+
+                fail[nextstate] = failstate
+                out[nextstate]  = self.key[nextstate] or out[failstate]
+
+        self.fail   = fail
+        self.out    = out
+        self.maxlen = max(
+            (len(key) for key in self.key if key is not None),
+            default = 0
+        )
+
+# ------------------ #
+# -- THE MATCHING -- #
+# ------------------ #
+
+    def finditer(self, text, start = 0):
+        """
+prototype::
+    arg = str: text ;
+          the text where to look for the keys
+    arg = int: start = 0 ;
+          the position where to start the search
+
+    yield = (int, int, str) ;
+            the leftmost-longest non-overlapping matches ``(start, end,
+            key)`` with ``text[start:end] == key``
+
+
+info::
+    The text is analyzed by blocks of positions. For each block, the text is
+    read from right to left, beginning ``maxlen - 1`` characters after the
+    block so as to see the longest keys starting inside it. Each character is
+    read at most two times if the blocks are longer than the keys.
+        """
+        if self.fail is None:
+            self._buildlinks()
+
+        goto = self.goto
+        fail = self.fail
+        out  = self.out
+
+        imax  = len(text)
+        block = max(self.BLOCK_SIZE, self.maxlen)
+        end   = start
+
+        for blockstart in range(start, imax, block):
+            blockend = min(blockstart + block, imax)
+            readend  = min(blockend + self.maxlen - 1, imax)
+
+# The longest keys starting in the block, from right to left.
+            found = []
+            state = 0
+
+            for i in range(readend - 1, blockstart - 1, -1):
+                char = text[i]
+
+                while state and char not in goto[state]:
+                    state = fail[state]
+
+                state = goto[state].get(char, 0)
+                key   = out[state]
+
+                if key is not None and i < blockend:
+                    found.append((i, key))
+
+# The leftmost-longest matches that do not overlap.
+            for i, key in reversed(found):
+                if i >= end:
+                    end = i + len(key)
+
+                    yield i, end, key
+
+    def replace(self, text, oldnew):
+        """
+prototype::
+    arg = str: text ;
+          the text where to do the replacements
+    arg = {str: str}: oldnew ;
+          the replacement of each key
+
+    return = str ;
+             the text where all the leftmost-longest matches have been
+             replaced
+        """
+        pieces = []
+        last   = 0
+
+        for start, end, key in self.finditer(text):
+            pieces.append(text[last: start])
+            pieces.append(oldnew[key])
+
+            last = end
+
+        if not pieces:
+            return text
+
+        pieces.append(text[last:])
+
+        return "".join(pieces)
+
+
+# The instance of ``MultiReplace`` used by each worker of ``MultiReplace.map``.
+_MAP_REPLACE = None
+
+def _mapinit(mreplace):
+    """
+prototype::
+    see = MultiReplace.map
+
+    arg = MultiReplace: mreplace ;
+          the instance to use in the current worker
+
+    action = this hidden function stores ``mreplace`` so as to send it only
+             one time to each worker
+    """
+    global _MAP_REPLACE
+
+    _MAP_REPLACE = mreplace
+
+
+def _mapone(item, encoding, inplace, mreplace = None):
+    """
+prototype::
+    see = MultiReplace.map
+
+    arg = str , os.PathLike: item ;
+          a text or the path of a text file
+    arg = str: encoding ;
+          the encoding of the files
+    arg = bool: inplace ;
+          ``True`` asks to update the files
+    arg = MultiReplace , None: mreplace = None ;
+          the instance to use, or ``None`` for the one stored by ``_mapinit``
+
+    return = str , os.PathLike ;
+             the new text, or the path of the file updated
+    """
+    if mreplace is None:
+        mreplace = _MAP_REPLACE
+
+    if not isinstance(item, os.PathLike):
+        return mreplace(item)
+
+# ``newline = ""`` keeps the ends of lines as they are.
+    with open(
+        os.fspath(item),
+        mode     = 'r',
+        encoding = encoding,
+        newline  = ""
+    ) as f:
+        text = f.read()
+
+    newtext = mreplace(text)
+
+    if not inplace:
+        return newtext
+
+# Nothing to write if nothing has changed.
+    if newtext != text:
+        from mistool.os_use import PPath
+
+        PPath(item).write_atomic(newtext, encoding = encoding)
+
+    return item
+
+
 class MultiReplace():
     """
 prototype::
@@ -205,6 +565,13 @@ prototype::
                strings, but if you give a "grouping" pattern regex::``(...)``
                defining what a word is, then the replacemnts will only concern
                this words.
+    arg-attr = str: engine = "sequential" in _REPLACE_ENGINES ;
+               the way to do the unrecursive replacements (see the section
+               "Engines for unrecursive replacements" below)
+
+    attr = str , None: engineused ;
+           the engine really used for the unrecursive replacements, and
+           ``None`` for the recursive ones
 
     action = after defining an instance of this class, you can use your instance
              as a "superpower" replacing function
@@ -232,6 +599,54 @@ pyterm::
     1, 2, 3...
 
 
+====================================
+Engines for unrecursive replacements
+====================================
+
+By default, we have ``engine = "sequential"`` which uses the method ``replace``
+of strings one time for each old text. This means that a replacement text can
+be changed by the next replacements, and that the whole text is read one time
+for each old text.
+
+With ``engine = "automaton"``, an automaton is built by the method ``build``
+so as to do all the replacements in one single pass, the text being read from
+left to right. At each position, the longest old text found is replaced, and
+then the replacement texts are never changed. Here is an example showing the
+difference between the two engines.
+
+pyterm::
+    >>> from mistool.string_use import MultiReplace
+    >>> oldnew = {
+    ...     'W1' : "Word #1",
+    ...     'W2' : "Word #2",
+    ...     'W12': "W1 and W2"
+    ... }
+    >>> print(MultiReplace(oldnew)("W12 = W1 and W2"))
+    Word #1 and Word #2 = Word #1 and Word #2
+    >>> print(MultiReplace(oldnew, engine = "automaton")("W12 = W1 and W2"))
+    W1 and W2 = Word #1 and Word #2
+
+
+With ``engine = "regex"``, the replacements are the same as with the automaton
+but they are done by one single regex made of all the old texts, from the
+longest to the shortest ones. This engine is faster than the automaton when
+there are not too many old texts.
+
+Finally, ``engine = "auto"`` chooses between ``"regex"`` and ``"automaton"``
+regarding to the number and the sizes of the old texts. The attribut
+``engineused`` gives the engine selected.
+
+pyterm::
+    >>> mreplace = MultiReplace(oldnew, engine = "auto")
+    >>> print(mreplace.engineused)
+    regex
+
+
+info::
+    The automaton is the best choice for a lot of old texts and long texts
+    because the time needed grows linearly with the length of the text.
+
+
 ======================
 Recursive replacements
 ======================
@@ -350,7 +765,7 @@ pyterm::
     Traceback (most recent call last):
     [...]
     ValueError: the following viscious circle has been found.
-        + WRONG_2 --> WRONG_3 --> WRONG_1 --> WRONG_2
+        + WRONG_1 --> WRONG_2 --> WRONG_3 --> WRONG_1
 
 
 ================================
@@ -377,16 +792,32 @@ pyterm::
     "Hypertext Markup Language" website.
     """
 
+# Limits for the choice of ``engine = "auto"``.
+    AUTO_MAX_REGEX_KEYS = 1000
+    AUTO_MAX_REGEX_SIZE = 1 << 16
+
+# Lengths used by the replacements in streams.
+    STREAM_CHUNK_SIZE = 1 << 20
+    PATTERN_OVERLAP   = 1 << 10
+
+# Number of texts sent together to a worker by ``map``.
+    MAP_CHUNK_SIZE = 16
+
     def __init__(
         self,
-        oldnew    = {},
+        oldnew    = None,
         recursive = False,
-        pattern   = None
+        pattern   = None,
+        engine    = SEQUENTIAL
     ):
-# User's arguments
+# User's arguments (a new dictionary is needed because of ``self.update``)
+        if oldnew is None:
+            oldnew = {}
+
         self.oldnew    = oldnew
         self.recursive = recursive
         self.pattern   = pattern
+        self.engine    = engine
 
 # Build the value of ``self.asit``
         self.build()
@@ -406,182 +837,943 @@ prototype::
                 'the recursive mode must be used with a regex pattern.'
             )
 
+        if self.engine not in _REPLACE_ENGINES:
+            raise ValueError(
+                'unknown engine ``{0}``.'.format(self.engine)
+            )
+
         self._lookforcycle()
         self._build_asit()
+        self._build_engine()
 
     def _lookforcycle(self):
         """
 prototype::
-    see = self._noviciouscycle
+    see = self._toposort
 
-    action = this method verifies that there are no cyclic replacements (all the
-             job is done recursively by ``self._noviciouscycle``).
+    action = this method verifies that there are no cyclic replacements, and
+             it stores in ``self._toporder`` the old texts sorted such as the
+             old texts used in a replacement text always come before it.
         """
 # Nothing to do...
         if not self.recursive:
+            self._toporder = None
             return None
 
-# Building the crossing replacements.
-        self._allold = list(self.oldnew.keys())
+# Building the crossing replacements, and the reverse ones.
         self._inold  = {}
+        self._usedby = {}
 
-        for old, new in self.oldnew.items():
-            self._inold[old] = [
-                x for x in self.pattern.findall(new)
-                if x in self._allold
-            ]
+        for old in self.oldnew:
+            self._indexwords(old)
 
-        self._noviciouscycle(self._allold)
+        self._toporder = self._toposort(self._inold)
 
-    def _noviciouscycle(
-        self,
-        nextwords,
-        wordsfound = [],
-    ):
+    def _indexwords(self, old):
         """
 prototype::
-    arg = list(str): nextwords ;
-          the old words with replacement texts to analyze
-    arg = list(str): wordsfound ;
-          the words found in replacement texts (here we start for one word,
-          then we go in its replacement and so on...)
+    arg = str: old ;
+          one old text
+
+    action = this method stores the words found in the replacement text of
+             ``old`` in ``self._inold[old]``, and ``old`` is added to
+             ``self._usedby[word]`` for each of these words (the words that
+             are not old texts are also kept because they can become old
+             texts after an update).
+        """
+        words = list(dict.fromkeys(self.pattern.findall(self.oldnew[old])))
+
+        self._inold[old] = words
 
-    action = this method looks for cyclic replacements (the job is done
-             recursively).
+        for word in words:
+            self._usedby.setdefault(word, set()).add(old)
+
+    def _unindexwords(self, old):
         """
-        for old in nextwords:
-            thisoldinnew = self._inold[old]
+prototype::
+    see = self._indexwords
 
-            if old in thisoldinnew:
-                raise ValueError(
-                    "<< {0} >> is used in its replacement text.".format(old)
-                )
+    arg = str: old ;
+          one old text
 
-            elif old in wordsfound:
-                pos = wordsfound.index(old)
+    action = this method forgets the words that were found in the replacement
+             text of ``old``.
+        """
+        for word in self._inold.pop(old, ()):
+            usedby = self._usedby[word]
+            usedby.discard(old)
 
-                wordsfound = wordsfound[pos:]
-                wordsfound.append(old)
+            if not usedby:
+                del self._usedby[word]
 
-                raise ValueError(
-                    "the following viscious circle has been found.\n\t + "
-                    + " --> ".join(wordsfound)
-                )
+    def _toposort(self, roots, inside = None):
+        """
+prototype::
+    arg = iter(str): roots ;
+          the old texts where to start the search
+    arg = set(str) , None: inside = None ;
+          ``None`` allows to follow all the old texts, otherwise only the old
+          texts in ``inside`` are followed
 
-            else:
-                for new in thisoldinnew:
-                    self._noviciouscycle(
-                        wordsfound = wordsfound + [old],
-                        nextwords  = self._inold[old]
-                    )
+    return = list(str) ;
+             the old texts reached sorted such as the old texts used in a
+             replacement text always come before it
+
+
+info::
+    The job is done by an iterative depth first search with three colours :
+    an old text not yet seen is "white", one being explored is "grey" and one
+    fully explored is "black". Meeting a grey old text gives a cycle. Each old
+    text and each use of an old text are analyzed only once, so very long
+    chains of replacements can be checked without any recursion limit.
+        """
+        colors   = {}
+        toporder = []
+
+        for root in roots:
+            if root in colors:
+                continue
+
+            self._noselfuse(root)
+
+            colors[root] = _GREY
+            path         = [root]
+            stack        = [self._oldsin(root, inside)]
+
+            while stack:
+                for old in stack[-1]:
+                    color = colors.get(old, _WHITE)
+
+                    if color == _WHITE:
+                        self._noselfuse(old)
+
+                        colors[old] = _GREY
+                        path.append(old)
+                        stack.append(self._oldsin(old, inside))
+                        break
+
+                    elif color == _GREY:
+                        cycle = path[path.index(old):]
+                        cycle.append(old)
+
+                        raise ValueError(
+                            "the following viscious circle has been found.\n\t + "
+                            + " --> ".join(cycle)
+                        )
+
+                else:
+                    stack.pop()
+
+                    old = path.pop()
+
+                    colors[old] = _BLACK
+                    toporder.append(old)
+
+        return toporder
+
+    def _oldsin(self, old, inside):
+        """
+prototype::
+    see = self._toposort
+
+    arg = str: old ;
+          one old text
+    arg = set(str) , None: inside ;
+          ``None`` or the only old texts to keep
+
+    return = iter(str) ;
+             the old texts used in the replacement text of ``old``
+        """
+        if inside is None:
+            inside = self.oldnew
+
+        return (x for x in self._inold[old] if x in inside)
+
+    def _noselfuse(self, old):
+        """
+prototype::
+    arg = str: old ;
+          one old text
+
+    action = this method raises an error if ``old`` is used in its own
+             replacement text.
+        """
+        if old in self._inold[old]:
+            raise ValueError(
+                "<< {0} >> is used in its replacement text.".format(old)
+            )
 
     def _build_asit(self):
         """
 prototype::
+    see = self._lookforcycle
+
     action = this method builds the direct replacements dictionary ``self.asit``
-             (all the job is done by ``self._replace_in_new`` if
-             ``self.recursive = False``)
+             (if ``self.recursive = True``, each replacement text is expanded
+             only once by following the order given by ``self._toporder``).
         """
         if self.recursive:
-            self.asit = {}
+            expanded = {}
+
+            for old in self._toporder:
+                expanded[old] = self._expand(old, expanded)
 
-            for old, new in self.oldnew.items():
-                self.asit[old] = self._replace_in_new(new)
+            self.asit = {old: expanded[old] for old in self.oldnew}
 
         else:
             self.asit = self.oldnew
 
-    def _replace_in_new(self, text):
+    def _expand(self, old, expanded):
         """
 prototype::
-    action = this method builds the direct replacements dictionary ``self.asit``
-             (all the job is done by ``self._replace_in_new`` if
-             ``self.recursive = False``)
-        """
-# Nothing ot do.
-        if not text:
-            return text
-
-# The text is not empty.
-        newtext = ""
+    arg = str: old ;
+          one old text
+    arg = {str: str}: expanded ;
+          the replacement texts already expanded of the old texts used in
+          the replacement text of ``old``
 
-        while True:
-# Source :
-#    http://www.developpez.net/forums/d958712/autres-langages/python-zope/general-python/amelioration-split-evolue/#post5383767
-            newtext = self.pattern.sub(self._apply_in_new_for_asit, text)
+    return = str ;
+             the replacement text of ``old`` with all the old texts replaced
+        """
+        new = self.oldnew[old]
 
-            if newtext == text:
-                return text
+        if new:
+            new = self.pattern.sub(
+                lambda m: expanded.get(m.group(1), m.group(0)),
+                new
+            )
 
-            else:
-                text = newtext
+        return new
 
-    def _apply_in_new_for_asit(self, match):
+    def _build_engine(self):
         """
 prototype::
-    action = this method is used to do the replacements for the values of
-             ``self.asit`` regarding the words defined by ``self.pattern``.
+    see = self._build_matcher
+
+    action = this method sorts the old texts, from the longest to the
+             shortest ones, and then it builds the automaton or the regex
+             used by the unrecursive replacements
         """
-        return self.oldnew.get(match.group(1), match.group(0))
+        self._sortedkeys = sorted(self.asit.keys(), key = _sortingkey)
+        self._keyssize   = sum(len(x) for x in self._sortedkeys)
 
-# ----------------------- #
-# -- REPLACE IN A TEXT -- #
-# ----------------------- #
+        self._build_matcher()
 
-    def __call__(self, text):
+    def _build_matcher(self):
         """
 prototype::
-    arg = str: text ;
-          a text where to do replacements
-
-    return = str ;
-             the text where all the replacements have been done.
+    action = this method builds the automaton or the regex used by the
+             unrecursive replacements from ``self._sortedkeys``
         """
+        self._automaton = None
+        self._regex     = None
+
         if self.recursive:
-            text = self.pattern.sub(self._apply_asit, text)
+            self.engineused = None
+            return None
 
-        else:
-            sortedkeys = sorted(
-                self.oldnew.keys(),
-                key = lambda t: (-len(t), t)
-            )
+        engine = self._chooseengine()
 
-            for old in sortedkeys:
-                text = text.replace(old, self.oldnew[old])
+        self.engineused = engine
 
-        return text
+        if engine == AUTOMATON:
+            self._automaton = _AhoCorasick(self._sortedkeys)
 
-    def _apply_asit(self, match):
+        elif engine == REGEX:
+            self._build_regex()
+
+    def _chooseengine(self):
         """
 prototype::
-    action = this method is used to do the replacements in the user's text
-             regarding the words defined by ``self.pattern``.
+    return = str ;
+             the engine to use, ``engine = "auto"`` being replaced by
+             ``"regex"`` or ``"automaton"``
         """
-        return self.asit.get(match.group(1), match.group(0))
+        if self.engine != AUTO:
+            return self.engine
 
+        if len(self._sortedkeys) <= self.AUTO_MAX_REGEX_KEYS \
+        and self._keyssize <= self.AUTO_MAX_REGEX_SIZE:
+            return REGEX
 
-# ----------- #
-# -- SPLIT -- #
-# ----------- #
+        return AUTOMATON
 
-class SplitInfos:
-    """
+    def _build_regex(self):
+        """
 prototype::
-    see = MultiSplit
+    action = this method builds the regex made of all the old texts, from the
+             longest to the shortest ones
+        """
+        if self._sortedkeys and not self._sortedkeys[-1]:
+            raise ValueError("empty strings can't be looked for.")
 
-    action = this class is simply an object used by the method ``__iter__`` of
-             the class ``MultiSplit``.
-    """
+# ``re`` is only imported by the engines needing it so as to import quickly
+# this module.
+        import re
 
-    def __init__(
-        self,
-        type,
+# With no old text, the regex must never match.
+        self._regex = re.compile(
+            "|".join(re.escape(x) for x in self._sortedkeys)
+            or "(?!)"
+        )
+
+# ------------------------- #
+# -- INCREMENTAL UPDATES -- #
+# ------------------------- #
+
+    def update(self, oldnew):
+        """
+prototype::
+    see = self.discard
+
+    arg = {str: str}: oldnew ;
+          the old texts to add or to change with their new replacement texts
+
+    action = this method changes ``self.oldnew`` in place, and then it only
+             updates the parts of ``self.asit`` and of the engine that depend
+             on the old texts changed (if a cyclic replacement appears,
+             nothing is changed and an error is raised).
+
+
+Here is an example where the replacement texts using ``W1`` are the only ones
+to be expanded again.
+
+pyterm::
+    >>> from mistool.string_use import MultiReplace
+    >>> from mistool.config.pattern import PATTERNS_WORDS
+    >>> mreplace = MultiReplace(
+    ...     oldnew    = {'W1': "Word #1", 'W2': "Word #2", 'W3': "W1 and W2"},
+    ...     recursive = True,
+    ...     pattern   = PATTERNS_WORDS['var']
+    ... )
+    >>> mreplace.update({'W1': "Word #one"})
+    >>> print(mreplace("W3"))
+    Word #one and Word #2
+    >>> mreplace.discard('W2')
+    >>> print(mreplace("W3"))
+    Word #one and W2
+        """
+        if not self.recursive:
+            self._change(oldnew, [])
+            return None
+
+        backup = {
+            old: self.oldnew.get(old, _NO_TEXT)
+            for old in oldnew
+        }
+
+        try:
+            self._change(oldnew, [])
+
+# Let's go back to the last valid definitions.
+        except ValueError:
+            for old, new in backup.items():
+                if new is _NO_TEXT:
+                    del self.oldnew[old]
+
+                else:
+                    self.oldnew[old] = new
+
+            self._update_asit(backup)
+
+            raise
+
+    def discard(self, old):
+        """
+prototype::
+    see = self.update
+
+    arg = str: old ;
+          an old text
+
+    action = this method removes ``old`` from ``self.oldnew`` if it is
+             there, and then it only updates the parts of ``self.asit`` and
+             of the engine that depend on ``old``
+        """
+        if old in self.oldnew:
+            self._change({}, [old])
+
+    def _change(self, oldnew, removed):
+        """
+prototype::
+    arg = {str: str}: oldnew ;
+          the old texts to add or to change with their new replacement texts
+    arg = list(str): removed ;
+          the old texts to remove
+
+    action = this method does the changes in ``self.oldnew``, and then it
+             updates ``self.asit`` and the engine
+        """
+        added = [old for old in oldnew if old not in self.oldnew]
+
+        for old in removed:
+            del self.oldnew[old]
+
+        self.oldnew.update(oldnew)
+
+        if self.recursive:
+            self._update_asit(list(oldnew) + removed)
+
+        self._update_engine(added, removed)
+
+    def _update_asit(self, changed):
+        """
+prototype::
+    arg = iter(str): changed ;
+          the old texts added, changed or removed
+
+    action = this method looks for cyclic replacements and expands again the
+             replacement texts only for the old texts changed and the ones
+             using them, directly or not.
+        """
+        for old in changed:
+            self._unindexwords(old)
+
+            if old in self.oldnew:
+                self._indexwords(old)
+
+            else:
+                self.asit.pop(old, None)
+
+# The old texts using the changed ones, directly or not.
+        affected = {old for old in changed if old in self.oldnew}
+        stack    = list(changed)
+
+        while stack:
+            for old in self._usedby.get(stack.pop(), ()):
+                if old not in affected:
+                    affected.add(old)
+                    stack.append(old)
+
+# A new cycle must only use affected old texts.
+        for old in self._toposort(affected, affected):
+            self.asit[old] = self._expand(old, self.asit)
+
+    def _update_engine(self, added, removed):
+        """
+prototype::
+    arg = list(str): added ;
+          the new old texts
+    arg = list(str): removed ;
+          the old texts removed
+
+    action = this method updates the sorted old texts, and then it patches
+             the automaton or it builds again the regex
+        """
+        if not added and not removed:
+            return None
+
+        for old in removed:
+            del self._sortedkeys[_sortedindex(self._sortedkeys, old)]
+            self._keyssize -= len(old)
+
+        for old in added:
+            self._sortedkeys.insert(_sortedindex(self._sortedkeys, old), old)
+            self._keyssize += len(old)
+
+        if self.recursive:
+            return None
+
+        if self._chooseengine() != self.engineused:
+            self._build_matcher()
+
+        elif self._automaton is not None:
+            for old in removed:
+                self._automaton.remove(old)
+
+            for old in added:
+                self._automaton.add(old)
+
+        elif self._regex is not None:
+            self._build_regex()
+
+# ----------------------- #
+# -- REPLACE IN A TEXT -- #
+# ----------------------- #
+
+    def __call__(self, text):
+        """
+prototype::
+    arg = str: text ;
+          a text where to do replacements
+
+    return = str ;
+             the text where all the replacements have been done.
+        """
+        if self.recursive:
+            text = self.pattern.sub(self._apply_asit, text)
+
+        elif self._automaton is not None:
+            text = self._automaton.replace(text, self.asit)
+
+        elif self._regex is not None:
+            text = self._regex.sub(self._apply_regex, text)
+
+        else:
+            for old in self._sortedkeys:
+                text = text.replace(old, self.asit[old])
+
+        return text
+
+    def _apply_regex(self, match):
+        """
+prototype::
+    action = this method is used to do the replacements in the user's text
+             regarding the old texts found by ``self._regex``.
+        """
+        return self.asit[match.group(0)]
+
+    def _apply_asit(self, match):
+        """
+prototype::
+    action = this method is used to do the replacements in the user's text
+             regarding the words defined by ``self.pattern``.
+        """
+        return self.asit.get(match.group(1), match.group(0))
+
+# ------------------------- #
+# -- REPLACE IN A STREAM -- #
+# ------------------------- #
+
+    def _finditer(self, text):
+        """
+prototype::
+    arg = str: text ;
+          a text where to look for the replacements
+
+    yield = (int, int, str) ;
+            the replacements ``(start, end, new)`` to do, from left to right,
+            in the text
+        """
+        if self.recursive:
+            for match in self.pattern.finditer(text):
+                yield match.start(), match.end(), self._apply_asit(match)
+
+        elif self._automaton is not None:
+            for start, end, old in self._automaton.finditer(text):
+                yield start, end, self.asit[old]
+
+        elif self._regex is not None:
+            for match in self._regex.finditer(text):
+                yield match.start(), match.end(), self._apply_regex(match)
+
+        else:
+            raise ValueError(
+                "the engine ``sequential`` can't be used with streams "
+                '(use for example ``engine = "auto"``).'
+            )
+
+    def iterreplace(self, chunks):
+        """
+prototype::
+    see = self.stream
+
+    arg = iter(str): chunks ;
+          the successive pieces of a text
+
+    yield = str ;
+            the successive pieces of the text where all the replacements have
+            been done
+
+
+The end of each piece is kept, and added at the beginning of the next one, so
+as to find the old texts cut between two pieces. Here is an example.
+
+pyterm::
+    >>> from mistool.string_use import MultiReplace
+    >>> mreplace = MultiReplace({'one': "1", 'two': "2"}, engine = "auto")
+    >>> print("".join(mreplace.iterreplace(["on", "e, t", "wo, t", "hree"])))
+    1, 2, three
+
+
+info::
+    With the unrecursive replacements, the end kept has one character less
+    than the longest old text. With ``recursive = True``, a word found at the
+    end of one piece waits for the next piece, and the end kept has at least
+    ``PATTERN_OVERLAP`` characters, this length being supposed longer than
+    the words defined by ``pattern``.
+
+
+warning::
+    The engine ``"sequential"`` can't be used because its replacement texts
+    can be changed by the next replacements.
+        """
+        if self.recursive:
+            tail = self.PATTERN_OVERLAP
+
+        elif self._sortedkeys:
+            tail = len(self._sortedkeys[0]) - 1
+
+        else:
+            tail = 0
+
+# The engine is checked at once.
+        next(self._finditer(""), None)
+
+        carry = ""
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+
+            text = carry + chunk
+            safe = len(text) - tail
+
+            if safe <= 0:
+                carry = text
+                continue
+
+            pieces = []
+            last   = 0
+            stop   = None
+
+            for start, end, new in self._finditer(text):
+# The next replacements will be decided with the next piece.
+                if start >= safe:
+                    break
+
+# A word touching the end can continue in the next piece.
+                if self.recursive and end == len(text):
+                    stop = start
+                    break
+
+                pieces.append(text[last: start])
+                pieces.append(new)
+
+                last = end
+
+            if stop is None:
+                stop = max(last, safe)
+
+            pieces.append(text[last: stop])
+
+            carry = text[stop:]
+            piece = "".join(pieces)
+
+            if piece:
+                yield piece
+
+        if carry:
+            yield self(carry)
+
+    def stream(
+        self,
+        reader,
+        writer,
+        chunk_size = STREAM_CHUNK_SIZE
+    ):
+        """
+prototype::
+    see = self.iterreplace
+
+    arg = file: reader ;
+          a text file-like object having a method ``read``
+    arg = file: writer ;
+          a text file-like object having a method ``write``
+    arg = int: chunk_size = STREAM_CHUNK_SIZE ;
+          the number of characters read at each step
+
+    action = the text read in ``reader`` is written in ``writer`` after
+             doing all the replacements, the memory used being bounded
+
+
+Here is how to do the replacements in a big file.
+
+python::
+    from mistool.string_use import MultiReplace
+
+    mreplace = MultiReplace(oldnew, engine = "auto")
+
+    with open("big.log", "r") as reader, open("new.log", "w") as writer:
+        mreplace.stream(reader, writer)
+        """
+        chunks = iter(lambda: reader.read(chunk_size), "")
+
+        for piece in self.iterreplace(chunks):
+            writer.write(piece)
+
+# --------------------------- #
+# -- REPLACE IN MANY TEXTS -- #
+# --------------------------- #
+
+    def map(
+        self,
+        texts_or_paths,
+        workers  = None,
+        executor = PROCESS_EXECUTOR,
+        ordered  = True,
+        inplace  = False,
+        encoding = "utf-8"
+    ):
+        """
+prototype::
+    see = self.__call__
+
+    arg = iter(str , os.PathLike): texts_or_paths ;
+          some texts, or some paths of text files, or both
+    arg = int , None: workers = None ;
+          the number of workers, ``None`` being for the number of processors
+          of the computer
+    arg = str: executor = "process" in _MAP_EXECUTORS ;
+          the kind of workers to use
+    arg = bool: ordered = True ;
+          ``True`` asks to give the results in the order of the texts, and
+          ``False`` to give them as soon as they are ready
+    arg = bool: inplace = False ;
+          ``True`` asks to update the files with the texts after the
+          replacements
+    arg = str: encoding = "utf-8" ;
+          the encoding of the files
+
+    yield = str , os.PathLike , (int, str) , (int, os.PathLike) ;
+            the texts after the replacements, or the paths of the files
+            updated if ``inplace = True``, and with ``ordered = False`` each
+            result comes with the position of its text
+
+
+This method applies the same replacements to a lot of texts using several
+processes, or several threads. The instance is sent only one time to each
+worker. Here is how to update all the ¨python files of a folder.
+
+pyterm::
+    >>> from mistool.os_use import PPath
+    >>> from mistool.string_use import MultiReplace
+    >>> mreplace = MultiReplace({'oldname': "newname"}, engine = "auto")
+    >>> folder   = PPath("/Users/projetmbc/project")
+    >>> for path in mreplace.map(
+    ...     folder.walk("file::**.py"),
+    ...     inplace = True
+    ... ):
+    ...     print(path)
+
+
+info::
+    The files are updated atomically using ``PPath.write_atomic``, and they
+    are not rewritten if nothing has changed. The ends of lines, and the
+    permissions of the files, are kept.
+        """
+        from concurrent.futures import (
+            as_completed,
+            ProcessPoolExecutor,
+            ThreadPoolExecutor
+        )
+        from functools import partial
+
+        if executor not in _MAP_EXECUTORS:
+            raise ValueError(
+                'unknown executor ``{0}``.'.format(executor)
+            )
+
+        task = partial(_mapone, encoding = encoding, inplace = inplace)
+
+# The threads share the instance.
+        if executor == PROCESS_EXECUTOR:
+            pool = ProcessPoolExecutor(
+                max_workers = workers,
+                initializer = _mapinit,
+                initargs    = (self,)
+            )
+
+        else:
+            pool = ThreadPoolExecutor(max_workers = workers)
+            task = partial(task, mreplace = self)
+
+        with pool:
+            if ordered:
+                yield from pool.map(
+                    task,
+                    texts_or_paths,
+                    chunksize = self.MAP_CHUNK_SIZE
+                )
+
+            else:
+                futures = {
+                    pool.submit(task, item): i
+                    for i, item in enumerate(texts_or_paths)
+                }
+
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+
+
+# ----------- #
+# -- SPLIT -- #
+# ----------- #
+
+class SplitInfos:
+    """
+prototype::
+    see = MultiSplit
+
+    action = this class is simply an object used by the method ``__iter__`` of
+             the class ``MultiSplit``.
+    """
+    __slots__ = ("type", "val")
+
+    def __init__(
+        self,
+        type,
         val
     ):
         self.type = type
         self.val  = val
 
 
+def _searchable(view):
+    """
+prototype::
+    see = MultiSplit.offsets
+
+    arg = memoryview: view ;
+          a view of some bytes
+
+    return = bytes , mmap , bytearray ;
+             the object seen if it is entirely viewed and it has a method
+             ``find``, like the memory-mapped file of a view given by
+             ``PPath.mmap``, or else a copy of the bytes viewed
+    """
+    obj = view.obj
+
+    if hasattr(obj, "find") \
+    and view.c_contiguous \
+    and view.itemsize == 1 \
+    and view.nbytes == len(obj):
+        return obj
+
+    return view.tobytes()
+
+
+class SplitOffsets:
+    """
+prototype::
+    see = MultiSplit
+
+    arg-attr = str , bytes , mmap: text ;
+               the text splitted
+    arg-attr = list(array): bounds ;
+               for each level of separator, the flat array ``[start_0, end_0,
+               start_1, end_1, ...]`` of the positions of all the pieces of
+               this level
+    arg-attr = list(array): firsts ;
+               for each level of separator except the last one, the array
+               giving for each piece the index of its first subpiece in the
+               next level (a last index is added at the end of each array)
+    arg-attr = int: level = 0 ;
+               the level of the pieces looked at
+    arg-attr = int: first = 0 ;
+               the index of the first piece looked at
+    arg-attr = int , None: last = None ;
+               the index after the last piece looked at, ``None`` being for
+               all the pieces of the level
+
+    action = this class is a lazy list view of the pieces found by the
+             method ``offsets`` of the class ``MultiSplit``, the pieces of the
+             last level being only sliced when they are asked (for a text
+             which is not a string, a ``memoryview`` is used so as to not copy
+             the bytes).
+    """
+    __slots__ = ("text", "bounds", "firsts", "level", "first", "last")
+
+    def __init__(
+        self,
+        text,
+        bounds,
+        firsts,
+        level = 0,
+        first = 0,
+        last  = None
+    ):
+        if last is None:
+            last = len(bounds[level]) // 2
+
+        self.text   = text
+        self.bounds = bounds
+        self.firsts = firsts
+        self.level  = level
+        self.first  = first
+        self.last   = last
+
+    def __len__(self):
+        return self.last - self.first
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _index(self, i):
+        """
+prototype::
+    arg = int: i ;
+          an index, maybe negative, of a piece looked at
+
+    return = int ;
+             the index of the piece in the whole level
+        """
+        if i < 0:
+            i += len(self)
+
+        if not 0 <= i < len(self):
+            raise IndexError("index out of range.")
+
+        return self.first + i
+
+    def span(self, i):
+        """
+prototype::
+    arg = int: i ;
+          the index of a piece looked at
+
+    return = (int, int) ;
+             the positions ``(start, end)`` of the piece in ``self.text``
+        """
+        i      = 2*self._index(i)
+        bounds = self.bounds[self.level]
+
+        return bounds[i], bounds[i + 1]
+
+    def __getitem__(self, i):
+        """
+prototype::
+    arg = int: i ;
+          the index of a piece looked at
+
+    return = SplitOffsets , str , memoryview ;
+             the view of the subpieces of the piece, or the piece itself for
+             the last level
+        """
+        if self.level == len(self.bounds) - 1:
+            start, end = self.span(i)
+
+            if isinstance(self.text, str):
+                return self.text[start: end]
+
+            return memoryview(self.text)[start: end]
+
+        i      = self._index(i)
+        firsts = self.firsts[self.level]
+
+        return SplitOffsets(
+            text   = self.text,
+            bounds = self.bounds,
+            firsts = self.firsts,
+            level  = self.level + 1,
+            first  = firsts[i],
+            last   = firsts[i + 1]
+        )
+
+    def tolist(self):
+        """
+prototype::
+    return = listview ;
+             the list view of the pieces looked at, that is to say the same
+             list as the one built by ``MultiSplit.__call__``
+        """
+        if self.level == len(self.bounds) - 1:
+            return list(self)
+
+        return [x.tolist() for x in self]
+
+
 class MultiSplit():
     """
 prototype::
@@ -731,8 +1923,29 @@ warning::
     by ``msplit``.
     If you need to use another view stored in a variable ``anotherview`` for
     example, you can use ``for infos in msplit.iterate(anotherview):...``.
+
+
+=================
+Parsing big texts
+=================
+
+The method ``iterparse`` gives the same informations than ``iter``, with the
+level of each separator, without building any listview. It can also read a
+file piece by piece.
+
+python::
+    from mistool.string_use import MultiSplit
+
+    msplit = MultiSplit(seps = ["\\n", ";"], strip = True)
+
+    with open("big.csv", "r") as reader:
+        for level, kind, value in msplit.iterparse(reader):
+            ...
     """
 
+# Number of characters read at each step by ``iterparse``.
+    STREAM_CHUNK_SIZE = 1 << 20
+
     def __init__(
         self,
         seps,
@@ -776,90 +1989,293 @@ warning::
                         "or list of strings."
                     )
 
+        if "" in value:
+            raise ValueError(
+                "the variable << seps >> can't contain an empty string."
+            )
+
         self._seps = value
 
 # -------------- #
 # -- LISTVIEW -- #
 # -------------- #
 
-    def __call__(self, text):
+    def __call__(self, text):
+        """
+prototype::
+    see = self._build
+
+    arg = str: text ;
+          a text to be splitted.
+
+    return = listview ;
+             this method builds a list view version of the splitted text that
+             is a list of lists of lists of ... of lists of strings.
+             The minsize of the list is equal to the number of separators
+             (indeed, all the job is done recursively by ``self._build``).
+        """
+        self.listview = self._build(
+            text = text,
+            seps = self.seps
+        )
+
+        return self.listview
+
+    def _build(self, text, seps):
+        """
+prototype::
+    see = self._pieces
+
+    arg = str: text ;
+          a text to be splitted.
+    arg = list(str): seps ;
+          a list of separators (not necessary the user's list).
+
+    return = listview ;
+             a list view version of the splitted text, this list being made
+             recursively.
+        """
+# Split regarding one separator.
+        answer = self._pieces(text, seps[0])
+
+        if self.strip:
+            answer = [piece.strip() for piece in answer]
+
+# Split regarding other separators.
+        otherseps = seps[1:]
+
+        if otherseps:
+            answer = [
+                self._build(
+                    text = piece,
+                    seps = otherseps
+                )
+                for piece in answer
+            ]
+
+# The job has been done !
+        return answer
+
+    def _pieces(self, text, sep):
+        """
+prototype::
+    arg = str: text ;
+          a text to be splitted.
+    arg = str: sep ;
+          one separator
+
+    return = list(str) ;
+             the pieces of ``text`` found between the separators ``sep``, an
+             empty last piece being ignored
+
+
+info::
+    Without escaping sequence in the text, the job is done by the method
+    ``split`` of strings. Otherwise, the separators are found by the method
+    ``self._iterpieces`` using the method ``find`` of strings, a separator
+    being escaped if the piece before it ends with ``self.esc_char``.
+        """
+        if not self.esc_char or self.esc_char not in text:
+            pieces = text.split(sep)
+
+            if not pieces[-1]:
+                pieces.pop()
+
+        else:
+            pieces = list(self._iterpieces(text, sep))
+
+        return pieces
+
+    def _iterpieces(self, text, sep):
         """
 prototype::
-    see = self._build
+    see = self._pieces
 
     arg = str: text ;
           a text to be splitted.
+    arg = str: sep ;
+          one separator
 
-    return = listview ;
-             this method builds a list view version of the splitted text that
-             is a list of lists of lists of ... of lists of strings.
-             The minsize of the list is equal to the number of separators
-             (indeed, all the job is done recursively by ``self._build``).
+    yield = str ;
+            the pieces of ``text`` found between the separators ``sep``, an
+            empty last piece being ignored
         """
-        self.listview = self._build(
-            text = text,
-            seps = self.seps
-        )
+        esc_char = self.esc_char
+        lensep   = len(sep)
+        ilast    = 0
+        i        = text.find(sep)
 
-        return self.listview
+        while i != -1:
+# An escaped separator is just kept.
+            if esc_char and text.endswith(esc_char, ilast, i):
+                i = text.find(sep, i + 1)
+                continue
 
-    def _build(self, text, seps):
+            yield text[ilast: i]
+
+            ilast = i + lensep
+            i     = text.find(sep, ilast)
+
+        if ilast < len(text):
+            yield text[ilast:]
+
+# ------------- #
+# -- OFFSETS -- #
+# ------------- #
+
+    def offsets(
+        self,
+        text,
+        encoding = "utf-8"
+    ):
         """
 prototype::
-    arg = str: text ;
-          a text to be splitted.
-    arg = list(str): seps ;
-          a list of separators (not necessary the user's list).
+    see = SplitOffsets , self._offsetpieces
 
-    return = listview ;
-             a list view version of the splitted text, this list being made
-             recursively.
+    arg = str , bytes , mmap , memoryview: text ;
+          a text to be splitted (it must have a method ``find`` like the
+          strings, the bytes and the memory-mapped files, or be a view of
+          bytes like the ones given by ``PPath.mmap``)
+    arg = str: encoding = "utf-8" ;
+          the encoding used for the separators and the escaping sequence if
+          ``text`` is not a string
+
+    return = SplitOffsets ;
+             a lazy list view giving the same pieces as ``self(text)``, but
+             only the positions of the pieces are stored
+
+
+The positions of all the pieces of one level are stored in a single compact
+array of integers, so no string is built for each piece. The pieces are only
+sliced when they are asked.
+
+pyterm::
+    >>> from mistool.string_use import MultiSplit
+    >>> msplit = MultiSplit(seps = ["|", ";"], strip = True)
+    >>> view = msplit.offsets("p_1 ; p_2 | r_1")
+    >>> print(view[0].span(1))
+    (6, 9)
+    >>> print(view[0][1])
+    p_2
+    >>> print(view.tolist())
+    [['p_1', 'p_2'], ['r_1']]
         """
-# Split regarding one separator.
-        thissep = seps[0]
-        lensep  = len(thissep)
-        answer  = []
-        imax    = len(text)
-        i       = 0
-        ilast   = 0
+        seps     = self.seps
+        esc_char = self.esc_char
+
+        if isinstance(text, memoryview):
+            text = _searchable(text)
+
+        if not isinstance(text, str):
+            seps     = [sep.encode(encoding) for sep in seps]
+            esc_char = esc_char.encode(encoding)
+
+        parents = array('q', [0, len(text)])
+        bounds  = []
+        firsts  = []
+
+# Each level is built from the pieces of the previous one.
+        for level, sep in enumerate(seps):
+            pieces = array('q')
+
+            if level:
+                first = array('q')
+                firsts.append(first)
+
+            for i in range(0, len(parents), 2):
+                if level:
+                    first.append(len(pieces) // 2)
+
+                self._offsetpieces(
+                    text     = text,
+                    sep      = sep,
+                    esc_char = esc_char,
+                    start    = parents[i],
+                    end      = parents[i + 1],
+                    pieces   = pieces
+                )
 
-        while(i < imax):
-            if text[i:].startswith(thissep):
-                lastpiece = text[ilast: i]
+            if level:
+                first.append(len(pieces) // 2)
 
-                if not(self.esc_char and lastpiece.endswith(self.esc_char)):
-                    i    += lensep
-                    ilast = i
+            bounds.append(pieces)
+            parents = pieces
 
-                    if self.strip:
-                        lastpiece = lastpiece.strip()
+        return SplitOffsets(text, bounds, firsts)
 
-                    answer.append(lastpiece)
+    def _offsetpieces(
+        self,
+        text,
+        sep,
+        esc_char,
+        start,
+        end,
+        pieces
+    ):
+        """
+prototype::
+    see = self._iterpieces
 
-            i += 1
+    arg = str , bytes , mmap: text ;
+          a text to be splitted.
+    arg = str , bytes: sep ;
+          one separator
+    arg = str , bytes: esc_char ;
+          the escaping sequence
+    arg = int: start ;
+          the position where the piece of text to split starts
+    arg = int: end ;
+          the position where the piece of text to split ends
+    arg = array: pieces ;
+          the array where to add the positions of the pieces found
+
+    action = the positions of the pieces of ``text[start: end]`` found
+             between the separators ``sep``, an empty last piece being
+             ignored, are added at the end of ``pieces``
+        """
+        lensep = len(sep)
+        lenesc = len(esc_char)
+        ilast  = start
+        i      = text.find(sep, start, end)
 
-        endtext = text[ilast:]
+        while i != -1:
+# An escaped separator is just kept.
+            if esc_char \
+            and i - lenesc >= ilast \
+            and text[i - lenesc: i] == esc_char:
+                i = text.find(sep, i + 1, end)
+                continue
 
-        if endtext:
-            if self.strip:
-                endtext = endtext.strip()
+            pieces.extend(self._stripped(text, ilast, i))
 
-            answer.append(endtext)
+            ilast = i + lensep
+            i     = text.find(sep, ilast, end)
 
-# Split regarding other separators.
-        otherseps = seps[1:]
+        if ilast < end:
+            pieces.extend(self._stripped(text, ilast, end))
 
-        if otherseps:
-            answer = [
-                self._build(
-                    text   = piece,
-                    seps   = otherseps
-                )
-                for piece in answer
-            ]
+    def _stripped(self, text, start, end):
+        """
+prototype::
+    arg = str , bytes , mmap: text ;
+          a text
+    arg = int: start ;
+          the position where a piece of text starts
+    arg = int: end ;
+          the position where a piece of text ends
+
+    return = (int, int) ;
+             the positions of the piece of text, without its leading and
+             ending spaces if ``self.strip = True``
+        """
+        if self.strip:
+            while start < end and text[start: start + 1].isspace():
+                start += 1
 
-# The job has been done !
-        return answer
+            while start < end and text[end - 1: end].isspace():
+                end -= 1
+
+        return start, end
 
 # ------------------------------------ #
 # -- ITERATE EASILY IN THE LISTVIEW -- #
@@ -919,94 +2335,581 @@ prototype::
                     ):
                         yield y
 
+# ------------------ #
+# -- LAZY PARSING -- #
+# ------------------ #
+
+    def iterparse(
+        self,
+        text_or_stream,
+        chunk_size = STREAM_CHUNK_SIZE
+    ):
+        """
+prototype::
+    see = self.iter
+
+    arg = str , file , iter(str): text_or_stream ;
+          a text to be splitted, or a text file-like object having a method
+          ``read``, or the successive pieces of a text
+    arg = int: chunk_size = STREAM_CHUNK_SIZE ;
+          the number of characters read at each step in a file-like object
+
+    yield = (int, str, str) ;
+            the events ``(level, kind, value)`` where ``kind`` is either
+            ``"sep"`` or ``"val"``, ``level`` being the level of the separator
+            used, these events coming in the same order as the ones given by
+            ``self.iter``
+
+
+No listview is built, and with a stream the text is read piece by piece, so
+the memory used only depends on the size of the pieces found with the first
+separator.
+
+pyterm::
+    >>> from mistool.string_use import MultiSplit
+    >>> msplit = MultiSplit(
+    ...     seps  = ["|", ";"],
+    ...     strip = True
+    ... )
+    >>> for event in msplit.iterparse(["p_1 ; p", "_2 | r_1 |"]):
+    ...     print(event)
+    ...
+    (0, 'sep', '|')
+    (1, 'sep', ';')
+    (1, 'val', 'p_1')
+    (1, 'val', 'p_2')
+    (0, 'sep', '|')
+    (1, 'sep', ';')
+    (1, 'val', 'r_1')
+        """
+        if isinstance(text_or_stream, str):
+            pieces = self._iterpieces(text_or_stream, self.seps[0])
+
+        else:
+            if hasattr(text_or_stream, "read"):
+                chunks = iter(
+                    lambda: text_or_stream.read(chunk_size),
+                    ""
+                )
+
+            else:
+                chunks = text_or_stream
+
+            pieces = self._iterstreampieces(chunks, self.seps[0])
+
+        return self._iterevents(pieces, level = 0)
+
+    def _iterstreampieces(self, chunks, sep):
+        """
+prototype::
+    see = self._iterpieces
+
+    arg = iter(str): chunks ;
+          the successive pieces of a text
+    arg = str: sep ;
+          one separator
+
+    yield = str ;
+            the pieces of the whole text found between the separators ``sep``,
+            an empty last piece being ignored
+
+
+info::
+    Only the piece being read is kept, and a separator cut between two chunks
+    is found because the search starts again ``len(sep) - 1`` characters
+    before the end of the piece kept.
+        """
+        esc_char  = self.esc_char
+        lensep    = len(sep)
+        piece     = ""
+        startfind = 0
+
+        for chunk in chunks:
+            piece += chunk
+            ilast  = 0
+            i      = piece.find(sep, startfind)
+
+            while i != -1:
+# An escaped separator is just kept.
+                if esc_char and piece.endswith(esc_char, ilast, i):
+                    i = piece.find(sep, i + 1)
+                    continue
+
+                yield piece[ilast: i]
+
+                ilast = i + lensep
+                i     = piece.find(sep, ilast)
+
+            piece     = piece[ilast:]
+            startfind = max(0, len(piece) - lensep + 1)
+
+        if piece:
+            yield piece
+
+    def _iterevents(self, pieces, level):
+        """
+prototype::
+    see = self.iterparse
+
+    arg = iter(str): pieces ;
+          the pieces of text found with the separator of level ``level``
+    arg = int: level ;
+          the level of the separator used
+
+    yield = (int, str, str) ;
+            the events ``(level, kind, value)`` for the pieces and their
+            subpieces
+        """
+        sep    = self.seps[level]
+        isleaf = level == len(self.seps) - 1
+        noval  = True
+
+        for piece in pieces:
+            if self.strip:
+                piece = piece.strip()
+
+# The values are announced by only one separator.
+            if isleaf:
+                if noval:
+                    noval = False
+                    yield level, "sep", sep
+
+                yield level, "val", piece
+
+            else:
+                yield level, "sep", sep
+
+                yield from self._iterevents(
+                    pieces = self._iterpieces(piece, self.seps[level + 1]),
+                    level  = level + 1
+                )
+
+
+def between(
+    text,
+    seps,
+    keepseps = False
+):
+    """
+prototype::
+    arg = str: text ;
+          the text that must be splitted
+    arg = [str, str]: seps ;
+          ``seps[0]`` is the start delimiter and ``seps[1]`` the end delimiter,
+          none of this strings can be empty
+    arg = bool: keepseps = False ;
+          tghis is ti have or not the separators in the "before" and the
+          "after" texts
+
+    return = [str, str, str] , None ;
+             **if nothing has been found**, the function will return ``None``, But if not, ``[before, between, after]`` is returned where
+             ``between`` is the piece of text between the first ``seps[0]``
+             and ``seps[1]``, in this order, that have been found in ``text``.
+             If ``keepseps = False``, then ``before`` is just before
+             ``seps[0]``, and ``after`` just after ``seps[1]``, but **if nothing
+             has been found**, the function will return ``None``.
+             But if ``keepseps = True``, then ``before`` will finsih by
+             ``seps[0]``, and ``after`` will start by ``seps[1]``.
+
+
+Here is an example of use where the value ``None`` is a soft way to say that
+nothing has been found.
+
+pyterm::
+    >>> from mistool.string_use import between
+    >>> text = "f(x ; y) = x**2 + y**2"
+    >>> seps = ["(", ")"]
+    >>> print(between(text, seps))
+    [
+        'f',                # Before
+        'x ; y',            # Between
+        ' = x**2 + y**2'    # After
+    ]
+    >>> print(between(text, seps, True))
+    [
+        'f(',               # Before
+        'x ; y',            # Between
+        ') = x**2 + y**2'   # After
+    ]
+    >>> seps = ["{", "}"]
+    >>> print(between(text, seps))
+    None
+    """
+    _checkbetweenseps(seps)
+
+    start, end = seps
+
+    s = text.find(start)
+
+# The starting text has not been found.
+    if s == -1:
+        return None
+
+    sbis = s + len(start)
+
+    e = text.find(end, sbis)
+
+# The ending text has not been found after the starting text.
+    if e == -1:
+        return None
+
+    before, inside, after = text[:s], text[sbis:e], text[e + len(end):]
+
+    if start in inside:
+        raise ValueError(
+            'separator << {0} >> found in the "inside" content'.format(
+                start
+            )
+        )
+
+    if keepseps:
+        before += start
+        after  = end + after
+
+    return [before, inside, after]
+
+
+def _checkbetweenseps(seps):
+    """
+prototype::
+    see = between
+
+    arg = [str, str]: seps ;
+          a start delimiter and an end delimiter
+
+    action = this function raises an error if ``seps`` is not a list of two
+             non-empty strings
+    """
+    if not isinstance(seps, list) or len(seps) != 2 \
+    or not isinstance(seps[0], str) or not isinstance(seps[1], str) \
+    or seps[0] == "" or seps[1] == "":
+        raise ValueError(
+            'the variable << seps >> must be a list of two non-empty strings.'
+        )
+
+
+def iterbetween(
+    text,
+    seps,
+    keepseps = False
+):
+    """
+prototype::
+    see = between , betweenall
+
+    arg = str: text ;
+          the text where to look for the pieces between the delimiters
+    arg = [str, str] , list([str, str]): seps ;
+          ``[start, end]`` for one pair of delimiters, or a list of such
+          pairs, none of the delimiters can be empty
+    arg = bool: keepseps = False ;
+          this is to have or not the separators in the "before" and the
+          "after" texts
+
+    yield = (int, str, int) ;
+            ``(before_offset, inside, after_offset)`` for each piece of text
+            found between a start delimiter and the next corresponding end
+            delimiter, ``text[:before_offset]`` and ``text[after_offset:]``
+            being the "before" and the "after" texts of ``between``
+
+
+The text is read only one time, from left to right. With several pairs of
+delimiters, the start delimiter found first is used, the longest one being
+chosen if several start delimiters are found at the same place.
+
+pyterm::
+    >>> from mistool.string_use import iterbetween
+    >>> text = "f(x) = [x] + (1)"
+    >>> for before, inside, after in iterbetween(text, [["(", ")"], ["[", "]"]]):
+    ...     print(before, inside, after)
+    ...
+    1 x 4
+    7 x 10
+    13 1 16
+
+
+warning::
+    Like with ``between``, an error is raised if a start delimiter is found
+    inside one piece of text.
+    """
+    if isinstance(seps, list) and seps and isinstance(seps[0], list):
+        pairs = seps
+
+    else:
+        pairs = [seps]
+
+    for pair in pairs:
+        _checkbetweenseps(pair)
+
+    nextstarts = [text.find(start) for start, _ in pairs]
+    pos        = 0
+
+    while True:
+# The first start delimiter, and the longest one at the same place.
+        best = None
+
+        for i, (start, _) in enumerate(pairs):
+            s = nextstarts[i]
+
+            if s != -1 and s < pos:
+                s = nextstarts[i] = text.find(start, pos)
+
+            if s == -1:
+                continue
+
+            if best is None \
+            or s < nextstarts[best] \
+            or (s == nextstarts[best] and len(start) > len(pairs[best][0])):
+                best = i
+
+        if best is None:
+            return None
+
+        start, end = pairs[best]
+
+        s    = nextstarts[best]
+        sbis = s + len(start)
+        e    = text.find(end, sbis)
+
+# This pair of delimiters can't be found anymore.
+        if e == -1:
+            nextstarts[best] = -1
+            continue
+
+        inside = text[sbis: e]
+
+        if start in inside:
+            raise ValueError(
+                'separator << {0} >> found in the "inside" content'.format(
+                    start
+                )
+            )
+
+        pos = e + len(end)
+
+        if keepseps:
+            yield sbis, inside, e
+
+        else:
+            yield s, inside, pos
 
-def between(
+
+def betweenall(
     text,
     seps,
     keepseps = False
 ):
     """
 prototype::
+    see = iterbetween
+
     arg = str: text ;
-          the text that must be splitted
-    arg = [str, str]: seps ;
-          ``seps[0]`` is the start delimiter and ``seps[1]`` the end delimiter,
-          none of this strings can be empty
+          the text where to look for the pieces between the delimiters
+    arg = [str, str] , list([str, str]): seps ;
+          ``[start, end]`` for one pair of delimiters, or a list of such
+          pairs
     arg = bool: keepseps = False ;
-          tghis is ti have or not the separators in the "before" and the
+          this is to have or not the separators in the "before" and the
           "after" texts
 
-    return = [str, str, str] , None ;
-             **if nothing has been found**, the function will return ``None``, But if not, ``[before, between, after]`` is returned where
-             ``between`` is the piece of text between the first ``seps[0]``
-             and ``seps[1]``, in this order, that have been found in ``text``.
-             If ``keepseps = False``, then ``before`` is just before
-             ``seps[0]``, and ``after`` just after ``seps[1]``, but **if nothing
-             has been found**, the function will return ``None``.
-             But if ``keepseps = True``, then ``before`` will finsih by
-             ``seps[0]``, and ``after`` will start by ``seps[1]``.
+    return = list((int, str, int)) ;
+             the list of all the ``(before_offset, inside, after_offset)``
+             given by ``iterbetween``
+    """
+    return list(iterbetween(text, seps, keepseps))
 
 
-Here is an example of use where the value ``None`` is a soft way to say that
-nothing has been found.
+def iterbalanced(
+    text_or_stream,
+    seps,
+    esc_char   = "",
+    chunk_size = 1 << 20
+):
+    """
+prototype::
+    see = balanced , iterbetween
+
+    arg = str , file , iter(str): text_or_stream ;
+          a text, or a text file-like object having a method ``read``, or the
+          successive pieces of a text
+    arg = [str, str] , list([str, str]): seps ;
+          ``[start, end]`` for one pair of delimiters, or a list of such
+          pairs, the delimiters of one pair being different non-empty
+          strings
+    arg = str: esc_char = "" ;
+          an escaping sequence for the delimiters, ``esc_char = ""``
+          indicating that there is no escaping feature
+    arg = int: chunk_size = 1 << 20 ;
+          the number of characters read at each step in a file-like object
+
+    yield = (int, int, list) ;
+            for each piece of text between a start delimiter and its
+            balanced end delimiter, that is not inside another piece, the
+            tree ``(start, end, children)`` where ``text[start:end]`` is the
+            content without the delimiters, and ``children`` is the list of
+            the trees of the pieces found inside this content
+
+
+The delimiters are found in one single pass, a stack being used to know the
+pieces not yet closed. The trees are given as soon as they are closed, so a
+big text can be read piece by piece. A delimiter is escaped if the text since
+the last delimiter not escaped ends with ``esc_char``, like with the class
+``MultiSplit``.
 
 pyterm::
-    >>> from mistool.string_use import between
-    >>> text = "f(x ; y) = x**2 + y**2"
-    >>> seps = ["(", ")"]
-    >>> print(between(text, seps))
-    [
-        'f',                # Before
-        'x ; y',            # Between
-        ' = x**2 + y**2'    # After
-    ]
-    >>> print(between(text, seps, True))
-    [
-        'f(',               # Before
-        'x ; y',            # Between
-        ') = x**2 + y**2'   # After
-    ]
-    >>> seps = ["{", "}"]
-    >>> print(between(text, seps))
-    None
+    >>> from mistool.string_use import iterbalanced
+    >>> for tree in iterbalanced("a{b{c}d}e{f}", ["{", "}"]):
+    ...     print(tree)
+    ...
+    (2, 7, [(4, 5, [])])
+    (10, 11, [])
+
+
+warning::
+    An error is raised if an end delimiter has no start delimiter, or if a
+    start delimiter is never closed.
     """
-    if not isinstance(seps, list) or len(seps) != 2 \
-    or not isinstance(seps[0], str) or not isinstance(seps[1], str) \
-    or seps[0] == "" or seps[1] == "":
-        raise ValueError(
-            'the variable << seps >> must be a list of two non-empty strings.'
-        )
+    if isinstance(seps, list) and seps and isinstance(seps[0], list):
+        pairs = seps
 
-    start, end = seps
+    else:
+        pairs = [seps]
 
-    s = text.find(start)
+    for pair in pairs:
+        _checkbetweenseps(pair)
 
-# The starting text has not been found.
-    if s == -1:
-        return None
+        if pair[0] == pair[1]:
+            raise ValueError(
+                'the delimiters << {0} >> must be different.'.format(pair[0])
+            )
 
-    sbis = s + len(start)
+    ends = {}
 
-    e = text.find(end, sbis)
+    for start, end in pairs:
+        ends.setdefault(start, end)
 
-# The ending text has not been found after the starting text.
-    if e == -1:
-        return None
+    delims = sorted(
+        set(ends) | set(ends.values()),
+        key = lambda t: (-len(t), t)
+    )
 
-    before, inside, after = text[:s], text[sbis:e], text[e + len(end):]
+    import re
+
+    pattern = re.compile("|".join(re.escape(x) for x in delims))
+    overlap = len(delims[0]) - 1
+    lenesc  = len(esc_char)
+
+    if isinstance(text_or_stream, str):
+        chunks = [text_or_stream]
+
+    elif hasattr(text_or_stream, "read"):
+        chunks = iter(lambda: text_or_stream.read(chunk_size), "")
+
+    else:
+        chunks = text_or_stream
+
+# ``stack`` contains ``[start, end delimiter, children, start delimiter,
+# position]`` for the pieces not yet closed, and ``buffer[0]`` is at the
+# position ``base`` in the text.
+    stack   = []
+    buffer  = ""
+    base    = 0
+    scanpos = 0
+    lastend = 0
+
+    chunks = iter(chunks)
+    chunk  = next(chunks, None)
+
+    while chunk is not None:
+        buffer += chunk
+        chunk   = next(chunks, None)
+
+# A delimiter starting at ``limit`` or after can be cut by the next chunk.
+        if chunk is None:
+            limit = len(buffer)
+
+        else:
+            limit = len(buffer) - overlap
+
+        for match in pattern.finditer(buffer, scanpos):
+            if match.start() >= limit:
+                break
+
+            delim = match.group()
+            pos   = base + match.start()
+
+            scanpos = match.end()
+
+# An escaped delimiter is just ignored.
+            if esc_char \
+            and pos - lenesc >= lastend \
+            and buffer[match.start() - lenesc: match.start()] == esc_char:
+                continue
+
+            lastend = base + match.end()
+
+            if stack and delim == stack[-1][1]:
+                start, _, children, _, _ = stack.pop()
+                tree                     = (start, pos, children)
+
+                if stack:
+                    stack[-1][2].append(tree)
+
+                else:
+                    yield tree
+
+            elif delim in ends:
+                stack.append([lastend, ends[delim], [], delim, pos])
+
+            else:
+                raise ValueError(
+                    'unbalanced delimiter << {0} >> at position {1}.'.format(
+                        delim, pos
+                    )
+                )
+
+# Nothing before ``limit`` can start a new delimiter, but the escaping sequence
+# just before a delimiter must be kept.
+        scanpos = max(scanpos, limit)
+
+# Only the end of the text needed by the next search is kept.
+        cut     = max(0, scanpos - lenesc)
+        buffer  = buffer[cut:]
+        base    += cut
+        scanpos -= cut
+
+    if stack:
+        _, _, _, delim, pos = stack[-1]
 
-    if start in inside:
         raise ValueError(
-            'separator << {0} >> found in the "inside" content'.format(
-                start
+            'delimiter << {0} >> at position {1} is never closed.'.format(
+                delim, pos
             )
         )
 
-    if keepseps:
-        before += start
-        after  = end + after
 
-    return [before, inside, after]
+def balanced(
+    text,
+    seps,
+    esc_char = ""
+):
+    """
+prototype::
+    see = iterbalanced
+
+    arg = str: text ;
+          a text
+    arg = [str, str] , list([str, str]): seps ;
+          ``[start, end]`` for one pair of delimiters, or a list of such
+          pairs
+    arg = str: esc_char = "" ;
+          an escaping sequence for the delimiters
+
+    return = list((int, int, list)) ;
+             the list of the trees ``(start, end, children)`` given by
+             ``iterbalanced``
+    """
+    return list(iterbalanced(text, seps, esc_char))
 
 
 # ---------- #
@@ -1059,11 +2962,18 @@ pyterm::
 # -- ASCII TRANSLATION OF AN UTF8 TEXT -- #
 # --------------------------------------- #
 
-def isascii(text):
+def isascii(
+    text,
+    printable = True
+):
     """
 prototype::
     arg = str: text ;
           the text to be tested
+    arg = bool: printable = True ;
+          ``True`` asks to only accept the printable ¨ascii characters, that
+          is to say the ones in ``ASCII_CHARS``, and ``False`` to accept all
+          the ¨ascii characters, like ``\\n`` and ``\\t``
 
     return = bool ;
              ``True`` if the text contains only ¨ascii characters, or ``False``
@@ -1077,31 +2987,311 @@ pyterm::
     True
     >>> print(isascii("¡Viva España!"))
     False
+    >>> print(isascii("Vive\\nla France !"))
+    False
+    >>> print(isascii("Vive\\nla France !", printable = False))
+    True
+    """
+    if printable:
+        return text.isascii() and text.isprintable()
+
+    return text.isascii()
+
+
+def first_non_ascii(
+    text,
+    printable = True
+):
+    """
+prototype::
+    see = isascii
+
+    arg = str , bytes: text ;
+          the text to be tested
+    arg = bool: printable = True ;
+          the same argument as for ``isascii``
+
+    return = int ;
+             the position of the first character that is not ¨ascii, or
+             ``-1`` if there is no such character
+
+pyterm::
+    >>> from mistool.string_use import first_non_ascii
+    >>> print(first_non_ascii("¡Viva España!"))
+    0
+    >>> print(first_non_ascii("Viva España!"))
+    7
+    >>> print(first_non_ascii("Viva Espana!"))
+    -1
     """
-    return bool(set(text) <= ASCII_CHARS)
+    found = _nonasciiregex(
+        binary    = not isinstance(text, str),
+        printable = printable
+    ).search(text)
+
+    if found is None:
+        return -1
+
+    return found.start()
+
+
+def isascii_stream(
+    reader,
+    printable  = True,
+    chunk_size = 1 << 20
+):
+    """
+prototype::
+    see = isascii
+
+    arg = file: reader ;
+          a text or binary file-like object having a method ``read``
+    arg = bool: printable = True ;
+          the same argument as for ``isascii``
+    arg = int: chunk_size = 1 << 20 ;
+          the number of characters, or bytes, read at each step
+
+    return = bool ;
+             ``True`` if the content read contains only ¨ascii characters, or
+             ``False`` if not, the reading being stopped as soon as possible
+
+
+Here is how to test a big file using a bounded memory.
+
+python::
+    from mistool.string_use import isascii_stream
+
+    with open("big.csv", "rb") as reader:
+        print(isascii_stream(reader, printable = False))
+    """
+    while True:
+        chunk = reader.read(chunk_size)
+
+        if not chunk:
+            break
+
+        if not chunk.isascii():
+            return False
+
+        if printable and _nonasciiregex(
+            binary    = not isinstance(chunk, str),
+            printable = True
+        ).search(chunk) is not None:
+            return False
+
+    return True
+
+
+@lru_cache(maxsize = None)
+def _nonasciiregex(binary, printable):
+    """
+prototype::
+    arg = bool: binary ;
+          ``True`` for a regex working with bytes, and ``False`` for one
+          working with strings
+    arg = bool: printable ;
+          the same argument as for ``isascii``
+
+    return = regex ;
+             the regex looking for the characters that are not ¨ascii, this
+             regex being only compiled the first time it is asked
+    """
+    import re
+
+    pattern = "[^\x20-\x7e]" if printable else "[^\x00-\x7f]"
+
+    if binary:
+        pattern = pattern.encode('ascii')
+
+    return re.compile(pattern)
+
+
+# Ranges of characters used to build the table of ``_asciitable``.
+_ASCII_TABLE_RANGES = [
+    (0x0080, 0x0250),   # Latin-1 Supplement, Latin Extended-A and B
+    (0x0370, 0x0530),   # Greek, Coptic, Cyrillic and its supplement
+    (0x1E00, 0x2070),   # Latin Extended Additional, Greek Extended and
+                        # General Punctuation
+]
+
+
+_ASCII_ENGINES = UNICODE_NAME, NFKD \
+               = 'name', 'nfkd'
+
+# Batches used by ``asciify_many`` with several processes.
+ASCIIFY_MANY_MIN_PROCESS = 10000
+ASCIIFY_MANY_CHUNK_SIZE  = 256
+
+# Characters that the NFKD decomposition can't give in ascii.
+_ASCII_OVERRIDES = {
+    'ß': "ss", 'ẞ': "SS",
+    'æ': "ae", 'Æ': "AE",
+    'œ': "oe", 'Œ': "OE",
+    'ø': "o" , 'Ø': "O" ,
+    'ł': "l" , 'Ł': "L" ,
+    'đ': "d" , 'Đ': "D" ,
+    'ð': "d" , 'Ð': "D" ,
+    'þ': "th", 'Þ': "TH",
+    'ı': "i" ,
+    '⁄': "/" ,
+}
+
+
+def _asciiname(onechar):
+    """
+prototype::
+    arg = str: onechar ;
+          one non-¨ascii character
+
+    return = str , None ;
+             the ¨ascii version of ``onechar`` guessed from its Unicode name,
+             or ``None`` if nothing has been found
+    """
+    try:
+        infos = ucname(onechar).split(" ")
+
+    except ValueError:
+        return None
+
+    asciichar = None
+
+    if "SMALL" in infos:
+        caseformat = LOWER
+
+    else:
+        caseformat = UPPER
+
+# The last word can't be the one to use.
+    if "LETTER" in infos[:-1]:
+        i = infos.index("LETTER")
+        asciichar = infos[i + 1]
+
+    elif "LIGATURE" in infos[:-1]:
+        i = infos.index("LIGATURE")
+        asciichar = infos[i + 1]
+
+    elif "MARK" in infos:
+        asciichar = ""
+
+    if asciichar is not None:
+        asciichar = case(
+            text = asciichar,
+            kind = caseformat
+        )
+
+    return asciichar
+
+
+@lru_cache(maxsize = 4096)
+def _asciichar(onechar, engine = UNICODE_NAME):
+    """
+prototype::
+    see = _asciiname
+
+    arg = str: onechar ;
+          one non-¨ascii character
+    arg = str: engine = "name" in _ASCII_ENGINES ;
+          the way to find the ¨ascii version of ``onechar``
+
+    return = str , None ;
+             the ¨ascii version of ``onechar``, or ``None`` if nothing has
+             been found
+
+
+info::
+    With ``engine = "nfkd"``, the character is decomposed using the NFKD
+    normalization, the combining marks are removed, and then the characters
+    in ``_ASCII_OVERRIDES`` are replaced. The Unicode names are only used for
+    the characters still not in ¨ascii.
+    """
+    if engine == UNICODE_NAME:
+        return _asciiname(onechar)
+
+    pieces = []
+
+    for char in normalize("NFKD", onechar):
+        if combining(char):
+            continue
+
+        char = _ASCII_OVERRIDES.get(char, char)
+
+        if not char.isascii():
+            char = _asciiname(char)
+
+            if char is None:
+                return None
+
+        pieces.append(char)
+
+    return "".join(pieces)
+
+
+@lru_cache(maxsize = None)
+def _asciitable(engine = UNICODE_NAME):
+    """
+prototype::
+    see = _asciichar
+
+    arg = str: engine = "name" in _ASCII_ENGINES ;
+          the way to find the ¨ascii versions
+
+    return = list(str) ;
+             the table for the method ``translate`` of strings giving the
+             ¨ascii versions of the characters in ``_ASCII_TABLE_RANGES``
+             (this table is built only once)
+
+
+info::
+    A list indexed by the code points is faster than a dictionary with the
+    method ``translate``, so the characters without ¨ascii version are just
+    kept in the table.
+    """
+    table = [chr(code) for code in range(_ASCII_TABLE_RANGES[-1][1])]
+
+    for start, end in _ASCII_TABLE_RANGES:
+        for code in range(start, end):
+            asciichar = _asciichar.__wrapped__(chr(code), engine)
+
+            if asciichar is not None:
+                table[code] = asciichar
+
+    return table
 
 
 def asciify(
     text,
-    oldnew = {},
-    strict = True
+    oldnew = None,
+    strict = True,
+    engine = UNICODE_NAME
 ):
     """
 prototype::
     arg = str: text ;
           the text to be translated
-    arg = {str: str}: oldnew = {} ;
+    arg = {str: str} , None: oldnew = None ;
           this dictionary uses couples ``(key, value)`` that are of the kind
-          ``(non-ascii character, ascii version)``
+          ``(non-ascii character, ascii version)``, these replacements being
+          done before the default ones
     arg = bool: strict = True ;
           ``strict = True`` indicates to raise an error when the translation
           can only be partial, and with ``strict = True`` no error will be
           raised
+    arg = str: engine = "name" in _ASCII_ENGINES ;
+          the way to find the ¨ascii versions of the characters (see the
+          section "Engines" below)
 
     return = str ;
              a partial or total ¨ascii version of ``text``
 
 
+info::
+    The ¨ascii versions of the Latin, Greek and Cyrillic letters, and of the
+    Latin punctuation marks, are computed only once, the first time they are
+    needed, and they are stored in a table used with the method ``translate``
+    of strings. The other characters are managed one by one, and the results
+    are cached.
+
+
 =========
 Basic use
 =========
@@ -1130,6 +3320,24 @@ pyterm::
     Viva Espana
 
 
+=======
+Engines
+=======
+
+By default, ``engine = "name"`` guesses the ¨ascii version of a character from
+its Unicode name. With ``engine = "nfkd"``, the characters are first decomposed
+using the NFKD normalization, and the combining marks, like the accents, are
+removed. This second engine knows more characters, for example the ones of the
+mathematical alphabets, and it gives better results for some letters.
+
+pyterm::
+    >>> from mistool.string_use import asciify
+    >>> print(asciify("Straße ½", engine = "nfkd"))
+    Strasse 1/2
+    >>> print(asciify("Straße", strict = False))
+    Strasharpe
+
+
 ================
 Partial cleaning
 ================
@@ -1198,44 +3406,99 @@ It's easy to increase the list of special characters managed by default.
             b >>> 𝛃 : MATHEMATICAL BOLD SMALL BETA
             a >>> 𝛂 : MATHEMATICAL BOLD SMALL ALPHA
     """
-    for onechar in set(text) - ASCII_CHARS:
-        if onechar not in oldnew:
-            infos = ucname(onechar).split(" ")
+    if engine not in _ASCII_ENGINES:
+        raise ValueError(
+            'unknown engine ``{0}``.'.format(engine)
+        )
 
-            asciichar = None
+    if oldnew:
+        text = MultiReplace(oldnew)(text)
 
-            if "SMALL" in infos:
-                caseformat = LOWER
+    if text.isascii():
+        return text
 
-            else:
-                caseformat = UPPER
+    text = text.translate(_asciitable(engine))
 
-            if "LETTER" in infos:
-                i = infos.index("LETTER")
-                asciichar = infos[i + 1]
+    if text.isascii():
+        return text
 
-            elif "LIGATURE" in infos:
-                i = infos.find("LIGATURE")
-                asciichar = infos[i + 1]
+# Characters not in the table, or without ascii version in the table.
+    for onechar in dict.fromkeys(
+        _nonasciiregex(binary = False, printable = False).findall(text)
+    ):
+        asciichar = _asciichar(onechar, engine)
 
-            elif "MARK" in infos:
-                asciichar = ""
+        if asciichar is not None:
+            text = text.replace(onechar, asciichar)
 
-            if asciichar is not None:
-                oldnew[onechar] = case(
-                    text = asciichar,
-                    kind = caseformat
-                )
+        elif strict:
+            raise ValueError(
+                "ASCII conversion can't be made because of the character "
+                "<< {0} >>. ".format(onechar) + "\nYou can use the "
+                "function ``_ascii_report`` so as to report more precisely "
+                "this fealure with eventually an ascii alternative."
+            )
 
-            elif strict:
-                raise ValueError(
-                    "ASCII conversion can't be made because of the character "
-                    "<< {0} >>. ".format(onechar) + "\nYou can use the "
-                    "function ``_ascii_report`` so as to report more precisely "
-                    "this fealure with eventually an ascii alternative."
-                )
+    return text
+
+
+def asciify_many(
+    texts,
+    oldnew  = None,
+    strict  = True,
+    engine  = UNICODE_NAME,
+    workers = 1
+):
+    """
+prototype::
+    see = asciify
+
+    arg = iter(str): texts ;
+          the texts to be translated
+    arg = {str: str} , None: oldnew = None ;
+          the extra replacements used by ``asciify``
+    arg = bool: strict = True ;
+          the argument ``strict`` used by ``asciify``
+    arg = str: engine = "name" in _ASCII_ENGINES ;
+          the argument ``engine`` used by ``asciify``
+    arg = int , None: workers = 1 ;
+          the number of processes used, ``None`` being for the number of
+          processors of the computer
+
+    return = list(str) ;
+             the ¨ascii versions of the texts, in the same order
+
+
+Each different text is translated only one time, so this function is useful
+for texts often repeated like names of products. For very big batches, the
+texts can be translated by several processes.
+
+pyterm::
+    >>> from mistool.string_use import asciify_many
+    >>> print(asciify_many(["Crème", "Brûlée", "Crème"], engine = "nfkd"))
+    ['Creme', 'Brulee', 'Creme']
+    """
+    from functools import partial
+
+    texts  = list(texts)
+    unique = list(dict.fromkeys(texts))
+    task   = partial(asciify, oldnew = oldnew, strict = strict, engine = engine)
+
+# Small batches are not worth the launching of processes.
+    if workers == 1 or len(unique) < ASCIIFY_MANY_MIN_PROCESS:
+        results = map(task, unique)
+
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            results = list(
+                pool.map(task, unique, chunksize = ASCIIFY_MANY_CHUNK_SIZE)
+            )
+
+    asciitexts = dict(zip(unique, results))
 
-    return MultiReplace(oldnew)(text)
+    return [asciitexts[text] for text in texts]
 
 
 def _ascii_report(text):
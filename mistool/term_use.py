@@ -10,7 +10,6 @@ be printed in a terminal.
 """
 
 from mistool.config.frame import ALL_FRAMES
-from mistool.latex_use import escape as latex_escape
 from mistool.os_use import (
 # Class
     PPath,
@@ -1679,6 +1678,9 @@ prototype::
         """
 # The job has to be done.
         if self.havetobuild(self.LATEX_TAG):
+# ``latex_use`` is only needed here.
+            from mistool.latex_use import escape as latex_escape
+
             text = []
 
             for metadatas in self.listview:
@@ -7,9 +7,29 @@ prototype::
 This script proposes two useful functions to manipulate urls.
 """
 
-import requests
-from requests.exceptions import ConnectionError
-from requests.utils import quote
+# ``requests.utils.quote`` is just ``urllib.parse.quote``, and ``requests`` is
+# only imported by ``islinked`` because it is slow to import.
+from urllib.parse import quote
+
+
+def __getattr__(name):
+    """
+This hidden function gives the old attributs ``requests`` and
+``ConnectionError`` of this module without importing ``requests`` at start.
+    """
+    if name == "requests":
+        import requests
+
+        return requests
+
+    if name == "ConnectionError":
+        from requests.exceptions import ConnectionError
+
+        return ConnectionError
+
+    raise AttributeError(
+        "module ``{0}`` has no attribute ``{1}``".format(__name__, name)
+    )
 
 
 # ---------------- #
@@ -73,6 +93,9 @@ pyterm::
     >>> islinked("http://www.g-o-o-g-l-e.com")
     False
     """
+    import requests
+    from requests.exceptions import ConnectionError
+
     try:
         requests.get(url)
         return True
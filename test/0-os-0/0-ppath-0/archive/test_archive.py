@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import os
+import sys
+import tarfile
+import zipfile
+
+from pytest import fixture, raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+CONTENTS = {
+    "a.py"         : "print('a')",
+    "b.txt"        : "b" * 5000,
+    "sub/c.py"     : "print('c')",
+    "sub/deep/d.py": "",
+}
+
+
+@fixture
+def maindir(tmp_path):
+    main = tmp_path / "main"
+
+    for name, content in CONTENTS.items():
+        path = main / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text(content)
+
+    return PPATH_CLASS(main)
+
+
+def tarcontents(path):
+    with tarfile.open(str(path)) as tar:
+        return {
+            m.name: tar.extractfile(m).read().decode()
+            for m in tar.getmembers()
+            if m.isfile()
+        }
+
+
+def zipcontents(path):
+    with zipfile.ZipFile(str(path)) as archive:
+        return {
+            name: archive.read(name).decode()
+            for name in archive.namelist()
+            if not name.endswith("/")
+        }
+
+
+# ------------------------- #
+# -- ARCHIVING DIRECTORY -- #
+# ------------------------- #
+
+def test_archive_tar_formats(maindir, tmp_path):
+    for fmt in ["tar", "tar.gz", "tar.bz2", "tar.xz"]:
+        dest = PPATH_CLASS(tmp_path / "out" / "main.{0}".format(fmt))
+
+        maindir.archive(dest = dest, fmt = fmt)
+
+        assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_parallel_gzip(maindir, tmp_path):
+    dest = PPATH_CLASS(tmp_path / "main.tar.gz")
+
+    maindir.archive(dest = dest, workers = 3)
+
+    assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_parallel_gzip_blocks(tmp_path):
+    datas = bytes(range(256)) * 1000
+    dest  = tmp_path / "datas.gz"
+
+    with dest.open(mode = 'wb') as f:
+        gzfile = os_use._ParallelGzipWriter(f, 2, blocksize = 1000)
+
+        for i in range(0, len(datas), 777):
+            gzfile.write(datas[i:i + 777])
+
+        gzfile.close()
+
+    import gzip
+
+    assert gzip.decompress(dest.read_bytes()) == datas
+
+
+def test_archive_zip(maindir, tmp_path):
+    dest = PPATH_CLASS(tmp_path / "main.zip")
+
+    maindir.archive(dest = dest, fmt = "zip")
+
+    assert zipcontents(dest) == CONTENTS
+
+
+def test_archive_regpath(maindir, tmp_path):
+    dest = PPATH_CLASS(tmp_path / "main.tar")
+
+    maindir.archive(dest = dest, regpath = "file::**.py", fmt = "tar")
+
+    assert sorted(tarcontents(dest)) == ["a.py", "sub/c.py", "sub/deep/d.py"]
+
+
+def test_archive_inside_itself(maindir):
+    dest = maindir / "main.tar"
+
+    maindir.archive(dest = dest, fmt = "tar")
+
+    assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_inside_itself_all(maindir):
+    dest = maindir / "out.tar"
+
+    maindir.archive(dest = dest, regpath = "all::**", fmt = "tar")
+
+    assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_mode(maindir, tmp_path, monkeypatch):
+    monkeypatch.setattr(os_use, "_UMASK", 0o027)
+
+    dest = PPATH_CLASS(tmp_path / "main.tar.gz")
+
+    maindir.archive(dest = dest, workers = 2)
+
+    assert dest.stat().st_mode & 0o777 == 0o640
+
+
+# ----------------------- #
+# -- SAFETY AND ERRORS -- #
+# ----------------------- #
+
+def test_archive_safemode(maindir, tmp_path):
+    dest = PPATH_CLASS(tmp_path / "main.tar")
+    dest.write_text("old")
+
+    with raises(FileExistsError):
+        maindir.archive(dest = dest, fmt = "tar")
+
+    assert dest.read_text() == "old"
+
+    maindir.archive(dest = dest, fmt = "tar", safemode = False)
+
+    assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_parallel_gzip_error(maindir, tmp_path, monkeypatch):
+    writers = []
+
+    class Writer(os_use._ParallelGzipWriter):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            writers.append(self)
+
+    def badarchivetar(self, fileobj, ppaths, fmt):
+        fileobj.write(b"Some datas...")
+        raise RuntimeError("Oups !")
+
+    monkeypatch.setattr(os_use, "_ParallelGzipWriter", Writer)
+    monkeypatch.setattr(PPATH_CLASS, "_archivetar", badarchivetar)
+
+    with raises(RuntimeError):
+        maindir.archive(
+            dest    = PPATH_CLASS(tmp_path / "main.tar.gz"),
+            workers = 2
+        )
+
+    assert writers[0]._executor is None
+    assert os.listdir(str(tmp_path)) == ["main"]
+
+
+def test_archive_zst_if_available(maindir, tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+    dest = PPATH_CLASS(tmp_path / "main.tar.zst")
+
+    with raises(ImportError):
+        maindir.archive(dest = dest, fmt = "tar.zst")
+
+    fmt = maindir.archive(dest = dest, fmt = "tar.zst-if-available")
+
+    assert fmt == "tar.gz"
+    assert tarcontents(dest) == CONTENTS
+
+
+def test_archive_bad_format(maindir, tmp_path):
+    with raises(ValueError):
+        maindir.archive(dest = PPATH_CLASS(tmp_path / "main.rar"), fmt = "rar")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def fixturepaths(main):
+    return [
+        main / "dir_{0}".format(i) / "sub_{0}".format(j) / "file.txt"
+        for i in range(5)
+        for j in range(4)
+    ]
+
+
+# ---------------------------- #
+# -- CREATING SEVERAL PATHS -- #
+# ---------------------------- #
+
+def test_create_many_files(tmp_path):
+    main  = PPATH_CLASS(tmp_path)
+    paths = fixturepaths(main)
+
+    for workers in [1, 4]:
+        PPATH_CLASS.create_many(paths, os_use.FILE_TAG, workers)
+
+        for path in paths:
+            assert path.is_file()
+
+
+def test_create_many_dirs(tmp_path):
+    main  = PPATH_CLASS(tmp_path)
+    paths = [p.parent for p in fixturepaths(main)]
+
+    PPATH_CLASS.create_many(paths, "d")
+
+    for path in paths:
+        assert path.is_dir()
+
+
+def test_create_many_keep_content(tmp_path):
+    path = PPATH_CLASS(tmp_path / "dir" / "file.txt")
+
+    path.create(os_use.FILE_TAG)
+    path.write_text("Do not erase me !")
+
+    PPATH_CLASS.create_many([path], os_use.FILE_TAG)
+
+    assert path.read_text() == "Do not erase me !"
+
+
+def test_create_many_bad_paths(tmp_path):
+    main = PPATH_CLASS(tmp_path)
+
+    (main / "dir").create(os_use.DIR_TAG)
+    (main / "file.txt").create(os_use.FILE_TAG)
+
+    with raises(IsADirectoryError):
+        PPATH_CLASS.create_many([main / "dir"], os_use.FILE_TAG)
+
+    with raises(FileExistsError):
+        PPATH_CLASS.create_many([main / "file.txt"], os_use.DIR_TAG)
+
+    with raises(ValueError):
+        PPATH_CLASS.create_many([main / "new"], "unknown")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import fixture, raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+
+CONTENT = "\n".join(
+    "Line {0} : àéè".format(i) for i in range(1000)
+)
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+@fixture
+def textfile(tmp_path):
+    path = PPATH_CLASS(tmp_path / "file.txt")
+    path.write_text(CONTENT, encoding = "utf-8")
+
+    return path
+
+
+@fixture
+def emptyfile(tmp_path):
+    path = PPATH_CLASS(tmp_path / "empty.txt")
+    path.create(os_use.FILE_TAG)
+
+    return path
+
+
+# ----------------------- #
+# -- READING BY PIECES -- #
+# ----------------------- #
+
+def test_readers_chunks(textfile, emptyfile):
+    chunks = list(textfile.iter_chunks(100))
+
+    assert b"".join(chunks) == CONTENT.encode("utf-8")
+    assert max(len(c) for c in chunks) == 100
+
+    assert list(emptyfile.iter_chunks()) == []
+
+
+def test_readers_lines(textfile):
+    lines = list(textfile.iter_lines(buffer = 64))
+
+    assert "".join(lines) == CONTENT
+    assert lines[1] == "Line 1 : àéè\n"
+
+
+def test_readers_mmap(textfile, emptyfile):
+    view = textfile.mmap()
+
+    assert view.readonly
+    assert bytes(view) == CONTENT.encode("utf-8")
+    assert view.obj.find(b"Line 10 ") == CONTENT.encode("utf-8").find(b"Line 10 ")
+
+    with raises(TypeError):
+        view[0] = 0
+
+    view.release()
+
+    assert len(emptyfile.mmap()) == 0
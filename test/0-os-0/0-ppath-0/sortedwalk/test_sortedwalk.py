@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pathlib import Path as StdPath
+
+from pytest import fixture, raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+THIS_DIR = StdPath(__file__).parent
+
+PPATH_CLASS = os_use.PPath
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+DIR_PPATH = THIS_DIR
+
+while DIR_PPATH.name != "test":
+    DIR_PPATH = DIR_PPATH.parent
+
+DIR_PPATH = DIR_PPATH / "virtual_dir" / "complex_dir"
+DIR_PPATH = PPATH_CLASS(DIR_PPATH)
+
+
+@fixture
+def checkpoint(tmp_path):
+    return PPATH_CLASS(tmp_path / "walk.json")
+
+
+# ------------------------- #
+# -- SORTED AND COMPLETE -- #
+# ------------------------- #
+
+def test_sortedwalk_same_paths():
+    for regpath in ["**", "file::**.py", "dir::**", "xtra file::**.txt"]:
+        paths_found = [
+            (str(p), p._tag)
+            for p in DIR_PPATH.sortedwalk(regpath)
+        ]
+
+        paths_wanted = [
+            (str(p), p._tag)
+            for p in DIR_PPATH.walk(regpath)
+        ]
+
+        assert sorted(paths_wanted) == sorted(paths_found)
+
+
+def test_sortedwalk_sorted():
+    paths_found = [
+        str(p.relative_to(DIR_PPATH))
+        for p in DIR_PPATH.sortedwalk("file::*")
+    ]
+
+    assert paths_found == sorted(paths_found)
+
+
+# ----------------------------- #
+# -- INTERRUPTION AND RESUME -- #
+# ----------------------------- #
+
+def test_sortedwalk_resume(checkpoint):
+    paths_wanted = list(DIR_PPATH.sortedwalk())
+
+    for nbstop in range(1, len(paths_wanted)):
+        walker = DIR_PPATH.sortedwalk(
+            checkpoint = checkpoint,
+            every      = 1
+        )
+
+        for _ in range(nbstop):
+            next(walker)
+
+        walker.close()
+
+        if not checkpoint.is_file():
+            continue
+
+        paths_found = list(DIR_PPATH.sortedwalk(checkpoint = checkpoint))
+
+        assert 0 < len(paths_found) <= len(paths_wanted)
+        assert len(paths_found) >= len(paths_wanted) - nbstop
+        assert paths_found == paths_wanted[-len(paths_found):]
+        assert not checkpoint.is_file()
+
+
+def test_sortedwalk_resume_inside_folder(tmp_path, checkpoint):
+    bigdir = PPATH_CLASS(tmp_path / "big")
+    bigdir.mkdir()
+
+    for i in range(200):
+        (bigdir / "file_{0:03}.txt".format(i)).write_text("")
+
+    paths_wanted = list(bigdir.sortedwalk())
+    walker       = bigdir.sortedwalk(checkpoint = checkpoint, every = 10)
+
+    for _ in range(155):
+        next(walker)
+
+    walker.close()
+
+    paths_found = list(bigdir.sortedwalk(checkpoint = checkpoint))
+
+# The last update of the checkpoint has been done just before the 151th path.
+    assert paths_found == paths_wanted[150:]
+
+
+def test_sortedwalk_bad_checkpoint(checkpoint):
+    walker = DIR_PPATH.sortedwalk(
+        checkpoint = checkpoint,
+        every      = 1
+    )
+
+    while not checkpoint.is_file():
+        next(walker)
+
+    walker.close()
+
+    with raises(ValueError):
+        list(DIR_PPATH.sortedwalk("file::**", checkpoint))
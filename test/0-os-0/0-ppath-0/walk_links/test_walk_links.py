@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import os
+
+from pytest import fixture
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+# The tree built is the following one where ``loop`` points to ``main`` and
+# ``other`` points to the external directory ``outside``.
+#
+#     + main
+#         * a.py
+#         + sub
+#             * b.py
+#             * c.txt
+#             + loop --> main
+#         + other --> outside
+#     + outside
+#         * d.py
+
+@fixture
+def linkeddir(tmp_path):
+    main    = tmp_path / "main"
+    outside = tmp_path / "outside"
+
+    (main / "sub").mkdir(parents = True)
+    outside.mkdir()
+
+    for path in [
+        main / "a.py",
+        main / "sub" / "b.py",
+        main / "sub" / "c.txt",
+        outside / "d.py",
+    ]:
+        path.write_text("")
+
+    os.symlink(str(main), str(main / "sub" / "loop"))
+    os.symlink(str(outside), str(main / "other"))
+
+    return PPATH_CLASS(main)
+
+
+def relpaths(maindir, **kwargs):
+    return sorted(
+        str(p.relative_to(maindir))
+        for p in maindir.walk(**kwargs)
+    )
+
+
+# --------------------------------- #
+# -- WALKING WITH SYMBOLIC LINKS -- #
+# --------------------------------- #
+
+def test_walk_links_not_followed(linkeddir):
+    assert relpaths(linkeddir) == [
+        "a.py",
+        "other",
+        "sub",
+        "sub/b.py",
+        "sub/c.txt",
+        "sub/loop",
+    ]
+
+
+def test_walk_links_followed(linkeddir):
+    assert relpaths(linkeddir, followlinks = True) == [
+        "a.py",
+        "other",
+        "other/d.py",
+        "sub",
+        "sub/b.py",
+        "sub/c.txt",
+        "sub/loop",
+    ]
+
+
+def test_walk_links_followed_regpath(linkeddir):
+    assert relpaths(
+        linkeddir,
+        regpath     = "file::**.py",
+        followlinks = True
+    ) == [
+        "a.py",
+        "other/d.py",
+        "sub/b.py",
+    ]
+
+
+def test_walk_links_followed_xtra(linkeddir):
+    tags = sorted(
+        (str(p.relative_to(linkeddir)), p._tag)
+        for p in linkeddir.walk(
+            regpath     = "xtra file::**.py",
+            followlinks = True
+        )
+    )
+
+    assert tags == [
+        ("a.py", os_use.FILE_TAG),
+        ("other/d.py", os_use.FILE_TAG),
+        ("sub/...", os_use.FILE_OTHERS_TAG),
+        ("sub/b.py", os_use.FILE_TAG),
+    ]
+
+
+def test_walk_links_samefs(linkeddir):
+    assert relpaths(linkeddir, samefs = True) == relpaths(linkeddir)
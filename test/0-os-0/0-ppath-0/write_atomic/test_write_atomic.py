@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import os
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+
+
+# ---------------------- #
+# -- ONE SINGLE WRITE -- #
+# ---------------------- #
+
+def test_write_atomic(tmp_path):
+    path = PPATH_CLASS(tmp_path / "file.txt")
+
+    path.write_atomic("Première version")
+    assert path.read_text(encoding = "utf-8") == "Première version"
+
+    path.write_atomic(b"Second version", fsync = False)
+    assert path.read_bytes() == b"Second version"
+
+    assert [p.name for p in PPATH_CLASS(tmp_path).walk("all::**")] \
+        == ["file.txt"]
+
+
+# -------------------- #
+# -- SEVERAL WRITES -- #
+# -------------------- #
+
+def test_write_atomic_batch(tmp_path):
+    main  = PPATH_CLASS(tmp_path)
+    paths = [main / "file_{0}.txt".format(i) for i in range(10)]
+
+    with PPATH_CLASS.atomic_batch() as batch:
+        for i, path in enumerate(paths):
+            batch.write(path, str(i))
+
+        assert not any(p.is_file() for p in paths)
+
+    assert [p.read_text() for p in paths] == [str(i) for i in range(10)]
+    assert len(list(main.walk("all::**"))) == 10
+
+
+def test_write_atomic_batch_syncfs(tmp_path, monkeypatch):
+    main   = PPATH_CLASS(tmp_path)
+    calls  = []
+    syncfs = os_use._syncfs
+    fsyncs = []
+    fsync  = getattr(os, "fdatasync", os.fsync)
+
+    for i in range(2):
+        (main / "dir_{0}".format(i)).mkdir()
+
+    def spysyncfs(strpath):
+        calls.append(strpath)
+        return syncfs(strpath)
+
+    def spyfsync(fd):
+        fsyncs.append(fd)
+        return fsync(fd)
+
+    monkeypatch.setattr(os_use, "_syncfs", spysyncfs)
+    monkeypatch.setattr(os, "fdatasync", spyfsync, raising = False)
+
+    with PPATH_CLASS.atomic_batch() as batch:
+        for i in range(10):
+            batch.write(main / "dir_{0}".format(i % 2) / "f.txt", str(i))
+
+    assert len(calls) == 1
+
+    if os_use._syncfsfunc() is not None:
+        assert not fsyncs
+
+# Without ``syncfs``, each file is synchronized.
+    monkeypatch.setattr(os_use, "_syncfsfunc", lambda: None)
+    fsyncs.clear()
+
+    with PPATH_CLASS.atomic_batch() as batch:
+        for i in range(3):
+            batch.write(main / "g_{0}.txt".format(i), str(i))
+
+    assert len(fsyncs) == 3
+    assert (main / "g_2.txt").read_text() == "2"
+
+
+def test_write_atomic_batch_error(tmp_path):
+    main = PPATH_CLASS(tmp_path)
+    path = main / "file.txt"
+
+    path.write_text("Old content")
+
+    with raises(RuntimeError):
+        with PPATH_CLASS.atomic_batch() as batch:
+            batch.write(path, "New content")
+            batch.write(main / "other.txt", "New file")
+
+            raise RuntimeError("Oups !")
+
+    assert path.read_text() == "Old content"
+    assert [p.name for p in main.walk("all::**")] == ["file.txt"]
+
+
+# ------------------------------------ #
+# -- PERMISSIONS AND SYMBOLIC LINKS -- #
+# ------------------------------------ #
+
+def test_write_atomic_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(os_use, "_UMASK", 0o027)
+
+    main = PPATH_CLASS(tmp_path)
+
+    new = main / "new.txt"
+    new.write_atomic("New")
+
+    script = main / "script.sh"
+    script.write_text("echo 1")
+    os.chmod(str(script), 0o755)
+    script.write_atomic("echo 2")
+
+    with PPATH_CLASS.atomic_batch() as batch:
+        batch.write(main / "batch.txt", "Batch")
+        batch.write(script, "echo 3")
+
+    assert new.stat().st_mode & 0o777 == 0o640
+    assert (main / "batch.txt").stat().st_mode & 0o777 == 0o640
+    assert script.stat().st_mode & 0o777 == 0o755
+    assert script.read_text() == "echo 3"
+
+
+def test_write_atomic_symlink(tmp_path):
+    main   = PPATH_CLASS(tmp_path)
+    target = main / "target.txt"
+    link   = main / "link.txt"
+
+    target.write_text("Old content")
+    os.symlink(str(target), str(link))
+
+    link.write_atomic("New content")
+
+    with PPATH_CLASS.atomic_batch() as batch:
+        batch.write(link, "Last content")
+
+    assert link.is_symlink()
+    assert target.read_text() == "Last content"
+
+
+def test_write_atomic_umask_unchanged():
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    assert os_use._readumask() == umask
+
+    umask_after = os.umask(0o022)
+    os.umask(umask_after)
+
+    assert umask_after == umask
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import fixture, raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+CACHE_CLASS = os_use.ContentCache
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+class Builder:
+    def __init__(self, source):
+        self.source  = source
+        self.nbcalls = 0
+
+    def __call__(self, dest):
+        self.nbcalls += 1
+
+        dest.write_text(self.source.read_text().upper())
+
+
+@fixture
+def source(tmp_path):
+    path = PPATH_CLASS(tmp_path / "source.txt")
+    path.write_text("Some content.")
+
+    return path
+
+
+@fixture
+def cacheroot(tmp_path):
+    return PPATH_CLASS(tmp_path / "cache")
+
+
+# ------------------------ #
+# -- BUILD ONLY IF NEED -- #
+# ------------------------ #
+
+def test_content_cache_build_once(source, cacheroot):
+    cache   = CACHE_CLASS(cacheroot)
+    builder = Builder(source)
+
+    for _ in range(3):
+        path = cache.get_or_build([source, "upper"], builder, "txt")
+
+        assert path.read_text() == "SOME CONTENT."
+        assert path.ext == "txt"
+
+    assert builder.nbcalls == 1
+
+# The index is stored.
+    cache = CACHE_CLASS(cacheroot)
+    cache.get_or_build([source, "upper"], builder, "txt")
+
+    assert builder.nbcalls == 1
+
+
+def test_content_cache_content_changed(source, cacheroot):
+    cache   = CACHE_CLASS(cacheroot)
+    builder = Builder(source)
+
+    cache.get_or_build(source, builder)
+    source.write_text("Another content.")
+    path = cache.get_or_build(source, builder)
+
+    assert builder.nbcalls == 2
+    assert path.read_text() == "ANOTHER CONTENT."
+
+
+def test_content_cache_keys():
+    cache = CACHE_CLASS.__new__(CACHE_CLASS)
+
+    assert cache.key(["ab", "c"]) != cache.key(["a", "bc"])
+    assert cache.key("abc") == cache.key(b"abc")
+
+
+# -------------- #
+# -- EVICTION -- #
+# -------------- #
+
+def test_content_cache_eviction(source, cacheroot):
+    cache   = CACHE_CLASS(cacheroot, maxentries = 2)
+    builder = Builder(source)
+
+    paths = [
+        cache.get_or_build([source, str(i)], builder)
+        for i in range(4)
+    ]
+
+    assert [p.is_file() for p in paths] == [False, False, True, True]
+    assert len(cache.index) == 2
+
+
+def test_content_cache_eviction_last_used(source, cacheroot):
+    cache   = CACHE_CLASS(cacheroot, maxentries = 3)
+    builder = Builder(source)
+
+    paths = [
+        cache.get_or_build([source, str(i)], builder)
+        for i in range(3)
+    ]
+
+    for i in [0, 1, 0]:
+        cache.get_or_build([source, str(i)], builder)
+
+    for i in range(3, 5):
+        paths.append(cache.get_or_build([source, str(i)], builder))
+
+    assert [p.is_file() for p in paths] == [True, False, False, True, True]
+    assert builder.nbcalls == 5
+    assert cache._totalsize == sum(size for size, _ in cache.index.values())
+
+
+def test_content_cache_index_saved_on_flush(source, cacheroot):
+    builder = Builder(source)
+
+    with CACHE_CLASS(cacheroot) as cache:
+        cache.get_or_build(source, builder)
+
+        assert not cache._indexpath.is_file()
+
+    assert len(CACHE_CLASS(cacheroot).index) == 1
+
+
+def test_content_cache_mode(source, cacheroot, monkeypatch):
+    monkeypatch.setattr(os_use, "_UMASK", 0o027)
+
+    path = CACHE_CLASS(cacheroot).get_or_build(source, Builder(source))
+
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_content_cache_failed_build(source, cacheroot):
+    cache = CACHE_CLASS(cacheroot)
+
+    def badbuilder(dest):
+        dest.write_text("Partial...")
+        raise RuntimeError("Oups !")
+
+    with raises(RuntimeError):
+        cache.get_or_build(source, badbuilder)
+
+    assert not list(cacheroot.walk("all file::**.tmp"))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import fixture
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import os_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+PPATH_CLASS = os_use.PPath
+STATS_CLASS = os_use.OSStats
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+@fixture
+def maindir(tmp_path):
+    main = tmp_path / "main"
+
+    for name in ["a.py", "b.txt", "sub/c.py", "sub/d.txt"]:
+        path = main / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text("1234")
+
+    return PPATH_CLASS(main)
+
+
+# -------------- #
+# -- COUNTERS -- #
+# -------------- #
+
+def test_os_stats_disabled(maindir):
+    assert os_use._STATS is None
+
+    list(maindir.walk())
+
+    assert os_use._STATS is None
+
+
+def test_os_stats_walk(maindir):
+    with STATS_CLASS() as stats:
+        found = list(maindir.walk("file::**.py"))
+
+    assert os_use._STATS is None
+    assert len(found) == 2
+
+    infos = stats.asdict()
+
+    assert infos["dirs_scanned"] == 2
+    assert infos["entries_examined"] == 5
+    assert infos["regex_evals"] == 4
+    assert infos["matches"] == 2
+    assert infos["stat_calls"] == 0
+    assert list(infos["phase_seconds"]) == ["walk"]
+
+
+def test_os_stats_walk_links(maindir):
+    with STATS_CLASS() as stats:
+        list(maindir.walk(followlinks = True))
+
+    assert stats.stat_calls == 2
+
+
+def test_os_stats_copy(maindir, tmp_path):
+    with STATS_CLASS() as stats:
+        maindir.copy_to(PPATH_CLASS(tmp_path / "copy"))
+
+    assert stats.bytes_copied == 16
+    assert list(stats.phase_seconds) == ["copy"]
+
+
+def test_os_stats_callback(maindir):
+    received = []
+
+    with STATS_CLASS(callback = received.append) as stats:
+        maindir.clean("file::**.txt")
+
+    assert received == [stats]
+    assert list(stats.phase_seconds) == ["clean"]
+    assert not (maindir / "b.txt").is_file()
+
+
+# ------------- #
+# -- EXPORTS -- #
+# ------------- #
+
+def test_os_stats_prometheus(maindir):
+    with STATS_CLASS() as stats:
+        list(maindir.walk())
+
+    text = stats.prometheus()
+
+    assert "# TYPE mistool_os_dirs_scanned_total counter" in text
+    assert "mistool_os_dirs_scanned_total 2\n" in text
+    assert 'mistool_os_phase_seconds_total{phase="walk"} ' in text
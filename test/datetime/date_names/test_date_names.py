@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool.config import date_name
+
+
+# ----------------------- #
+# -- NAMES BY LANGUAGE -- #
+# ----------------------- #
+
+def test_date_names_by_lang():
+    assert date_name.names("fr_FR", "%A")[1] == "Mardi"
+    assert date_name.names("en_GB", "%B")[5] == "June"
+
+    for lang in date_name.LANGS:
+        for fmt, size in zip(date_name.FORMATS, date_name.SIZES):
+            names = date_name.names(lang, fmt)
+
+            assert isinstance(names, tuple)
+            assert len(names) == size
+
+
+def test_date_names_unknown_lang():
+    with raises(KeyError):
+        date_name.names("xx_XX", "%A")
+
+
+# ------------------------------ #
+# -- OLD VARIABLES STILL HERE -- #
+# ------------------------------ #
+
+def test_date_names_old_variables():
+    pointers     = date_name.POINTERS
+    translations = date_name.FORMATS_TRANSLATIONS
+
+    for fmt in date_name.FORMATS:
+        for lang in date_name.LANGS:
+            assert pointers[translations[fmt][lang]] \
+                == list(date_name.names(lang, fmt))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+ASCII_FUNCTION      = string_use.asciify
+ASCII_MANY_FUNCTION = string_use.asciify_many
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+THE_DATAS_FOR_TESTING = [
+    ("Crème brûlée", "Creme brulee"),
+    ("Straße", "Strasse"),
+    ("Ærøskøbing", "AEroskobing"),
+    ("Łódź", "Lodz"),
+    ("Þór", "THor"),
+    ("ﬁ ½ ①", "fi 1/2 1"),
+    ("𝛂 = 𝛃", "alpha = beta"),
+]
+
+
+# ------------------------- #
+# -- THE ENGINE ``nfkd`` -- #
+# ------------------------- #
+
+def test_asciify_nfkd():
+    for dirty, pretty_wanted in THE_DATAS_FOR_TESTING:
+        assert ASCII_FUNCTION(dirty, engine = "nfkd") == pretty_wanted
+
+
+def test_asciify_nfkd_strict():
+    with raises(ValueError):
+        ASCII_FUNCTION("∏", engine = "nfkd")
+
+    with raises(ValueError):
+        ASCII_FUNCTION("abc", engine = "unknown")
+
+
+# ------------------------ #
+# -- MANY TEXTS AT ONCE -- #
+# ------------------------ #
+
+def test_asciify_many():
+    texts = [dirty for dirty, _ in THE_DATAS_FOR_TESTING]*3
+
+    pretty_wanted = [
+        ASCII_FUNCTION(dirty, engine = "nfkd")
+        for dirty in texts
+    ]
+
+    assert ASCII_MANY_FUNCTION(iter(texts), engine = "nfkd") == pretty_wanted
+
+
+def test_asciify_many_processes(monkeypatch):
+    monkeypatch.setattr(string_use, "ASCIIFY_MANY_MIN_PROCESS", 0)
+
+    texts = ["Crème {0}".format(i % 50) for i in range(200)]
+
+    assert ASCII_MANY_FUNCTION(texts, workers = 2) \
+        == ["Creme {0}".format(i % 50) for i in range(200)]
+
+    with raises(ValueError):
+        ASCII_MANY_FUNCTION(["∏"]*3, workers = 2)
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+ASCII_FUNCTION = string_use.asciify
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+THE_DATAS_FOR_TESTING = [
+    ("¡Viva España!", "Viva Espana!"),
+    ("Crème brûlée à l'Hôtel", "Creme brulee a l'Hotel"),
+    ("α = β", "alpha = beta"),
+    ("ж", "zhe"),
+    ("ﬁn", "fin"),
+    ("line 1\n\tline 2", "line 1\n\tline 2"),
+]
+
+
+# ------------------------------ #
+# -- TRANSLATION WITH A TABLE -- #
+# ------------------------------ #
+
+def test_asciify_table():
+    for dirty, pretty_wanted in THE_DATAS_FOR_TESTING:
+        assert ASCII_FUNCTION(dirty) == pretty_wanted
+
+
+def test_asciify_table_same_as_names():
+    for start, end in string_use._ASCII_TABLE_RANGES:
+        for code in range(start, end):
+            onechar   = chr(code)
+            asciichar = string_use._asciichar(onechar)
+
+            if asciichar is None:
+                asciichar = onechar
+
+            assert ASCII_FUNCTION(onechar, strict = False) == asciichar
+
+
+def test_asciify_table_strict():
+    with raises(ValueError):
+        ASCII_FUNCTION("L'Odyssée de ∏")
+
+    assert ASCII_FUNCTION("L'Odyssée de ∏", strict = False) \
+        == "L'Odyssee de ∏"
+
+
+# ------------------------- #
+# -- USER'S REPLACEMENTS -- #
+# ------------------------- #
+
+def test_asciify_table_oldnew():
+    oldnew = {'!': "", 'ñ': "ny"}
+
+    assert ASCII_FUNCTION("¡Viva España!", oldnew) == "Viva Espanya"
+    assert oldnew == {'!': "", 'ñ': "ny"}
+    assert ASCII_FUNCTION("¡Viva España!") == "Viva Espana!"
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import io
+import random
+import tracemalloc
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+BALANCED_FUNCTION     = string_use.balanced
+ITERBALANCED_FUNCTION = string_use.iterbalanced
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+THE_DATAS_FOR_TESTING = [
+    ("a{b{c}d}e{f}", ["{", "}"], "", [(2, 7, [(4, 5, [])]), (10, 11, [])]),
+    ("a{b\\{c}d", ["{", "}"], "\\", [(2, 6, [])]),
+    ("a{b\\{c}d}", ["{", "}"], "\\\\", [(2, 8, [(5, 6, [])])]),
+    (
+        "<<a(b)>> (c)",
+        [["<<", ">>"], ["(", ")"]],
+        "",
+        [(2, 6, [(4, 5, [])]), (10, 11, [])]
+    ),
+    ("no delimiter", ["{", "}"], "", []),
+]
+
+
+# --------------------- #
+# -- TREES OF PIECES -- #
+# --------------------- #
+
+def test_balanced_trees():
+    for text, seps, esc_char, trees_wanted in THE_DATAS_FOR_TESTING:
+        assert BALANCED_FUNCTION(text, seps, esc_char) == trees_wanted
+
+
+def test_balanced_unbalanced():
+    for text in ["a}", "a{b", "{a}}", "{a{b}"]:
+        with raises(ValueError):
+            BALANCED_FUNCTION(text, ["{", "}"])
+
+    with raises(ValueError):
+        BALANCED_FUNCTION("(a]", [["(", ")"], ["[", "]"]])
+
+    with raises(ValueError):
+        BALANCED_FUNCTION("$a$", ["$", "$"])
+
+
+def test_balanced_deep():
+    depth = 100000
+    text  = "{"*depth + "}"*depth
+    tree  = BALANCED_FUNCTION(text, ["{", "}"])[0]
+
+    for _ in range(depth - 1):
+        tree = tree[2][0]
+
+    assert tree == (depth, depth, [])
+
+
+# ------------------------ #
+# -- CHUNKS AND STREAMS -- #
+# ------------------------ #
+
+def test_balanced_chunks():
+    rand = random.Random(0)
+    seps = [["{{", "}}"], ["{", "}"]]
+
+    for _ in range(2000):
+        text = "".join(
+            rand.choice("ab{}\\")
+            for _ in range(rand.randint(0, 30))
+        )
+
+        cuts = sorted(
+            rand.randint(0, len(text))
+            for _ in range(rand.randint(0, 5))
+        )
+
+        chunks = [
+            text[i: j]
+            for i, j in zip([0] + cuts, cuts + [len(text)])
+        ]
+
+        try:
+            trees_wanted = BALANCED_FUNCTION(text, seps, "\\")
+
+        except ValueError:
+            with raises(ValueError):
+                list(ITERBALANCED_FUNCTION(chunks, seps, "\\"))
+
+            continue
+
+        assert list(ITERBALANCED_FUNCTION(chunks, seps, "\\")) == trees_wanted
+        assert list(
+            ITERBALANCED_FUNCTION(io.StringIO(text), seps, "\\", chunk_size = 3)
+        ) == trees_wanted
+
+
+def test_balanced_chunks_no_delimiter():
+    chunk = "a"*(1 << 16)
+
+    def chunks():
+        yield "{"
+
+        for _ in range(200):
+            yield chunk
+
+        yield "}"
+
+    tracemalloc.start()
+
+    try:
+        trees = list(ITERBALANCED_FUNCTION(chunks(), ["{", "}"], "\\"))
+        _, peak = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    assert trees == [(1, 1 + 200*len(chunk), [])]
+    assert peak < 10*len(chunk)
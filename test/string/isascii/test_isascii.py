@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from io import BytesIO, StringIO
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+ISASCII_FUNCTION   = string_use.isascii
+FIRST_FUNCTION     = string_use.first_non_ascii
+ISASCII_STREAM_FCT = string_use.isascii_stream
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+THE_DATAS_FOR_TESTING = [
+    "",
+    "Vive la France !",
+    "¡Viva España!",
+    "Viva España!",
+    "Vive\nla\tFrance !",
+    "\x7f",
+    "\x00",
+    "ascii" * 1000 + "é",
+]
+
+
+def oldisascii(text):
+    return bool(set(text) <= string_use.ASCII_CHARS)
+
+
+def oldfirst(text, printable):
+    for i, char in enumerate(text):
+        if printable:
+            if char not in string_use.ASCII_CHARS:
+                return i
+
+        elif ord(char) > 127:
+            return i
+
+    return -1
+
+
+# --------------------------- #
+# -- SAME AS THE OLD TESTS -- #
+# --------------------------- #
+
+def test_isascii_printable():
+    for text in THE_DATAS_FOR_TESTING:
+        assert ISASCII_FUNCTION(text) == oldisascii(text)
+
+
+def test_isascii_not_printable():
+    for text in THE_DATAS_FOR_TESTING:
+        assert ISASCII_FUNCTION(text, printable = False) \
+               == all(ord(c) < 128 for c in text)
+
+
+# --------------------- #
+# -- FIRST NON ASCII -- #
+# --------------------- #
+
+def test_first_non_ascii():
+    for text in THE_DATAS_FOR_TESTING:
+        for printable in [True, False]:
+            assert FIRST_FUNCTION(text, printable) \
+                   == oldfirst(text, printable)
+
+            binary = text.encode("latin-1", "replace")
+
+            assert FIRST_FUNCTION(binary, printable) \
+                   == oldfirst(binary.decode("latin-1"), printable)
+
+
+# --------------- #
+# -- STREAMING -- #
+# --------------- #
+
+def test_isascii_stream():
+    for text in THE_DATAS_FOR_TESTING:
+        for printable in [True, False]:
+            wanted = ISASCII_FUNCTION(text, printable)
+
+            for chunk_size in [1, 3, 1 << 20]:
+                assert ISASCII_STREAM_FCT(
+                    reader     = StringIO(text),
+                    printable  = printable,
+                    chunk_size = chunk_size
+                ) == wanted
+
+                assert ISASCII_STREAM_FCT(
+                    reader     = BytesIO(text.encode("utf-8")),
+                    printable  = printable,
+                    chunk_size = chunk_size
+                ) == wanted
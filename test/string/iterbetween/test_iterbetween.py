@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+BETWEEN_FUNCTION    = string_use.between
+BETWEENALL_FUNCTION = string_use.betweenall
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def betweenloop(text, seps, keepseps):
+    pieces = []
+    shift  = 0
+
+    while True:
+        found = BETWEEN_FUNCTION(text[shift:], seps, keepseps)
+
+        if found is None:
+            return pieces
+
+        before, inside, after = found
+
+        pieces.append(
+            (shift + len(before), inside, len(text) - len(after))
+        )
+
+        shift = len(text) - len(after)
+
+        if keepseps:
+            shift += len(seps[1])
+
+
+# ---------------------------- #
+# -- ONE PAIR OF DELIMITERS -- #
+# ---------------------------- #
+
+def test_iterbetween_same_as_between():
+    text = "f(x) = g(x, y) + h() - (z"
+
+    for keepseps in [False, True]:
+        assert BETWEENALL_FUNCTION(text, ["(", ")"], keepseps) \
+            == betweenloop(text, ["(", ")"], keepseps)
+
+
+def test_iterbetween_nesting():
+    with raises(ValueError):
+        BETWEENALL_FUNCTION("f(g(x))", ["(", ")"])
+
+
+def test_iterbetween_bad_seps():
+    for seps in [["(", ""], "()", [["(", ")"], ["[", ""]]]:
+        with raises(ValueError):
+            BETWEENALL_FUNCTION("f(x)", seps)
+
+
+# --------------------------------- #
+# -- SEVERAL PAIRS OF DELIMITERS -- #
+# --------------------------------- #
+
+def test_iterbetween_several_pairs():
+    text = "<<a>> <b> [c] <<d> <e>>"
+    seps = [["<", ">"], ["<<", ">>"], ["[", "]"]]
+
+    assert BETWEENALL_FUNCTION(text, seps) == [
+        (0, "a", 5),
+        (6, "b", 9),
+        (10, "c", 13),
+        (14, "d> <e", 23),
+    ]
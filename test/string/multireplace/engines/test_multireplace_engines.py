@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import random
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_REPLACE = string_use.MultiReplace
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def leftmostlongest(text, oldnew):
+    pieces = []
+    i      = 0
+
+    while i < len(text):
+        found = [old for old in oldnew if text.startswith(old, i)]
+
+        if found:
+            old = max(found, key = len)
+
+            pieces.append(oldnew[old])
+            i += len(old)
+
+        else:
+            pieces.append(text[i])
+            i += 1
+
+    return "".join(pieces)
+
+
+def randomcases(nbcases = 300, seed = 0):
+    rand = random.Random(seed)
+
+    for _ in range(nbcases):
+        oldnew = {
+            "".join(rand.choice("abc") for _ in range(rand.randint(1, 4))):
+            "".join(rand.choice("xyzab") for _ in range(rand.randint(0, 3)))
+            for _ in range(rand.randint(1, 6))
+        }
+
+        text = "".join(rand.choice("abcd") for _ in range(rand.randint(0, 40)))
+
+        yield oldnew, text
+
+
+# ------------------------ #
+# -- ENGINE "AUTOMATON" -- #
+# ------------------------ #
+
+def test_multireplace_automaton():
+    for oldnew, text in randomcases():
+        mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "automaton")
+
+        assert mreplace(text) == leftmostlongest(text, oldnew)
+
+
+def test_multireplace_automaton_small_blocks(monkeypatch):
+    monkeypatch.setattr(string_use._AhoCorasick, "BLOCK_SIZE", 3)
+
+    for oldnew, text in randomcases(seed = 1):
+        mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "automaton")
+
+        assert mreplace(text) == leftmostlongest(text, oldnew)
+
+
+class CountingText(str):
+    nbreads = 0
+
+    def __getitem__(self, i):
+        CountingText.nbreads += 1
+
+        return str.__getitem__(self, i)
+
+
+def test_multireplace_automaton_linear():
+    for size in [10, 100, 400]:
+        automaton = string_use._AhoCorasick(["a", "a"*size + "b"])
+
+        CountingText.nbreads = 0
+        text = CountingText("a"*50000)
+
+        assert len(list(automaton.finditer(text))) == 50000
+        assert CountingText.nbreads <= 2*len(text)
+
+
+def test_multireplace_automaton_no_chaining():
+    oldnew = {
+        'W1' : "Word #1",
+        'W2' : "Word #2",
+        'W12': "W1 and W2"
+    }
+
+    mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "automaton")
+
+    assert mreplace("W12 = W1 and W2") == "W1 and W2 = Word #1 and Word #2"
+
+
+def test_multireplace_automaton_empty_key():
+    for engine in ["automaton", "regex"]:
+        with raises(ValueError):
+            CLASS_MULTI_REPLACE({"": "?"}, engine = engine)
+
+
+# -------------------- #
+# -- ENGINE "REGEX" -- #
+# -------------------- #
+
+def test_multireplace_regex():
+    for oldnew, text in randomcases():
+        mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "regex")
+
+        assert mreplace(text) == leftmostlongest(text, oldnew)
+
+
+def test_multireplace_regex_special_chars():
+    oldnew = {
+        "(*)": "star",
+        "[a]": "A",
+        "a"  : "?",
+    }
+
+    mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "regex")
+
+    assert mreplace("(*) [a] a") == "star A ?"
+
+
+def test_multireplace_regex_no_keys():
+    assert CLASS_MULTI_REPLACE({}, engine = "regex")("abc") == "abc"
+
+
+# ------------------- #
+# -- ENGINE "AUTO" -- #
+# ------------------- #
+
+def test_multireplace_auto():
+    oldnew   = {"a": "b", "c": "d"}
+    mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "auto")
+
+    assert mreplace.engineused == "regex"
+    assert mreplace("abcd") == "bbdd"
+
+    oldnew = {
+        "k{0}".format(i): str(i)
+        for i in range(CLASS_MULTI_REPLACE.AUTO_MAX_REGEX_KEYS + 1)
+    }
+    mreplace = CLASS_MULTI_REPLACE(oldnew, engine = "auto")
+
+    assert mreplace.engineused == "automaton"
+    assert mreplace("k12 k7") == "12 7"
+
+
+def test_multireplace_engineused():
+    assert CLASS_MULTI_REPLACE({"a": "b"}).engineused == "sequential"
+
+
+def test_multireplace_unknown_engine():
+    with raises(ValueError):
+        CLASS_MULTI_REPLACE({"a": "b"}, engine = "magic")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import os
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+from mistool.os_use import PPath
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_REPLACE = string_use.MultiReplace
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+MREPLACE = CLASS_MULTI_REPLACE(
+    oldnew = {'one': "1", 'two': "2"},
+    engine = "auto"
+)
+
+TEXTS = ["one {0} two".format(i) for i in range(100)]
+
+TEXTS_WANTED = ["1 {0} 2".format(i) for i in range(100)]
+
+
+# ----------------------------- #
+# -- REPLACING IN MANY TEXTS -- #
+# ----------------------------- #
+
+def test_multireplace_map_ordered():
+    for executor in ["process", "thread"]:
+        found = list(
+            MREPLACE.map(TEXTS, workers = 2, executor = executor)
+        )
+
+        assert found == TEXTS_WANTED
+
+
+def test_multireplace_map_unordered():
+    found = MREPLACE.map(
+        TEXTS,
+        workers  = 2,
+        executor = "thread",
+        ordered  = False
+    )
+
+    assert sorted(found) == sorted(enumerate(TEXTS_WANTED))
+
+
+def test_multireplace_map_inplace(tmp_path):
+    paths = []
+
+    for i, text in enumerate(TEXTS[:10] + ["nothing"]):
+        path = PPath(tmp_path / "{0}.txt".format(i))
+        path.write_text(text)
+        paths.append(path)
+
+    found = list(MREPLACE.map(paths, workers = 2, inplace = True))
+
+    assert found == paths
+    assert [p.read_text() for p in paths] == TEXTS_WANTED[:10] + ["nothing"]
+
+
+def test_multireplace_map_inplace_crlf(tmp_path):
+    path = PPath(tmp_path / "crlf.txt")
+    path.write_bytes(b"one\r\ntwo\nthree\r\n")
+    os.chmod(str(path), 0o640)
+
+    list(MREPLACE.map([path], workers = 1, inplace = True))
+
+    assert path.read_bytes() == b"1\r\n2\nthree\r\n"
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_multireplace_map_paths(tmp_path):
+    path = PPath(tmp_path / "one.txt")
+    path.write_text("one")
+
+    assert list(MREPLACE.map([path], workers = 1)) == ["1"]
+    assert path.read_text() == "one"
+
+
+def test_multireplace_map_bad_executor():
+    with raises(ValueError):
+        list(MREPLACE.map(TEXTS, executor = "gpu"))
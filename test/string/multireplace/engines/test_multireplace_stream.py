@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import io
+import random
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+from mistool.config.pattern import PATTERNS_WORDS
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_REPLACE = string_use.MultiReplace
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def randomchunks(text, rand):
+    chunks = []
+    i      = 0
+
+    while i < len(text):
+        size = rand.randint(0, 5)
+
+        chunks.append(text[i: i + size])
+
+        i += size
+
+    return chunks
+
+
+# ------------------------------ #
+# -- REPLACING PIECE BY PIECE -- #
+# ------------------------------ #
+
+def test_multireplace_iterreplace():
+    rand = random.Random(0)
+
+    for engine in ["automaton", "regex"]:
+        for _ in range(200):
+            oldnew = {
+                "".join(rand.choice("abc") for _ in range(rand.randint(1, 5))):
+                rand.choice(["", "X", "YZ"])
+                for _ in range(rand.randint(1, 5))
+            }
+
+            text = "".join(rand.choice("abcd") for _ in range(rand.randint(0, 60)))
+
+            mreplace = CLASS_MULTI_REPLACE(oldnew, engine = engine)
+
+            found = "".join(mreplace.iterreplace(randomchunks(text, rand)))
+
+            assert found == mreplace(text)
+
+
+def test_multireplace_iterreplace_recursive():
+    rand   = random.Random(1)
+    oldnew = {
+        'W1': "Word #1",
+        'W2': "Word #2",
+        'W3': "W1 and W2"
+    }
+
+    mreplace = CLASS_MULTI_REPLACE(
+        oldnew    = oldnew,
+        recursive = True,
+        pattern   = PATTERNS_WORDS['var']
+    )
+
+    text = "W1 and W2 = W3, W33 or W3" * 20
+
+    for _ in range(50):
+        found = "".join(mreplace.iterreplace(randomchunks(text, rand)))
+
+        assert found == mreplace(text)
+
+
+def test_multireplace_stream():
+    mreplace = CLASS_MULTI_REPLACE({'one': "1", 'two': "2"}, engine = "auto")
+
+    reader = io.StringIO("one, two, three... " * 1000)
+    writer = io.StringIO()
+
+    mreplace.stream(reader, writer, chunk_size = 7)
+
+    assert writer.getvalue() == "1, 2, three... " * 1000
+
+
+def test_multireplace_stream_sequential():
+    mreplace = CLASS_MULTI_REPLACE({'one': "1"})
+
+    with raises(ValueError):
+        list(mreplace.iterreplace(["one"]))
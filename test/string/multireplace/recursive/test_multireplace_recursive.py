@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+from mistool.config.pattern import PATTERNS_WORDS
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_REPLACE = string_use.MultiReplace
+
+PATTERN = PATTERNS_WORDS['var']
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def build(oldnew):
+    return CLASS_MULTI_REPLACE(
+        oldnew    = oldnew,
+        recursive = True,
+        pattern   = PATTERN
+    )
+
+
+def naiveexpand(oldnew, text):
+    while True:
+        newtext = PATTERN.sub(
+            lambda m: oldnew.get(m.group(1), m.group(0)),
+            text
+        )
+
+        if newtext == text:
+            return text
+
+        text = newtext
+
+
+# --------------------- #
+# -- CYCLIC PROBLEMS -- #
+# --------------------- #
+
+def test_multireplace_recursive_selfuse():
+    with raises(ValueError) as error:
+        build({'A': "a", 'B': "A and B"})
+
+    assert str(error.value) == "<< B >> is used in its replacement text."
+
+
+def test_multireplace_recursive_cycle():
+    with raises(ValueError) as error:
+        build({
+            'W0': "start",
+            'W1': "one W2",
+            'W2': "two W3 and W0",
+            'W3': "three W1",
+        })
+
+    assert str(error.value) == (
+        "the following viscious circle has been found.\n\t + "
+        "W1 --> W2 --> W3 --> W1"
+    )
+
+
+def test_multireplace_recursive_long_cycle():
+    size   = 10000
+    oldnew = {
+        'W{0}'.format(i): "x W{0}".format((i + 1) % size)
+        for i in range(size)
+    }
+
+    with raises(ValueError) as error:
+        build(oldnew)
+
+    assert str(error.value).endswith("W{0} --> W0".format(size - 1))
+
+
+# ------------------------------- #
+# -- EXPANSION OF THE ``asit`` -- #
+# ------------------------------- #
+
+def test_multireplace_recursive_expansion():
+    oldnew = {
+        'W5': "W3 W4",
+        'W1': "one",
+        'W2': "W1, two",
+        'W3': "W2 W1",
+        'W4': "",
+    }
+
+    mreplace = build(oldnew)
+
+    assert list(mreplace.asit) == list(oldnew)
+
+    for old, new in oldnew.items():
+        assert mreplace.asit[old] == naiveexpand(oldnew, new)
+
+    assert mreplace("W5 !") == "one, two one  !"
+
+
+def test_multireplace_recursive_long_chain():
+    size   = 10000
+    oldnew = {
+        'W{0}'.format(i): "W{0}".format(i + 1)
+        for i in range(size)
+    }
+    oldnew['W{0}'.format(size)] = "end"
+
+    mreplace = build(oldnew)
+
+    assert set(mreplace.asit.values()) == {"end"}
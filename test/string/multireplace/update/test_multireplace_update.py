@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import random
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+from mistool.config.pattern import PATTERNS_WORDS
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_REPLACE = string_use.MultiReplace
+
+PATTERN = PATTERNS_WORDS['var']
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+def randomchanges(mreplace, rand, oldtexts, randomnew, nbchanges = 5):
+    for _ in range(nbchanges):
+        if rand.random() < 0.3:
+            mreplace.discard(rand.choice(oldtexts))
+
+        else:
+            try:
+                mreplace.update({rand.choice(oldtexts): randomnew()})
+
+            except ValueError:
+                pass
+
+        yield mreplace
+
+
+# ------------------------------ #
+# -- UNRECURSIVE REPLACEMENTS -- #
+# ------------------------------ #
+
+def test_multireplace_update_engines():
+    rand     = random.Random(0)
+    oldtexts = ["a", "b", "ab", "ba", "abc", "cc"]
+
+    def randomnew():
+        return "".join(rand.choice("xyab") for _ in range(rand.randint(0, 3)))
+
+    for engine in ["sequential", "automaton", "regex", "auto"]:
+        for _ in range(50):
+            mreplace = CLASS_MULTI_REPLACE(
+                oldnew = {old: randomnew() for old in oldtexts[:3]},
+                engine = engine
+            )
+
+            for mreplace in randomchanges(
+                mreplace, rand, oldtexts, randomnew
+            ):
+                fresh = CLASS_MULTI_REPLACE(
+                    oldnew = dict(mreplace.oldnew),
+                    engine = engine
+                )
+
+                text = "".join(rand.choice("abcd") for _ in range(30))
+
+                assert mreplace(text) == fresh(text)
+
+
+# ---------------------------- #
+# -- RECURSIVE REPLACEMENTS -- #
+# ---------------------------- #
+
+def test_multireplace_update_recursive():
+    rand     = random.Random(0)
+    oldtexts = ["W{0}".format(i) for i in range(8)]
+
+    def randomnew():
+        return " ".join(
+            rand.choice(oldtexts + ["text"])
+            for _ in range(rand.randint(0, 3))
+        )
+
+    for _ in range(100):
+        mreplace = CLASS_MULTI_REPLACE(
+            recursive = True,
+            pattern   = PATTERN
+        )
+
+        for mreplace in randomchanges(mreplace, rand, oldtexts, randomnew):
+            fresh = CLASS_MULTI_REPLACE(
+                oldnew    = dict(mreplace.oldnew),
+                recursive = True,
+                pattern   = PATTERN
+            )
+
+            assert mreplace.asit == fresh.asit
+            assert list(mreplace.asit) == list(mreplace.oldnew)
+
+
+def test_multireplace_update_cycle():
+    oldnew = {'W1': "one", 'W2': "W1 and two", 'W3': "W2 !"}
+
+    mreplace = CLASS_MULTI_REPLACE(
+        oldnew    = dict(oldnew),
+        recursive = True,
+        pattern   = PATTERN
+    )
+
+    asit = dict(mreplace.asit)
+
+    with raises(ValueError):
+        mreplace.update({'W1': "W3", 'W4': "four"})
+
+    assert mreplace.oldnew == oldnew
+    assert mreplace.asit == asit
+
+    mreplace.update({'W4': "four", 'W1': "W4"})
+
+    assert mreplace("W3") == "four and two !"
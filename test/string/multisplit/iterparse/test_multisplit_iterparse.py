@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import io
+import random
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_SPLIT = string_use.MultiSplit
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+SEPS = ["|", ";", ",", "::", " "]
+
+
+def randomcases(nbcases = 2000, seed = 0):
+    rand = random.Random(seed)
+
+    for _ in range(nbcases):
+        msplit = CLASS_MULTI_SPLIT(
+            seps     = rand.sample(SEPS, rand.randint(1, 3)),
+            esc_char = rand.choice(["", "\\"]),
+            strip    = rand.random() < 0.5
+        )
+
+        text = "".join(
+            rand.choice("ab |;,:\\ ")
+            for _ in range(rand.randint(0, 30))
+        )
+
+        cuts = sorted(
+            rand.randint(0, len(text))
+            for _ in range(rand.randint(0, 5))
+        )
+
+        chunks = [
+            text[i: j]
+            for i, j in zip([0] + cuts, cuts + [len(text)])
+        ]
+
+        yield msplit, text, chunks
+
+
+# -------------------------------------- #
+# -- SAME EVENTS AS THE ITERATOR ONES -- #
+# -------------------------------------- #
+
+def test_multisplit_iterparse_same_as_iter():
+    for msplit, text, _ in randomcases():
+        msplit(text)
+
+        events_wanted = [(infos.type, infos.val) for infos in msplit.iter()]
+        events_found  = [
+            (kind, value)
+            for _, kind, value in msplit.iterparse(text)
+        ]
+
+        assert events_wanted == events_found
+
+
+def test_multisplit_iterparse_levels():
+    msplit = CLASS_MULTI_SPLIT(
+        seps  = ["|", ";"],
+        strip = True
+    )
+
+    assert list(msplit.iterparse("p_1 ; p_2 | r_1")) == [
+        (0, "sep", "|"),
+        (1, "sep", ";"),
+        (1, "val", "p_1"),
+        (1, "val", "p_2"),
+        (0, "sep", "|"),
+        (1, "sep", ";"),
+        (1, "val", "r_1"),
+    ]
+
+
+# ------------------------ #
+# -- CHUNKS AND STREAMS -- #
+# ------------------------ #
+
+def test_multisplit_iterparse_chunks():
+    for msplit, text, chunks in randomcases():
+        events_wanted = list(msplit.iterparse(text))
+
+        assert list(msplit.iterparse(chunks)) == events_wanted
+        assert list(
+            msplit.iterparse(io.StringIO(text), chunk_size = 2)
+        ) == events_wanted
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+import mmap
+import random
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+from mistool.os_use import PPath
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_SPLIT = string_use.MultiSplit
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+SEPS = ["|", ";", ",", "::", " "]
+
+
+def randomcases(nbcases = 2000, seed = 0):
+    rand = random.Random(seed)
+
+    for _ in range(nbcases):
+        msplit = CLASS_MULTI_SPLIT(
+            seps     = rand.sample(SEPS, rand.randint(1, 3)),
+            esc_char = rand.choice(["", "\\"]),
+            strip    = rand.random() < 0.5
+        )
+
+        text = "".join(
+            rand.choice("ab |;,:\\ é")
+            for _ in range(rand.randint(0, 30))
+        )
+
+        yield msplit, text
+
+
+def encoded(listview):
+    if isinstance(listview, list):
+        return [encoded(x) for x in listview]
+
+    return listview.encode("utf-8")
+
+
+# ----------------------------- #
+# -- SAME PIECES AS LISTVIEW -- #
+# ----------------------------- #
+
+def test_multisplit_offsets_same_as_listview():
+    for msplit, text in randomcases():
+        listview_wanted = msplit(text)
+
+        assert msplit.offsets(text).tolist() == listview_wanted
+        assert msplit.offsets(text.encode("utf-8")).tolist() \
+            == encoded(listview_wanted)
+
+
+def test_multisplit_offsets_spans():
+    msplit = CLASS_MULTI_SPLIT(
+        seps  = ["|", ";"],
+        strip = True
+    )
+
+    text = "p_1 ; p_2 | r_1"
+    view = msplit.offsets(text)
+
+    assert len(view) == 2
+    assert [len(x) for x in view] == [2, 1]
+    assert view[0].span(1) == (6, 9)
+    assert view[-1][-1] == "r_1"
+
+    with raises(IndexError):
+        view[2]
+
+
+# ------------------------- #
+# -- MEMORY-MAPPED FILES -- #
+# ------------------------- #
+
+def test_multisplit_offsets_mmap(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_bytes(b"a ; b | c ; d")
+
+    msplit = CLASS_MULTI_SPLIT(
+        seps  = ["|", ";"],
+        strip = True
+    )
+
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access = mmap.ACCESS_READ) as mm:
+            view  = msplit.offsets(mm)
+            found = [[bytes(x) for x in pieces] for pieces in view]
+
+    assert found == [[b"a", b"b"], [b"c", b"d"]]
+
+
+def test_multisplit_offsets_memoryview(tmp_path):
+    path = PPath(tmp_path / "data.txt")
+    path.write_bytes(b"a ; b | c ; d")
+
+    msplit = CLASS_MULTI_SPLIT(
+        seps  = ["|", ";"],
+        strip = True
+    )
+
+    view   = path.mmap()
+    pieces = msplit.offsets(view)
+    found  = [[bytes(x) for x in p] for p in pieces]
+
+    assert pieces.text is view.obj
+    assert found == [[b"a", b"b"], [b"c", b"d"]]
+
+# A part of a view is copied.
+    pieces = msplit.offsets(view[4:])
+    found  = [[bytes(x) for x in p] for p in pieces]
+
+    assert found == [[b"b"], [b"c", b"d"]]
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# --------------------- #
+# -- SEVERAL IMPORTS -- #
+# --------------------- #
+
+from pytest import raises
+
+
+# ------------------- #
+# -- MODULE TESTED -- #
+# ------------------- #
+
+from mistool import string_use
+
+
+# ----------------------- #
+# -- GENERAL CONSTANTS -- #
+# ----------------------- #
+
+CLASS_MULTI_SPLIT = string_use.MultiSplit
+
+
+# ----------------------- #
+# -- DATAS FOR TESTING -- #
+# ----------------------- #
+
+THE_DATAS_FOR_TESTING = [
+# Consecutive separators give empty pieces.
+    (["|"], "", False, "a||b", ["a", "", "b"]),
+    (["::"], "", False, "a::::b", ["a", "", "b"]),
+# An empty last piece is ignored, but not a piece with spaces.
+    (["|"], "", False, "a|b|", ["a", "b"]),
+    (["|"], "", True, "a|b| ", ["a", "b", ""]),
+    (["|"], "", False, "", []),
+# Escaped separators.
+    (["|"], "\\", False, "a\\|b|c", ["a\\|b", "c"]),
+    (["|"], "\\", False, "a\\||b", ["a\\|", "b"]),
+    (["|"], "\\", False, "|\\|", ["", "\\|"]),
+# The pieces are stripped before being splitted again.
+    (["|", " "], "", True, " a b | c ", [["a", "b"], ["c"]]),
+    (["|", " "], "", False, " a b | c ", [["", "a", "b"], ["", "c"]]),
+    (
+        ["|", ";"], "\\", True,
+        "a ; b \\; c | d ;",
+        [["a", "b \\; c"], ["d"]]
+    ),
+]
+
+
+# ----------------------------- #
+# -- SPLITTING IN THE PIECES -- #
+# ----------------------------- #
+
+def test_multisplit_pieces():
+    for seps, esc_char, strip, text, listview_wanted in THE_DATAS_FOR_TESTING:
+        msplit = CLASS_MULTI_SPLIT(
+            seps     = seps,
+            esc_char = esc_char,
+            strip    = strip
+        )
+
+        assert msplit(text) == listview_wanted
+
+
+def test_multisplit_pieces_long_text():
+    line   = "p_1 , p_2 ; p_3 |"
+    nbline = 100000
+
+    msplit = CLASS_MULTI_SPLIT(
+        seps  = ["|", ";", ","],
+        strip = True
+    )
+
+    assert msplit(line*nbline) == [[["p_1", "p_2"], ["p_3"]]]*nbline
+
+
+def test_multisplit_pieces_empty_sep():
+    with raises(ValueError):
+        CLASS_MULTI_SPLIT(seps = ["|", ""])